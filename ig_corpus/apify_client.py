@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain, islice
+from threading import Lock
 from typing import Any, Iterator, Sequence
 
 from apify_client import ApifyClient
@@ -22,7 +26,34 @@ _DEFAULT_APIFY_RETRY = RetryConfig(
 )
 
 
-@dataclass(frozen=True)
+_DATASET_PAGE_SIZE = 1000
+_DATASET_PAGE_WORKERS = 8
+_DATASET_CACHE_SIZE = 128
+
+_SHARED_CLIENTS: dict[str, ApifyClient] = {}
+_SHARED_CLIENTS_LOCK = Lock()
+
+
+def _shared_apify_client(token: str) -> ApifyClient:
+    """
+    Return a process-wide ApifyClient for the token.
+
+    Each ApifyClient owns a keep-alive HTTP connection pool; sharing it lets every
+    scraper built from the same token reuse warm connections instead of opening its own.
+    """
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(token)
+        if client is None:
+            # Disable client-level retries so we can apply our own policy uniformly.
+            try:
+                client = ApifyClient(token=token, max_retries=0)
+            except TypeError:
+                client = ApifyClient(token=token)
+            _SHARED_CLIENTS[token] = client
+        return client
+
+
+@dataclass(frozen=True, slots=True)
 class ActorRunRef:
     actor_id: str
     run_id: str
@@ -30,60 +61,147 @@ class ActorRunRef:
 
 
 def _normalize_terms(terms: Sequence[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-
+    # Keyed by casefold; setdefault keeps the first spelling seen, in input order.
+    out: dict[str, str] = {}
     for raw in terms:
         term = (raw or "").strip()
         if term.startswith("#"):
             term = term[1:].strip()
-        if not term:
-            continue
-        key = term.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(term)
-
-    return out
+        if term:
+            out.setdefault(term.casefold(), term)
+    return list(out.values())
 
 
 def _normalize_urls(urls: Sequence[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-
+    out: dict[str, str] = {}
     for raw in urls:
         url = (raw or "").strip()
-        if not url:
-            continue
-        key = url.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(url)
-
-    return out
+        if url:
+            out.setdefault(url.casefold(), url)
+    return list(out.values())
 
 
 def _chunked(values: Sequence[str], size: int) -> Iterator[list[str]]:
     if size <= 0:
         raise ValueError("chunk size must be positive")
 
-    batch: list[str] = []
-    for item in values:
-        batch.append(item)
-        if len(batch) >= size:
-            yield batch
-            batch = []
-    if batch:
+    it = iter(values)
+    while batch := list(islice(it, size)):
         yield batch
 
 
-class InstagramHashtagScraper:
+def _page_size(offset: int, limit: int | None) -> int:
+    return _DATASET_PAGE_SIZE if limit is None else min(_DATASET_PAGE_SIZE, limit - offset)
+
+
+class _DatasetReader:
     """
-    Thin wrapper around Apify's maintained Instagram Hashtag Scraper Actor.
+    Paged reads of one dataset, with each page request retried independently.
 
-    This module is deliberately low-level: it only runs the Actor and retrieves dataset items.
+    Reads stop at the first short page, as the client's own iteration does. The dataset's
+    itemCount can lag right after a run finishes, so it only sizes concurrent reads and is
+    never trusted as the end of the data.
+    """
+
+    def __init__(
+        self,
+        client: ApifyClient,
+        dataset_id: str,
+        *,
+        clean: bool,
+        retry: RetryConfig,
+        on_retry: OnRetryFn | None,
+        sleep_fn: SleepFn | None,
+    ) -> None:
+        self._dataset = client.dataset(dataset_id)
+        self._dataset_id = dataset_id
+        self._clean = clean
+        self._retry = retry
+        self._on_retry = on_retry
+        self._sleep_fn = sleep_fn
+
+    def _call(self, fn: Any, operation: str) -> Any:
+        return call_with_retries(
+            fn,
+            cfg=self._retry,
+            is_retryable=is_retryable_apify_exception,
+            operation=operation,
+            on_retry=self._on_retry,
+            sleep_fn=self._sleep_fn,
+        )
+
+    def item_count(self) -> int:
+        info = self._call(self._dataset.get, f"apify.dataset.get:{self._dataset_id}")
+        try:
+            return int((info or {}).get("itemCount") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def page(self, offset: int, size: int) -> list[dict[str, Any]]:
+        result = self._call(
+            lambda: self._dataset.list_items(offset=offset, limit=size, clean=self._clean),
+            f"apify.dataset.list_items:{self._dataset_id}:{offset}",
+        )
+        return list(result.items or [])
+
+    def iter_pages(self, *, start: int = 0, limit: int | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Yield pages sequentially from `start` until a short page or `limit` is reached."""
+        offset = start
+        while limit is None or offset < limit:
+            size = _page_size(offset, limit)
+            items = self.page(offset, size)
+            if not items:
+                return
+            yield items
+            if len(items) < size:
+                return
+            offset += size
+
+    def fetch_all(self, *, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Read the first page; only when it comes back full, fetch the further pages known
+        from itemCount concurrently and then read any remainder.
+
+        A dataset that fits in one page costs a single request.
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        items = self.page(0, _page_size(0, limit))
+        if len(items) < _page_size(0, limit):
+            return items
+
+        known = self.item_count()
+        if limit is not None:
+            known = min(known, limit)
+
+        offsets = list(range(len(items), known, _DATASET_PAGE_SIZE))
+        sizes = [_page_size(o, limit) for o in offsets]
+
+        workers = min(_DATASET_PAGE_WORKERS, len(offsets))
+        if workers <= 1:
+            pages = [self.page(o, n) for o, n in zip(offsets, sizes)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apify-dataset") as pool:
+                pages = list(pool.map(self.page, offsets, sizes))
+
+        for page, size in zip(pages, sizes):
+            items.extend(page)
+            if len(page) < size:
+                return items
+
+        for page in self.iter_pages(start=len(items), limit=limit):
+            items.extend(page)
+        return items
+
+
+class _ActorWrapper:
+    """
+    Shared plumbing for the Actor wrappers: client setup, retried Actor calls, and dataset reads.
+
+    With cache_datasets=True, dataset items from full fetches and fully consumed streams are
+    kept in a small in-process LRU cache keyed by (dataset_id, limit, clean). Datasets of finished runs do not change, so re-reads
+    within a session skip the download.
     """
 
     def __init__(
@@ -94,67 +212,128 @@ class InstagramHashtagScraper:
         retry: RetryConfig | None = None,
         on_retry: OnRetryFn | None = None,
         sleep_fn: SleepFn | None = None,
+        cache_datasets: bool = False,
     ) -> None:
         self._retry = retry or _DEFAULT_APIFY_RETRY
         self._on_retry = on_retry
         self._sleep_fn = sleep_fn
 
-        if client is not None:
-            self._client = client
-        else:
-            # Disable client-level retries so we can apply our own policy uniformly.
-            try:
-                self._client = ApifyClient(token=token, max_retries=0)
-            except TypeError:
-                self._client = ApifyClient(token=token)
+        self._client = client if client is not None else _shared_apify_client(token)
 
-    def run_once(
-        self,
-        terms: Sequence[str],
-        *,
-        apify: ApifyConfig,
-        timeout_secs: int | None = None,
-    ) -> ActorRunRef:
-        """
-        Run the primary hashtag/keyword Actor once for a single batch of terms.
+        self._cache_datasets = bool(cache_datasets)
+        self._dataset_cache: OrderedDict[tuple[str, int | None, bool], list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._dataset_cache_lock = Lock()
 
-        Returns the run id and default dataset id so callers can persist run metadata.
+        self._active_runs: set[str] = set()
+        self._active_runs_lock = Lock()
+
+    def abort_active_runs(self) -> list[str]:
         """
-        normalized = _normalize_terms(terms)
-        if not normalized:
-            raise ApifyError("At least one non-empty query term is required")
+        Abort the Actor runs this wrapper is still waiting on, from any thread.
 
-        run_input: dict[str, Any] = {
-            "hashtags": normalized,
-            "resultsType": apify.results_type,
-            "resultsLimit": apify.results_limit_per_query,
-            "keywordSearch": apify.keyword_search,
-        }
+        The blocked call then raises ApifyError. Returns the run ids an abort was sent for.
+        """
+        with self._active_runs_lock:
+            run_ids = sorted(self._active_runs)
 
-        def _do_call() -> Any:
-            return self._client.actor(apify.primary_actor).call(
-                run_input=run_input,
-                timeout_secs=timeout_secs,
-            )
+        aborted: list[str] = []
+        for run_id in run_ids:
+            try:
+                self._client.run(run_id).abort()
+            except Exception:
+                continue
+            aborted.append(run_id)
+        return aborted
+
+    def invalidate(self, dataset_id: str) -> None:
+        """Drop any cached items for a dataset."""
+        ds = (dataset_id or "").strip()
+        with self._dataset_cache_lock:
+            for key in [k for k in self._dataset_cache if k[0] == ds]:
+                del self._dataset_cache[key]
+
+    def _cache_get(self, key: tuple[str, int | None, bool]) -> list[dict[str, Any]] | None:
+        if not self._cache_datasets:
+            return None
+        with self._dataset_cache_lock:
+            cached = self._dataset_cache.get(key)
+            if cached is None:
+                return None
+            self._dataset_cache.move_to_end(key)
+            return list(cached)
+
+    def _cache_put(self, key: tuple[str, int | None, bool], items: list[dict[str, Any]]) -> None:
+        with self._dataset_cache_lock:
+            self._dataset_cache[key] = items
+            self._dataset_cache.move_to_end(key)
+            while len(self._dataset_cache) > _DATASET_CACHE_SIZE:
+                self._dataset_cache.popitem(last=False)
+
+    def _dataset_reader(self, dataset_id: str, *, clean: bool) -> _DatasetReader:
+        return _DatasetReader(
+            self._client,
+            dataset_id,
+            clean=bool(clean),
+            retry=self._retry,
+            on_retry=self._on_retry,
+            sleep_fn=self._sleep_fn,
+        )
 
-        try:
-            result = call_with_retries(
-                _do_call,
+    def _call_actor(
+        self,
+        actor_id: str,
+        run_input: dict[str, Any],
+        *,
+        timeout_secs: int | None,
+        operation: str,
+    ) -> ActorRunRef:
+        def _retried(fn: Any, op: str) -> Any:
+            return call_with_retries(
+                fn,
                 cfg=self._retry,
                 is_retryable=is_retryable_apify_exception,
-                operation=f"apify.actor.call:{apify.primary_actor}",
+                operation=op,
                 on_retry=self._on_retry,
                 sleep_fn=self._sleep_fn,
             )
+
+        # Start and wait separately: a retried wait never starts a second run, and the run id
+        # is known while waiting so abort_active_runs() can stop it.
+        try:
+            started = _retried(
+                lambda: self._client.actor(actor_id).start(
+                    run_input=run_input,
+                    timeout_secs=timeout_secs,
+                ),
+                operation,
+            )
+            started_id = ((started or {}).get("id") or "").strip()
+            if not started_id:
+                raise ApifyError(f"Apify Actor run failed to start ({actor_id})")
+
+            with self._active_runs_lock:
+                self._active_runs.add(started_id)
+            try:
+                result = _retried(
+                    lambda: self._client.run(started_id).wait_for_finish(),
+                    f"{operation}:wait",
+                )
+            finally:
+                with self._active_runs_lock:
+                    self._active_runs.discard(started_id)
+        except ApifyError:
+            raise
         except ApifyApiError as e:
-            raise ApifyError(f"Apify Actor call failed ({apify.primary_actor}): {e}") from e
+            raise ApifyError(f"Apify Actor call failed ({actor_id}): {e}") from e
         except Exception as e:
-            raise ApifyError(
-                f"Unexpected error while calling Apify Actor ({apify.primary_actor}): {e}"
-            ) from e
+            raise ApifyError(f"Unexpected error while calling Apify Actor ({actor_id}): {e}") from e
 
         if result is None:
-            raise ApifyError(f"Apify Actor run failed ({apify.primary_actor})")
+            raise ApifyError(f"Apify Actor run failed ({actor_id})")
+        if result.get("status") in ("ABORTING", "ABORTED"):
+            raise ApifyError(f"Apify Actor run was aborted ({actor_id}): {started_id}")
 
         run_id = (result.get("id") or "").strip()
         dataset_id = (result.get("defaultDatasetId") or "").strip()
@@ -164,7 +343,7 @@ class InstagramHashtagScraper:
             )
 
         return ActorRunRef(
-            actor_id=apify.primary_actor,
+            actor_id=actor_id,
             run_id=run_id,
             default_dataset_id=dataset_id,
         )
@@ -179,9 +358,36 @@ class InstagramHashtagScraper:
         """
         Iterate items from a dataset produced by an Actor run.
 
-        For retryability, this fetches the full list and then yields items.
+        Items are streamed one page at a time, so only a single page is held in memory;
+        a failed page is retried without re-reading earlier pages. With cache_datasets=True
+        the items are also collected and cached once the stream is fully consumed, and a
+        cached dataset is served without a download.
         """
-        yield from self.fetch_dataset_items(dataset_id, limit=limit, clean=clean)
+        ds = (dataset_id or "").strip()
+        if not ds:
+            raise ApifyError("dataset_id must be a non-empty string")
+
+        cache_key = (ds, limit, bool(clean))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield from cached
+            return
+
+        # With caching on, the streamed items are also collected so a full read can be
+        # cached; a partially consumed stream is not cached.
+        collected: list[dict[str, Any]] | None = [] if self._cache_datasets else None
+        try:
+            for page in self._dataset_reader(ds, clean=clean).iter_pages(limit=limit):
+                if collected is not None:
+                    collected.extend(page)
+                yield from page
+        except ApifyApiError as e:
+            raise ApifyError(f"Failed to read dataset items ({ds}): {e}") from e
+        except Exception as e:
+            raise ApifyError(f"Unexpected error while reading dataset ({ds}): {e}") from e
+
+        if collected is not None:
+            self._cache_put(cache_key, collected)
 
     def fetch_dataset_items(
         self,
@@ -194,23 +400,62 @@ class InstagramHashtagScraper:
         if not ds:
             raise ApifyError("dataset_id must be a non-empty string")
 
-        def _do_fetch() -> list[dict[str, Any]]:
-            return list(self._client.dataset(ds).iterate_items(limit=limit, clean=clean))
+        cache_key = (ds, limit, bool(clean))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            return call_with_retries(
-                _do_fetch,
-                cfg=self._retry,
-                is_retryable=is_retryable_apify_exception,
-                operation=f"apify.dataset.iterate_items:{ds}",
-                on_retry=self._on_retry,
-                sleep_fn=self._sleep_fn,
-            )
+            items = self._dataset_reader(ds, clean=clean).fetch_all(limit=limit)
         except ApifyApiError as e:
             raise ApifyError(f"Failed to read dataset items ({ds}): {e}") from e
         except Exception as e:
             raise ApifyError(f"Unexpected error while reading dataset ({ds}): {e}") from e
 
+        if self._cache_datasets:
+            self._cache_put(cache_key, items)
+            return list(items)
+
+        return items
+
+
+class InstagramHashtagScraper(_ActorWrapper):
+    """
+    Thin wrapper around Apify's maintained Instagram Hashtag Scraper Actor.
+
+    This module is deliberately low-level: it only runs the Actor and retrieves dataset items.
+    """
+
+    def run_once(
+        self,
+        terms: Sequence[str],
+        *,
+        apify: ApifyConfig,
+        timeout_secs: int | None = None,
+    ) -> ActorRunRef:
+        """
+        Run the primary hashtag/keyword Actor once for a single batch of terms.
+
+        Returns the run id and default dataset id so callers can persist run metadata.
+        """
+        normalized = _normalize_terms(terms)
+        if not normalized:
+            raise ApifyError("At least one non-empty query term is required")
+
+        run_input: dict[str, Any] = {
+            "hashtags": normalized,
+            "resultsType": apify.results_type,
+            "resultsLimit": apify.results_limit_per_query,
+            "keywordSearch": apify.keyword_search,
+        }
+
+        return self._call_actor(
+            apify.primary_actor,
+            run_input,
+            timeout_secs=timeout_secs,
+            operation=f"apify.actor.call:{apify.primary_actor}",
+        )
+
     def run_and_fetch(
         self,
         terms: Sequence[str],
@@ -240,27 +485,34 @@ class InstagramHashtagScraper:
         """
         Run the primary actor in chunks and return merged items.
 
-        Chunk size is controlled by apify.run_batch_queries.
+        Chunk size is controlled by apify.run_batch_queries. Up to apify.max_concurrent_runs
+        chunks are in flight at once; runs and items are returned in chunk order.
         """
         normalized = _normalize_terms(terms)
-        runs: list[ActorRunRef] = []
-        items: list[dict[str, Any]] = []
+        batches = list(_chunked(normalized, apify.run_batch_queries))
 
-        for batch in _chunked(normalized, apify.run_batch_queries):
-            run, batch_items = self.run_and_fetch(
+        def _run_batch(batch: list[str]) -> tuple[ActorRunRef, list[dict[str, Any]]]:
+            return self.run_and_fetch(
                 batch,
                 apify=apify,
                 timeout_secs=timeout_secs,
                 dataset_limit=dataset_limit_per_run,
                 clean=clean,
             )
-            runs.append(run)
-            items.extend(batch_items)
 
+        workers = min(int(apify.max_concurrent_runs), len(batches))
+        if workers <= 1:
+            results = [_run_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apify") as pool:
+                results = list(pool.map(_run_batch, batches))
+
+        runs = [run for run, _ in results]
+        items = list(chain.from_iterable(batch_items for _, batch_items in results))
         return runs, items
 
 
-class InstagramScraper:
+class InstagramScraper(_ActorWrapper):
     """
     Thin wrapper around Apify's maintained Instagram Scraper Actor.
 
@@ -269,28 +521,6 @@ class InstagramScraper:
     - scraping posts from known Instagram URLs (`directUrls`)
     """
 
-    def __init__(
-        self,
-        token: str,
-        *,
-        client: ApifyClient | None = None,
-        retry: RetryConfig | None = None,
-        on_retry: OnRetryFn | None = None,
-        sleep_fn: SleepFn | None = None,
-    ) -> None:
-        self._retry = retry or _DEFAULT_APIFY_RETRY
-        self._on_retry = on_retry
-        self._sleep_fn = sleep_fn
-
-        if client is not None:
-            self._client = client
-        else:
-            # Disable client-level retries so we can apply our own policy uniformly.
-            try:
-                self._client = ApifyClient(token=token, max_retries=0)
-            except TypeError:
-                self._client = ApifyClient(token=token)
-
     def run_search_hashtags(
         self,
         query: str,
@@ -311,42 +541,11 @@ class InstagramScraper:
             "searchLimit": int(search_limit),
         }
 
-        def _do_call() -> Any:
-            return self._client.actor(apify.fallback_actor).call(
-                run_input=run_input,
-                timeout_secs=timeout_secs,
-            )
-
-        try:
-            result = call_with_retries(
-                _do_call,
-                cfg=self._retry,
-                is_retryable=is_retryable_apify_exception,
-                operation=f"apify.actor.call:{apify.fallback_actor}:search",
-                on_retry=self._on_retry,
-                sleep_fn=self._sleep_fn,
-            )
-        except ApifyApiError as e:
-            raise ApifyError(f"Apify Actor call failed ({apify.fallback_actor}): {e}") from e
-        except Exception as e:
-            raise ApifyError(
-                f"Unexpected error while calling Apify Actor ({apify.fallback_actor}): {e}"
-            ) from e
-
-        if result is None:
-            raise ApifyError(f"Apify Actor run failed ({apify.fallback_actor})")
-
-        run_id = (result.get("id") or "").strip()
-        dataset_id = (result.get("defaultDatasetId") or "").strip()
-        if not run_id or not dataset_id:
-            raise ApifyError(
-                f"Apify Actor run response missing run id or default dataset id: {result}"
-            )
-
-        return ActorRunRef(
-            actor_id=apify.fallback_actor,
-            run_id=run_id,
-            default_dataset_id=dataset_id,
+        return self._call_actor(
+            apify.fallback_actor,
+            run_input,
+            timeout_secs=timeout_secs,
+            operation=f"apify.actor.call:{apify.fallback_actor}:search",
         )
 
     def run_scrape_urls(
@@ -367,81 +566,13 @@ class InstagramScraper:
             "resultsLimit": int(results_limit),
         }
 
-        def _do_call() -> Any:
-            return self._client.actor(apify.fallback_actor).call(
-                run_input=run_input,
-                timeout_secs=timeout_secs,
-            )
-
-        try:
-            result = call_with_retries(
-                _do_call,
-                cfg=self._retry,
-                is_retryable=is_retryable_apify_exception,
-                operation=f"apify.actor.call:{apify.fallback_actor}:directUrls",
-                on_retry=self._on_retry,
-                sleep_fn=self._sleep_fn,
-            )
-        except ApifyApiError as e:
-            raise ApifyError(f"Apify Actor call failed ({apify.fallback_actor}): {e}") from e
-        except Exception as e:
-            raise ApifyError(
-                f"Unexpected error while calling Apify Actor ({apify.fallback_actor}): {e}"
-            ) from e
-
-        if result is None:
-            raise ApifyError(f"Apify Actor run failed ({apify.fallback_actor})")
-
-        run_id = (result.get("id") or "").strip()
-        dataset_id = (result.get("defaultDatasetId") or "").strip()
-        if not run_id or not dataset_id:
-            raise ApifyError(
-                f"Apify Actor run response missing run id or default dataset id: {result}"
-            )
-
-        return ActorRunRef(
-            actor_id=apify.fallback_actor,
-            run_id=run_id,
-            default_dataset_id=dataset_id,
+        return self._call_actor(
+            apify.fallback_actor,
+            run_input,
+            timeout_secs=timeout_secs,
+            operation=f"apify.actor.call:{apify.fallback_actor}:directUrls",
         )
 
-    def iter_dataset_items(
-        self,
-        dataset_id: str,
-        *,
-        limit: int | None = None,
-        clean: bool = True,
-    ) -> Iterator[dict[str, Any]]:
-        yield from self.fetch_dataset_items(dataset_id, limit=limit, clean=clean)
-
-    def fetch_dataset_items(
-        self,
-        dataset_id: str,
-        *,
-        limit: int | None = None,
-        clean: bool = True,
-    ) -> list[dict[str, Any]]:
-        ds = (dataset_id or "").strip()
-        if not ds:
-            raise ApifyError("dataset_id must be a non-empty string")
-
-        def _do_fetch() -> list[dict[str, Any]]:
-            return list(self._client.dataset(ds).iterate_items(limit=limit, clean=clean))
-
-        try:
-            return call_with_retries(
-                _do_fetch,
-                cfg=self._retry,
-                is_retryable=is_retryable_apify_exception,
-                operation=f"apify.dataset.iterate_items:{ds}",
-                on_retry=self._on_retry,
-                sleep_fn=self._sleep_fn,
-            )
-        except ApifyApiError as e:
-            raise ApifyError(f"Failed to read dataset items ({ds}): {e}") from e
-        except Exception as e:
-            raise ApifyError(f"Unexpected error while reading dataset ({ds}): {e}") from e
-
     def search_hashtags_and_fetch(
         self,
         query: str,
@@ -479,3 +610,28 @@ class InstagramScraper:
         )
         items = self.fetch_dataset_items(run.default_dataset_id, limit=dataset_limit, clean=clean)
         return run, items
+
+
+def build_scrapers(
+    token: str,
+    *,
+    apify: ApifyConfig,
+    client: ApifyClient | None = None,
+    retry: RetryConfig | None = None,
+    on_retry: OnRetryFn | None = None,
+    sleep_fn: SleepFn | None = None,
+) -> tuple[InstagramHashtagScraper, InstagramScraper]:
+    """
+    Build the primary and fallback scrapers on top of one ApifyClient.
+
+    Both wrappers then share a single HTTP connection pool for Actor calls and dataset reads.
+    """
+    shared = client if client is not None else _shared_apify_client(token)
+    kwargs: dict[str, Any] = {
+        "client": shared,
+        "retry": retry,
+        "on_retry": on_retry,
+        "sleep_fn": sleep_fn,
+        "cache_datasets": bool(apify.cache_datasets),
+    }
+    return InstagramHashtagScraper(token, **kwargs), InstagramScraper(token, **kwargs)
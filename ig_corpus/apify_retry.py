@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from importlib import import_module
+
+try:
+    from apify_client.errors import ApifyApiError  # type: ignore
+except Exception:
+    ApifyApiError = None  # type: ignore[assignment,misc]
+
 
 def _extract_status_code(exc: BaseException) -> int | None:
-    for attr in ("status_code", "statusCode", "status", "http_status", "httpStatusCode"):
+    # ApifyApiError exposes status_code; the other spellings cover foreign exception types.
+    val = getattr(exc, "status_code", None)
+    if val is not None:
+        try:
+            return int(val)
+        except Exception:
+            pass
+
+    for attr in ("statusCode", "status", "http_status", "httpStatusCode"):
         val = getattr(exc, attr, None)
         if val is None:
             continue
@@ -13,10 +29,29 @@ def _extract_status_code(exc: BaseException) -> int | None:
     return None
 
 
-def _looks_like_timeout_or_connection(exc: BaseException) -> bool:
+def _load_network_error_types() -> tuple[type[BaseException], ...]:
+    # Transport exceptions from the HTTP stacks the Apify client may run on, when installed.
+    out: list[type[BaseException]] = []
+    for module_name in ("impit", "httpx"):
+        try:
+            module = import_module(module_name)
+        except Exception:
+            continue
+        for attr in ("TimeoutException", "NetworkError", "RemoteProtocolError"):
+            exc_type = getattr(module, attr, None)
+            if isinstance(exc_type, type) and issubclass(exc_type, BaseException):
+                out.append(exc_type)
+    return tuple(out)
+
+
+_NETWORK_ERROR_TYPES = _load_network_error_types()
+
+
+@lru_cache(maxsize=256)
+def _type_looks_like_timeout_or_connection(exc_type: type[BaseException]) -> bool:
     # Avoid importing optional HTTP stacks; use conservative heuristics.
-    name = type(exc).__name__.casefold()
-    mod = type(exc).__module__.casefold()
+    name = exc_type.__name__.casefold()
+    mod = exc_type.__module__.casefold()
 
     if "timeout" in name or "timeout" in mod:
         return True
@@ -27,6 +62,12 @@ def _looks_like_timeout_or_connection(exc: BaseException) -> bool:
     return False
 
 
+def _looks_like_timeout_or_connection(exc: BaseException) -> bool:
+    if _NETWORK_ERROR_TYPES and isinstance(exc, _NETWORK_ERROR_TYPES):
+        return True
+    return _type_looks_like_timeout_or_connection(type(exc))
+
+
 def is_retryable_apify_exception(exc: BaseException) -> tuple[bool, float | None, str | None]:
     """
     Apify retry policy aligned with client behavior:
@@ -34,11 +75,6 @@ def is_retryable_apify_exception(exc: BaseException) -> tuple[bool, float | None
     - HTTP 500+
     - HTTP 429
     """
-    try:
-        from apify_client.errors import ApifyApiError  # type: ignore
-    except Exception:
-        ApifyApiError = None  # type: ignore[assignment]
-
     if ApifyApiError is not None and isinstance(exc, ApifyApiError):
         code = _extract_status_code(exc)
         if code == 429 or (isinstance(code, int) and code >= 500):
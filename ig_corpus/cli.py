@@ -4,17 +4,16 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from .config import load_config, resolve_runtime_secrets
-from .dry_run import run_dry_run
 from .errors import ApifyError, ConfigError, ExportError, LLMError, StorageError
-from .export_excel import export_corpus_workbook
-from .export_pdf import export_codebook_pdf
-from .failure_report import format_failure_report
-from .loop import run_feedback_loop
-from .run_log import RunLogger
-from .storage import SQLiteStateStore
+
+if TYPE_CHECKING:
+    from .config import RuntimeSecrets
+    from .config_schema import AppConfig
+
+# Subcommand dependencies (OpenAI, Apify, openpyxl, ReportLab, ...) are imported inside the
+# handlers so `--help` and argument errors do not pay for import trees they never use.
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -67,15 +66,33 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Shared pretty-printer for the JSON blocks written to stdout.
+_PRETTY_JSON = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=True)
+
+
 def _eprint(message: str) -> None:
     print(message, file=sys.stderr)
 
 
+def _load_config_and_secrets(path: str) -> tuple["AppConfig", "RuntimeSecrets"]:
+    """
+    Load the config and runtime secrets shared by every subcommand.
+
+    load_config memoizes on the file fingerprint, so repeated handlers in one process
+    (tests, scripted dry-run then run) reuse the validated AppConfig.
+    """
+    from .config import load_config, resolve_runtime_secrets
+
+    cfg = load_config(path)
+    return cfg, resolve_runtime_secrets(cfg)
+
+
 def _cmd_dry_run(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
-    secrets = resolve_runtime_secrets(cfg)
+    from .dry_run import run_dry_run
 
-    if bool(getattr(args, "offline", False)):
+    cfg, secrets = _load_config_and_secrets(args.config)
+
+    if getattr(args, "offline", False):
         from .offline import OfflineInstagramHashtagScraper, OfflinePostClassifier
 
         result = run_dry_run(
@@ -92,12 +109,19 @@ def _cmd_dry_run(args: argparse.Namespace) -> int:
     print(f"eligible_count={result.eligible_count}")
     print(f"query_term={result.query_term}")
     print("example_decision=")
-    print(json.dumps(result.example_decision, indent=2, ensure_ascii=False, sort_keys=True))
+    print(_PRETTY_JSON.encode(result.example_decision))
 
     return 0
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
+    from .export_excel import export_corpus_workbook
+    from .export_pdf import export_codebook_pdf
+    from .failure_report import format_failure_report
+    from .loop import run_feedback_loop
+    from .run_log import RunLogger
+    from .storage import SQLiteStateStore
+
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -118,8 +142,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
         )
 
         try:
-            cfg = load_config(args.config)
-            secrets = resolve_runtime_secrets(cfg)
+            cfg, secrets = _load_config_and_secrets(args.config)
 
             log.info(
                 "config_loaded",
@@ -160,6 +183,8 @@ def _cmd_run(args: argparse.Namespace) -> int:
                     failure_summary=failure_summary or None,
                 )
 
+                # Persist the loop's log lines before the long-running exports.
+                log.flush()
                 log.info("export_excel_started", path=str(xlsx_path))
                 export_corpus_workbook(cfg, store, xlsx_path, run_id=result.run_id)
                 log.info("export_excel_completed", path=str(xlsx_path))
@@ -182,7 +207,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
             if isinstance(result.failure_report, dict) and result.failure_report:
                 _eprint(format_failure_report(result.failure_report))
                 print("failure_report=")
-                print(json.dumps(result.failure_report, indent=2, ensure_ascii=False, sort_keys=True))
+                print(_PRETTY_JSON.encode(result.failure_report))
 
             return 0 if result.status == "completed_pool" else 4
         except Exception as e:
@@ -195,8 +220,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     try:
-        handler = getattr(args, "_handler")
-        return int(handler(args))
+        return int(args._handler(args))
     except ConfigError as e:
         _eprint(str(e))
         return 2
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import json
 from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
 from .config_schema import AppConfig
-from .llm_schema import LLMDecision
-from .normalize import normalized_post_from_apify_item
+from .normalize import hashtags_from_apify_item
 from .storage import RunRecord, SQLiteStateStore
 
 
@@ -61,6 +61,7 @@ class CodebookCounts:
     rejected_total: int
     eligible_in_pool: int
     final_sample_n: int
+    invalid_pool_decisions: int = 0
 
 
 @dataclass(frozen=True)
@@ -85,14 +86,23 @@ class CodebookData:
     genre_values: tuple[str, ...]
 
 
-def _db_scalar_int(store: SQLiteStateStore, sql: str, params: tuple[Any, ...] = ()) -> int:
-    row = store.conn.execute(sql, params).fetchone()
+_COUNTS_SQL = """
+SELECT
+  (SELECT COUNT(1) FROM raw_posts),
+  (SELECT COUNT(1) FROM llm_decisions),
+  (SELECT COUNT(1) FROM latest_llm_decisions),
+  (SELECT COUNT(1) FROM eligible_posts)
+""".strip()
+
+
+def _fetch_counts(store: SQLiteStateStore) -> tuple[int, int, int, int]:
+    """
+    Return (raw_posts, decision_records, labeled_posts, eligible_total) in one query.
+    """
+    row = store.conn.execute(_COUNTS_SQL).fetchone()
     if row is None:
-        return 0
-    try:
-        return int(row[0])
-    except Exception:
-        return 0
+        return 0, 0, 0, 0
+    return int(row[0] or 0), int(row[1] or 0), int(row[2] or 0), int(row[3] or 0)
 
 
 def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[ActorRunInfo]:
@@ -100,7 +110,7 @@ def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[ActorRunI
     if not rid:
         return []
 
-    rows = store.conn.execute(
+    cur = store.conn.execute(
         """
         SELECT actor_id, actor_run_id, dataset_id, created_at
         FROM apify_actor_runs
@@ -108,74 +118,150 @@ def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[ActorRunI
         ORDER BY created_at ASC, actor_run_id ASC
         """.strip(),
         (rid,),
-    ).fetchall()
-
-    out: list[ActorRunInfo] = []
-    for r in rows:
-        out.append(
-            ActorRunInfo(
-                actor_id=str(r["actor_id"]),
-                actor_run_id=str(r["actor_run_id"]),
-                dataset_id=str(r["dataset_id"]),
-                created_at=str(r["created_at"]),
-            )
+    )
+    return [
+        ActorRunInfo(
+            actor_id=str(actor_id),
+            actor_run_id=str(actor_run_id),
+            dataset_id=str(dataset_id),
+            created_at=str(created_at),
         )
-    return out
+        for actor_id, actor_run_id, dataset_id, created_at in cur
+    ]
+
+
+# Eligible pool in deterministic order: oldest decisions first, capped at targets.pool_n.
+_POOL_CTE = """
+WITH pool AS (
+  SELECT p.raw_json, d.decision_json, d.model
+  FROM raw_posts p
+  JOIN latest_llm_decisions d
+    ON d.post_key = p.post_key
+  WHERE d.eligible = 1
+  ORDER BY d.created_at ASC, d.post_key ASC
+  LIMIT ?
+)
+""".strip()
 
+_TAG_LIST_FIELDS: tuple[str, ...] = ("narrative_labels", "discourse_moves", "neoliberal_signals")
 
-def _fetch_eligible_pool_rows(
-    store: SQLiteStateStore, *, limit: int
-) -> list[tuple[str, str, str]]:
+
+def _fetch_eligible_pool_raw_json(store: SQLiteStateStore, *, limit: int) -> list[str]:
     if limit <= 0:
         return []
 
-    rows = store.conn.execute(
-        """
-        SELECT p.post_key, p.raw_json, d.decision_json
-        FROM raw_posts p
-        JOIN latest_llm_decisions d
-          ON d.post_key = p.post_key
-        WHERE d.eligible = 1
-        ORDER BY d.created_at ASC, p.post_key ASC
-        LIMIT ?
-        """.strip(),
+    cur = store.conn.execute(
+        f"{_POOL_CTE}\nSELECT raw_json FROM pool",
         (int(limit),),
-    ).fetchall()
+    )
+    return [str(raw_json) for (raw_json,) in cur]
 
-    out: list[tuple[str, str, str]] = []
-    for r in rows:
-        out.append((str(r["post_key"]), str(r["raw_json"]), str(r["decision_json"])))
-    return out
+
+@dataclass(frozen=True)
+class PoolTagCounts:
+    genre: Counter[str]
+    narrative_labels: Counter[str]
+    discourse_moves: Counter[str]
+    neoliberal_signals: Counter[str]
+    model: Counter[str]
+    invalid_decisions: int
+
+
+def fetch_pool_tag_counts(
+    store: SQLiteStateStore,
+    *,
+    limit: int,
+    include_models: bool = False,
+) -> PoolTagCounts:
+    """
+    Tally decision tags across the eligible pool inside SQLite.
+
+    Decisions are stored from validated LLMDecision models, so the tag fields can be read
+    with json_extract/json_each instead of re-validating every row in Python. Terms are
+    grouped in SQL and re-keyed on str.strip() here, matching the Python tally. Pool rows
+    whose decision_json is not valid JSON cannot be tallied and are counted in
+    invalid_decisions. The model counter is only filled when include_models is set.
+    """
+    counts: dict[str, Counter[str]] = {"genre": Counter(), "model": Counter()}
+    for field in _TAG_LIST_FIELDS:
+        counts[field] = Counter()
+    invalid = 0
+
+    if limit > 0:
+        selects = [
+            "SELECT 'invalid', NULL, COUNT(1) FROM pool WHERE NOT json_valid(pool.decision_json)",
+            """
+            SELECT 'genre', json_extract(pool.decision_json, '$.tags.genre') AS term, COUNT(1)
+            FROM pool
+            WHERE json_valid(pool.decision_json)
+            GROUP BY term
+            """.strip(),
+        ]
+        for field in _TAG_LIST_FIELDS:
+            selects.append(
+                f"""
+                SELECT '{field}', j.value AS term, COUNT(1)
+                FROM pool, json_each(pool.decision_json, '$.tags.{field}') AS j
+                WHERE json_valid(pool.decision_json) AND j.type = 'text'
+                GROUP BY term
+                """.strip()
+            )
+
+        if include_models:
+            selects.append("SELECT 'model', pool.model AS term, COUNT(1) FROM pool GROUP BY term")
+
+        sql = f"{_POOL_CTE}\n" + "\nUNION ALL\n".join(selects)
+        for field, term, n in store.conn.execute(sql, (int(limit),)):
+            if field == "invalid":
+                invalid = int(n)
+                continue
+            t = str(term).strip() if term is not None else ""
+            if t:
+                counts[str(field)][t] += int(n)
+
+    return PoolTagCounts(
+        genre=counts["genre"],
+        narrative_labels=counts["narrative_labels"],
+        discourse_moves=counts["discourse_moves"],
+        neoliberal_signals=counts["neoliberal_signals"],
+        model=counts["model"],
+        invalid_decisions=invalid,
+    )
+
+
+def _top_key(item: tuple[str, int]) -> tuple[int, str, str]:
+    return (-item[1], item[0].casefold(), item[0])
 
 
 def _top(counter: Counter[str], *, limit: int) -> list[tuple[str, int]]:
-    items = [(k, int(v)) for k, v in counter.items() if (k or "").strip() and int(v) > 0]
-    items.sort(key=lambda x: (-x[1], x[0].casefold(), x[0]))
-    return items[: max(0, int(limit))]
+    k = max(0, int(limit))
+    if not k:
+        return []
+    items = ((t, int(v)) for t, v in counter.items() if (t or "").strip() and int(v) > 0)
+    # Same ordering as a full sort + slice, but O(n log k) for the small top-k tables.
+    return heapq.nsmallest(k, items, key=_top_key)
 
 
 def collect_codebook_data(config: AppConfig, store: SQLiteStateStore, *, run_id: str) -> CodebookData:
-    run = store.get_run(run_id)
+    pool_limit = int(config.targets.pool_n)
+    rid = (run_id or "").strip()
 
-    raw_posts = int(store.raw_post_count())
-    decision_records = int(store.decision_count())
-    labeled_posts = _db_scalar_int(store, "SELECT COUNT(1) FROM latest_llm_decisions")
-    eligible_total = _db_scalar_int(store, "SELECT COUNT(1) FROM eligible_posts")
-    rejected_total = max(0, int(labeled_posts) - int(eligible_total))
+    with store.read_snapshot():
+        run = store.get_run(rid) if rid else None
 
-    pool_limit = int(config.targets.pool_n)
-    eligible_rows = _fetch_eligible_pool_rows(store, limit=pool_limit)
-    eligible_in_pool = len(eligible_rows)
+        raw_posts, decision_records, labeled_posts, eligible_total = _fetch_counts(store)
+
+        pool_raw_json = _fetch_eligible_pool_raw_json(store, limit=pool_limit)
+        tag_counts = fetch_pool_tag_counts(store, limit=pool_limit)
+        actor_runs = _fetch_actor_runs(store, run_id=rid) if rid else []
+
+    rejected_total = max(0, int(labeled_posts) - int(eligible_total))
+    eligible_in_pool = len(pool_raw_json)
 
     final_sample_n = min(int(config.targets.final_n), eligible_in_pool)
 
     hashtag_counts: Counter[str] = Counter()
-    genre_counts: Counter[str] = Counter()
-    narrative_counts: Counter[str] = Counter()
-    discourse_counts: Counter[str] = Counter()
-    neoliberal_counts: Counter[str] = Counter()
-
-    for _, raw_json, decision_json in eligible_rows:
+    for raw_json in pool_raw_json:
         item: Any
         try:
             item = json.loads(raw_json)
@@ -183,34 +269,14 @@ def collect_codebook_data(config: AppConfig, store: SQLiteStateStore, *, run_id:
             item = None
 
         if isinstance(item, dict):
-            post = normalized_post_from_apify_item(item)
-            if post is not None:
-                for tag in post.hashtags:
-                    t = (tag or "").strip()
-                    if t:
-                        hashtag_counts[t] += 1
-
-        try:
-            decision = LLMDecision.model_validate_json(decision_json)
-        except Exception:
-            continue
-
-        genre_counts[str(decision.tags.genre)] += 1
-
-        for lab in decision.tags.narrative_labels:
-            t = (lab or "").strip()
-            if t:
-                narrative_counts[t] += 1
-
-        for mv in decision.tags.discourse_moves:
-            t = (mv or "").strip()
-            if t:
-                discourse_counts[t] += 1
+            hashtag_counts.update(
+                t for t in ((tag or "").strip() for tag in hashtags_from_apify_item(item)) if t
+            )
 
-        for sig in decision.tags.neoliberal_signals:
-            t = (sig or "").strip()
-            if t:
-                neoliberal_counts[t] += 1
+    genre_counts = tag_counts.genre
+    narrative_counts = tag_counts.narrative_labels
+    discourse_counts = tag_counts.discourse_moves
+    neoliberal_counts = tag_counts.neoliberal_signals
 
     stats = CodebookStats(
         top_hashtags=_top(hashtag_counts, limit=25),
@@ -220,8 +286,6 @@ def collect_codebook_data(config: AppConfig, store: SQLiteStateStore, *, run_id:
         top_neoliberal_signals=_top(neoliberal_counts, limit=25),
     )
 
-    actor_runs = _fetch_actor_runs(store, run_id=run_id)
-
     counts = CodebookCounts(
         raw_posts=raw_posts,
         decision_records=decision_records,
@@ -230,6 +294,7 @@ def collect_codebook_data(config: AppConfig, store: SQLiteStateStore, *, run_id:
         rejected_total=rejected_total,
         eligible_in_pool=eligible_in_pool,
         final_sample_n=final_sample_n,
+        invalid_pool_decisions=tag_counts.invalid_decisions,
     )
 
     return CodebookData(
@@ -3,8 +3,10 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 from typing import Mapping
 
 import yaml
@@ -13,6 +15,21 @@ from pydantic import ValidationError
 from .config_schema import AppConfig
 from .errors import ConfigError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+_FileFingerprint = tuple[int, int, int]
+
+# Validated configs keyed by resolved path; AppConfig is frozen, so instances can be shared.
+_CONFIG_CACHE: dict[str, tuple[_FileFingerprint, AppConfig]] = {}
+_CONFIG_CACHE_LOCK = Lock()
+
+# Config hashes keyed by id(); the weakref guards against id reuse after an instance is freed.
+_SHA_CACHE: dict[int, tuple[weakref.ref[AppConfig], str]] = {}
+
 
 @dataclass(frozen=True)
 class RuntimeSecrets:
@@ -25,19 +42,32 @@ def load_config(path: str | Path) -> AppConfig:
     Load a YAML config file and validate it into a typed AppConfig.
 
     Raises ConfigError with a readable validation message on failure.
+    Repeated loads of an unchanged file (same mtime, size and inode) return the cached config.
     """
     p = Path(path)
 
     if not p.exists():
         raise ConfigError(f"Config file not found: {p}")
 
+    try:
+        st = p.stat()
+        cache_key = str(p.resolve())
+    except OSError as e:
+        raise ConfigError(f"Failed to read config file: {p}") from e
+
+    fingerprint: _FileFingerprint = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     try:
         raw_text = p.read_text(encoding="utf-8")
     except OSError as e:
         raise ConfigError(f"Failed to read config file: {p}") from e
 
     try:
-        data = yaml.safe_load(raw_text)
+        data = yaml.load(raw_text, Loader=_YamlLoader)
     except Exception as e:  # PyYAML can raise multiple exception types
         raise ConfigError(f"Failed to parse YAML in {p}: {e}") from e
 
@@ -48,10 +78,14 @@ def load_config(path: str | Path) -> AppConfig:
         raise ConfigError(f"Top-level YAML in {p} must be a mapping/object")
 
     try:
-        return AppConfig.model_validate(data)
+        config = AppConfig.model_validate(data)
     except ValidationError as e:
         raise ConfigError(_format_pydantic_errors(e, p)) from e
 
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[cache_key] = (fingerprint, config)
+    return config
+
 
 def resolve_runtime_secrets(
     config: AppConfig, *, environ: Mapping[str, str] | None = None
@@ -85,14 +119,25 @@ def resolve_runtime_secrets(
 def config_sha256(config: AppConfig) -> str:
     """
     Compute a stable SHA-256 hash of the config values for reproducibility.
+
+    AppConfig is frozen, so the digest is memoized per instance.
     """
+    key = id(config)
+    cached = _SHA_CACHE.get(key)
+    if cached is not None and cached[0]() is config:
+        return cached[1]
+
     payload = json.dumps(
         config.model_dump(mode="json"),
         sort_keys=True,
         separators=(",", ":"),
         ensure_ascii=False,
     ).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    digest = hashlib.sha256(payload).hexdigest()
+
+    ref = weakref.ref(config, lambda _ref, key=key: _SHA_CACHE.pop(key, None))
+    _SHA_CACHE[key] = (ref, digest)
+    return digest
 
 
 def _format_pydantic_errors(err: ValidationError, path: Path) -> str:
@@ -5,22 +5,17 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-_ENV_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_ENV_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$", re.ASCII)
 
 
 def _normalize_term_list(values: list[str], *, allow_empty: bool) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-
+    # First spelling wins per casefolded key; dicts keep insertion order.
+    by_key: dict[str, str] = {}
     for item in values:
         term = (item or "").strip()
-        if not term:
-            continue
-        key = term.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(term)
+        if term:
+            by_key.setdefault(term.casefold(), term)
+    out = list(by_key.values())
 
     if not allow_empty and not out:
         raise ValueError("must contain at least one non-empty term")
@@ -62,6 +57,8 @@ class ApifyConfig(BaseModel):
     results_limit_per_query: PositiveInt = 150
     keyword_search: bool = True
     run_batch_queries: PositiveInt = 4
+    max_concurrent_runs: PositiveInt = 1
+    cache_datasets: bool = False
 
     @field_validator("token_env")
     @classmethod
@@ -78,12 +75,46 @@ class OpenAIConfig(BaseModel):
     escalation_confidence_threshold: float = Field(0.70, ge=0.0, le=1.0)
     max_output_tokens: PositiveInt = 16000
     max_concurrent_requests: PositiveInt = 16
+    # Client-side pacing against account limits; None leaves a dimension unthrottled.
+    max_requests_per_minute: PositiveInt | None = None
+    max_tokens_per_minute: PositiveInt | None = None
+    # Posts labeled per live request; >1 packs them into one call to ease RPM limits.
+    posts_per_request: PositiveInt = 1
+    # Tag-free first pass; confident rejects skip the full labeling call.
+    screen_rejects: bool = False
+    # SQLite file caching model outputs by exact request; reused across runs and databases.
+    response_cache_path: str | None = None
+    # In-process LRU of decisions keyed on post content (url/timestamp excluded); 0 disables.
+    content_cache_size: NonNegativeInt = 0
+    # Per-attempt HTTP timeout (None keeps the SDK default) and attempts per call, retries
+    # included; timed-out attempts are retried with the usual backoff.
+    request_timeout_seconds: float | None = Field(None, gt=0.0)
+    max_attempts: PositiveInt = 6
+    # Label through the Batch API: jobs sized to the remaining pool need, polled until done.
+    use_batch_api: bool = False
+    batch_poll_interval_seconds: PositiveInt = 30
 
     @field_validator("api_key_env")
     @classmethod
     def _api_key_env_must_be_valid(cls, v: str) -> str:
         return _validate_env_var_name(v)
 
+    @model_validator(mode="after")
+    def _screening_needs_single_post_requests(self) -> "OpenAIConfig":
+        # Screening is a single-post pass; grouped requests would silently skip it.
+        if self.screen_rejects and self.posts_per_request > 1:
+            raise ValueError("screen_rejects requires posts_per_request = 1")
+        return self
+
+    @model_validator(mode="after")
+    def _batch_api_needs_plain_requests(self) -> "OpenAIConfig":
+        # Batch jobs hold one full labeling request per post; screening and grouping would be ignored.
+        if self.use_batch_api and self.screen_rejects:
+            raise ValueError("use_batch_api cannot be combined with screen_rejects")
+        if self.use_batch_api and self.posts_per_request > 1:
+            raise ValueError("use_batch_api requires posts_per_request = 1")
+        return self
+
 
 class FiltersConfig(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
@@ -102,6 +133,8 @@ class LoopConfig(BaseModel):
     stagnation_min_new_eligible: NonNegativeInt = 15
     max_raw_items: PositiveInt = 20000
     backoff_seconds: NonNegativeInt = 10
+    # Start the next primary scrape while the current batch is being labeled.
+    prefetch_next_batch: bool = False
 
 
 class ExpansionConfig(BaseModel):
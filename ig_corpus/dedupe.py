@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from hashlib import blake2b
 from typing import Iterable
 from urllib.parse import urlsplit, urlunsplit
 
 from .post import NormalizedPost
 
 
+# Common Instagram URL shape; anything else falls back to urlsplit.
+_IG_URL_RE = re.compile(
+    r"^(https?)://(?:www\.)?instagram\.com(/[^?#\t\r\n]*)?(?:[?#].*)?$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def canonicalize_url(url: str) -> str:
     value = (url or "").strip()
     if not value:
         return ""
 
+    m = _IG_URL_RE.match(value)
+    if m is not None:
+        path = (m.group(2) or "").rstrip("/") or "/"
+        return f"{m.group(1).lower()}://instagram.com{path}"
+
     try:
         parts = urlsplit(value)
     except Exception:
@@ -40,15 +54,27 @@ def dedupe_key(post: NormalizedPost) -> str:
     return f"url:{canonicalize_url(post.url)}"
 
 
+def _fingerprint(key: str) -> int:
+    # 64-bit digest; collisions are negligible at corpus sizes and this is not a security boundary.
+    return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
 @dataclass
 class SeenKeys:
-    keys: set[str] = field(default_factory=set)
+    """
+    In-memory set of dedupe keys, stored as 64-bit fingerprints to keep long runs compact.
+    """
+
+    keys: set[int] = field(default_factory=set)
+
+    def __len__(self) -> int:
+        return len(self.keys)
 
     def has(self, key: str) -> bool:
-        return key in self.keys
+        return _fingerprint(key) in self.keys
 
     def add(self, key: str) -> None:
-        self.keys.add(key)
+        self.keys.add(_fingerprint(key))
 
     def add_post(self, post: NormalizedPost) -> str:
         key = dedupe_key(post)
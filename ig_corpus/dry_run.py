@@ -43,18 +43,25 @@ def _pick_query_term(config: AppConfig, override: str | None) -> str:
     return term
 
 
-def _redact_decision_for_print(url: str, decision: LLMDecision) -> dict[str, Any]:
-    return {
-        "url": url,
-        "eligible": decision.eligible,
-        "eligibility_reasons": decision.eligibility_reasons,
-        "language": decision.language.model_dump(mode="json"),
-        "topic": decision.topic.model_dump(mode="json"),
-        "commercial": decision.commercial.model_dump(mode="json"),
-        "caption_quality": decision.caption_quality.model_dump(mode="json"),
-        "tags": decision.tags.model_dump(mode="json"),
-        "overall_confidence": decision.overall_confidence,
+# Decision fields shown by `dry-run`; dumped in one pass by pydantic's serializer.
+_PRINT_FIELDS: frozenset[str] = frozenset(
+    {
+        "eligible",
+        "eligibility_reasons",
+        "language",
+        "topic",
+        "commercial",
+        "caption_quality",
+        "tags",
+        "overall_confidence",
     }
+)
+
+
+def _redact_decision_for_print(url: str, decision: LLMDecision) -> dict[str, Any]:
+    out: dict[str, Any] = {"url": url}
+    out.update(decision.model_dump(mode="json", include=_PRINT_FIELDS))
+    return out
 
 
 def run_dry_run(
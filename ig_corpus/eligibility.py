@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from typing import Iterable, Sequence
+
 from .llm_schema import LLMDecision
 
 
-def _append_unique(existing: list[str], additions: list[str]) -> list[str]:
-    out = list(existing)
-    seen = {r for r in out if isinstance(r, str)}
-    for item in additions:
-        if item not in seen:
-            out.append(item)
-            seen.add(item)
-    return out
+def _append_unique(existing: Sequence[str], additions: Iterable[str]) -> list[str]:
+    seen = set(existing)
+    return [*existing, *dict.fromkeys(a for a in additions if a not in seen)]
+
+
+def _passes_structured_rules(decision: LLMDecision) -> bool:
+    return (
+        bool(decision.language.is_english)
+        and bool(decision.topic.is_bodyweight_calisthenics)
+        and bool(decision.caption_quality.is_analyzable)
+        and not bool(decision.commercial.is_exclusively_commercial)
+    )
 
 
 def compute_structured_eligibility(decision: LLMDecision) -> tuple[bool, tuple[str, ...]]:
@@ -23,6 +29,9 @@ def compute_structured_eligibility(decision: LLMDecision) -> tuple[bool, tuple[s
     - caption_quality.is_analyzable == True
     - commercial.is_exclusively_commercial == False
     """
+    if _passes_structured_rules(decision):
+        return True, ()
+
     failures: list[str] = []
 
     if not bool(decision.language.is_english):
@@ -37,7 +46,7 @@ def compute_structured_eligibility(decision: LLMDecision) -> tuple[bool, tuple[s
     if bool(decision.commercial.is_exclusively_commercial):
         failures.append("exclusively_commercial")
 
-    return (len(failures) == 0), tuple(failures)
+    return False, tuple(failures)
 
 
 def enforce_structured_eligibility(decision: LLMDecision) -> LLMDecision:
@@ -47,10 +56,12 @@ def enforce_structured_eligibility(decision: LLMDecision) -> LLMDecision:
     If the model sets `eligible` inconsistently with required fields, override it and
     append machine-readable markers to eligibility_reasons.
     """
-    computed_eligible, failures = compute_structured_eligibility(decision)
-    if bool(decision.eligible) == bool(computed_eligible):
+    # Consistent decisions are the common case; failure labels are only needed for overrides.
+    if bool(decision.eligible) == _passes_structured_rules(decision):
         return decision
 
+    computed_eligible, failures = compute_structured_eligibility(decision)
+
     marker = "eligibility_overridden_accept" if computed_eligible else "eligibility_overridden_reject"
     additions: list[str] = [marker]
     if failures:
@@ -59,6 +70,6 @@ def enforce_structured_eligibility(decision: LLMDecision) -> LLMDecision:
     return decision.model_copy(
         update={
             "eligible": bool(computed_eligible),
-            "eligibility_reasons": _append_unique(list(decision.eligibility_reasons), additions),
+            "eligibility_reasons": _append_unique(decision.eligibility_reasons, additions),
         }
     )
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import sqlite3
 from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 import yaml
 
+from .codebook import fetch_pool_tag_counts
 from .config_schema import AppConfig
 from .errors import ExportError
 from .final_sample import (
@@ -17,12 +23,63 @@ from .final_sample import (
     load_final_sample_meta,
     pool_keys_sha256,
 )
-from .llm_schema import LLMDecision
+from .llm_schema import LLMDecision, decision_from_stored_json
 from .normalize import normalized_post_from_apify_item
 from .storage import SQLiteStateStore
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 
 _EXCEL_FORMULA_PREFIXES = ("=", "+", "-", "@")
+_EXCEL_FORMULA_FIRST_CHARS = frozenset(_EXCEL_FORMULA_PREFIXES)
+
+# Column order shared by the final, eligible_pool, and rejected sheets.
+_ROW_COLUMNS: tuple[str, ...] = (
+    "post_key",
+    "url",
+    "owner_username",
+    "owner_id",
+    "caption",
+    "hashtags",
+    "mentions",
+    "alt",
+    "type",
+    "product_type",
+    "is_sponsored",
+    "timestamp",
+    "actor_source",
+    "fetched_at",
+    "decided_at",
+    "model",
+    "tokens_total",
+    "overall_confidence",
+    "language_is_english",
+    "language_confidence",
+    "topic_is_bodyweight_calisthenics",
+    "topic_confidence",
+    "topic_notes",
+    "commercial_is_exclusively_commercial",
+    "commercial_signals",
+    "caption_quality_is_analyzable",
+    "caption_quality_issues",
+    "tags_genre",
+    "tags_narrative_labels",
+    "tags_discourse_moves",
+    "tags_neoliberal_signals",
+    "eligibility_reasons",
+    "selected_final",
+)
+_HASHTAGS_COL = _ROW_COLUMNS.index("hashtags")
+_SELECTED_COL = _ROW_COLUMNS.index("selected_final")
+
+_FETCH_BATCH = 1000
+
+# Batches smaller than this are flattened inline; process start-up would dominate.
+_PARALLEL_MIN_ROWS = 200
+_PARALLEL_CHUNKSIZE = 64
 
 
 def _final_sheet_name(final_n: int) -> str:
@@ -50,32 +107,20 @@ def _utc_now_iso() -> str:
 def _safe_excel_text(value: Any) -> str | None:
     if value is None:
         return None
+    # One isinstance check: str and its subclasses fall through to the formula guard.
     if not isinstance(value, str):
         return str(value)
-    s = value
-    if not s:
-        return s
-    if s.startswith(_EXCEL_FORMULA_PREFIXES):
-        return "'" + s
-    return s
+    if value and value[0] in _EXCEL_FORMULA_FIRST_CHARS:
+        return "'" + value
+    return value
 
 
 def _fmt_space_join(values: Iterable[str], *, prefix: str = "") -> str:
-    out: list[str] = []
-    for v in values:
-        t = (v or "").strip()
-        if t:
-            out.append(f"{prefix}{t}" if prefix else t)
-    return " ".join(out)
+    return " ".join(prefix + t for v in values if (t := (v or "").strip()))
 
 
 def _fmt_pipe_join(values: Iterable[str]) -> str:
-    out: list[str] = []
-    for v in values:
-        t = (v or "").strip()
-        if t:
-            out.append(t)
-    return " | ".join(out)
+    return " | ".join(t for v in values if (t := (v or "").strip()))
 
 
 def _loads_json_object(raw: str) -> dict[str, Any]:
@@ -98,48 +143,127 @@ def _db_scalar_int(store: SQLiteStateStore, sql: str, params: tuple[Any, ...] =
         return 0
 
 
-def _fetch_latest_posts_with_decisions(
+def _latest_posts_sql(*, eligible: bool, order_asc: bool, columns: str, limit: int | None) -> tuple[str, tuple[Any, ...]]:
+    where = "d.eligible = 1" if eligible else "d.eligible = 0"
+    order = "ASC" if order_asc else "DESC"
+
+    sql = f"""
+    SELECT
+      {columns}
+    FROM raw_posts p
+    JOIN latest_llm_decisions d
+      ON d.post_key = p.post_key
+    WHERE {where}
+    ORDER BY d.created_at {order}, d.post_key {order}
+    """.strip()
+
+    params: tuple[Any, ...] = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (int(limit),)
+    return sql, params
+
+
+def _fetch_latest_post_keys(
     store: SQLiteStateStore,
     *,
     eligible: bool,
     limit: int | None,
     order_asc: bool,
-) -> list[dict[str, Any]]:
+) -> list[str]:
     if limit is not None and limit <= 0:
         return []
 
-    where = "d.eligible = 1" if eligible else "d.eligible = 0"
-    order = "ASC" if order_asc else "DESC"
+    sql, params = _latest_posts_sql(
+        eligible=eligible,
+        order_asc=order_asc,
+        columns="p.post_key",
+        limit=limit,
+    )
+    # Order-preserving dedupe, matching fetch_eligible_pool_keys.
+    return list(dict.fromkeys(str(k) for (k,) in store.conn.execute(sql, params) if str(k or "").strip()))
 
-    sql = f"""
-    SELECT
+
+def _iter_latest_post_batches(
+    conn: sqlite3.Connection,
+    *,
+    eligible: bool,
+    limit: int | None,
+    order_asc: bool,
+) -> Iterator[list[Any]]:
+    """
+    Stream joined post/decision rows in batches so raw_json blobs are not all held at once.
+
+    Rows are tuples of (post_key, url, actor_source, fetched_at, raw_json, model,
+    tokens_total, decided_at, overall_confidence, decision_json).
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    sql, params = _latest_posts_sql(
+        eligible=eligible,
+        order_asc=order_asc,
+        columns="""
       p.post_key,
       p.url,
       p.actor_source,
       p.fetched_at,
       p.raw_json,
       d.model,
-      d.overall_confidence,
       d.tokens_total,
       d.created_at AS decided_at,
+      d.overall_confidence,
       d.decision_json
-    FROM raw_posts p
-    JOIN latest_llm_decisions d
-      ON d.post_key = p.post_key
-    WHERE {where}
-    ORDER BY d.created_at {order}, p.post_key {order}
-    """.strip()
+        """.strip(),
+        limit=limit,
+    )
 
-    params: tuple[Any, ...] = ()
-    if limit is not None:
-        sql += " LIMIT ?"
-        params = (int(limit),)
+    # Plain tuples (in _flatten_args order) instead of sqlite3.Row objects.
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.arraysize = _FETCH_BATCH
+    cur.execute(sql, params)
+    while batch := cur.fetchmany():
+        yield batch
 
-    rows = store.conn.execute(sql, params).fetchall()
-    out: list[dict[str, Any]] = []
-    for r in rows:
-        out.append({k: r[k] for k in r.keys()})
-    return out
+
+def _open_read_only_connection(store: SQLiteStateStore) -> sqlite3.Connection | None:
+    """
+    Open a second read-only handle on the store's database file.
+
+    Returns None for in-memory stores or when the file cannot be reopened.
+    """
+    try:
+        row = store.conn.execute("PRAGMA database_list").fetchone()
+    except sqlite3.Error:
+        return None
+
+    path = str(row["file"] or "") if row is not None else ""
+    if not path:
+        return None
+
+    try:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA query_only = ON")
+    except sqlite3.Error:
+        return None
+    return conn
+
+
+def _prefetch_latest_post_batches(
+    conn: sqlite3.Connection,
+    *,
+    eligible: bool,
+    limit: int | None,
+    order_asc: bool,
+) -> list[list[Any]]:
+    try:
+        return list(
+            _iter_latest_post_batches(conn, eligible=eligible, limit=limit, order_asc=order_asc)
+        )
+    finally:
+        conn.close()
 
 
 def _flatten_row(
@@ -155,7 +279,8 @@ def _flatten_row(
     overall_confidence: float,
     decision_json: str,
     selected_final: bool,
-) -> tuple[dict[str, Any], LLMDecision]:
+    trust_stored_json: bool = True,
+) -> tuple[tuple[Any, ...], LLMDecision]:
     raw_item = _loads_json_object(raw_json)
     post = normalized_post_from_apify_item(raw_item)
 
@@ -183,54 +308,61 @@ def _flatten_row(
         owner_id = post.owner_id
 
     try:
-        decision = LLMDecision.model_validate_json(decision_json)
+        if trust_stored_json:
+            decision = decision_from_stored_json(decision_json)
+        else:
+            decision = LLMDecision.model_validate_json(decision_json)
     except Exception as e:
         raise ExportError(f"Failed to parse decision_json for {post_key}: {e}") from e
 
-    row: dict[str, Any] = {
-        "post_key": _safe_excel_text(post_key),
-        "url": _safe_excel_text(url),
-        "owner_username": _safe_excel_text(owner_username),
-        "owner_id": _safe_excel_text(owner_id),
-        "caption": _safe_excel_text(caption),
-        "hashtags": _safe_excel_text(_fmt_space_join(hashtags, prefix="#")),
-        "mentions": _safe_excel_text(_fmt_space_join(mentions, prefix="@")),
-        "alt": _safe_excel_text(alt),
-        "type": _safe_excel_text(post_type),
-        "product_type": _safe_excel_text(product_type),
-        "is_sponsored": is_sponsored,
-        "timestamp": _safe_excel_text(timestamp),
-        "actor_source": _safe_excel_text(actor_source),
-        "fetched_at": _safe_excel_text(fetched_at),
-        "decided_at": _safe_excel_text(decided_at),
-        "model": _safe_excel_text(model),
-        "tokens_total": int(tokens_total) if tokens_total is not None else None,
-        "overall_confidence": float(overall_confidence),
-        "language_is_english": bool(decision.language.is_english),
-        "language_confidence": float(decision.language.confidence),
-        "topic_is_bodyweight_calisthenics": bool(decision.topic.is_bodyweight_calisthenics),
-        "topic_confidence": float(decision.topic.confidence),
-        "topic_notes": _safe_excel_text(decision.topic.topic_notes),
-        "commercial_is_exclusively_commercial": bool(decision.commercial.is_exclusively_commercial),
-        "commercial_signals": _safe_excel_text(_fmt_pipe_join(decision.commercial.signals)),
-        "caption_quality_is_analyzable": bool(decision.caption_quality.is_analyzable),
-        "caption_quality_issues": _safe_excel_text(_fmt_pipe_join(decision.caption_quality.issues)),
-        "tags_genre": _safe_excel_text(decision.tags.genre),
-        "tags_narrative_labels": _safe_excel_text(_fmt_pipe_join(decision.tags.narrative_labels)),
-        "tags_discourse_moves": _safe_excel_text(_fmt_pipe_join(decision.tags.discourse_moves)),
-        "tags_neoliberal_signals": _safe_excel_text(_fmt_pipe_join(decision.tags.neoliberal_signals)),
-        "eligibility_reasons": _safe_excel_text(_fmt_pipe_join(decision.eligibility_reasons)),
-        "selected_final": bool(selected_final),
-    }
+    # Same order as _ROW_COLUMNS.
+    row = (
+        _safe_excel_text(post_key),
+        _safe_excel_text(url),
+        _safe_excel_text(owner_username),
+        _safe_excel_text(owner_id),
+        _safe_excel_text(caption),
+        _safe_excel_text(_fmt_space_join(hashtags, prefix="#")),
+        _safe_excel_text(_fmt_space_join(mentions, prefix="@")),
+        _safe_excel_text(alt),
+        _safe_excel_text(post_type),
+        _safe_excel_text(product_type),
+        is_sponsored,
+        _safe_excel_text(timestamp),
+        _safe_excel_text(actor_source),
+        _safe_excel_text(fetched_at),
+        _safe_excel_text(decided_at),
+        _safe_excel_text(model),
+        tokens_total,
+        overall_confidence,
+        bool(decision.language.is_english),
+        float(decision.language.confidence),
+        bool(decision.topic.is_bodyweight_calisthenics),
+        float(decision.topic.confidence),
+        _safe_excel_text(decision.topic.topic_notes),
+        bool(decision.commercial.is_exclusively_commercial),
+        _safe_excel_text(_fmt_pipe_join(decision.commercial.signals)),
+        bool(decision.caption_quality.is_analyzable),
+        _safe_excel_text(_fmt_pipe_join(decision.caption_quality.issues)),
+        _safe_excel_text(decision.tags.genre),
+        _safe_excel_text(_fmt_pipe_join(decision.tags.narrative_labels)),
+        _safe_excel_text(_fmt_pipe_join(decision.tags.discourse_moves)),
+        _safe_excel_text(_fmt_pipe_join(decision.tags.neoliberal_signals)),
+        _safe_excel_text(_fmt_pipe_join(decision.eligibility_reasons)),
+        bool(selected_final),
+    )
     return row, decision
 
 
-def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[dict[str, Any]]:
+_ACTOR_RUN_COLUMNS: tuple[str, ...] = ("actor_id", "actor_run_id", "dataset_id", "created_at")
+
+
+def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[tuple[Any, ...]]:
     rid = (run_id or "").strip()
     if not rid:
         return []
 
-    rows = store.conn.execute(
+    cur = store.conn.execute(
         """
         SELECT actor_id, actor_run_id, dataset_id, created_at
         FROM apify_actor_runs
@@ -238,19 +370,119 @@ def _fetch_actor_runs(store: SQLiteStateStore, *, run_id: str) -> list[dict[str,
         ORDER BY created_at ASC, actor_run_id ASC
         """.strip(),
         (rid,),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for r in rows:
-        out.append(
-            {
-                "actor_id": _safe_excel_text(r["actor_id"]),
-                "actor_run_id": _safe_excel_text(r["actor_run_id"]),
-                "dataset_id": _safe_excel_text(r["dataset_id"]),
-                "created_at": _safe_excel_text(r["created_at"]),
-            }
-        )
-    return out
+    )
+    return [tuple(_safe_excel_text(v) for v in r) for r in cur]
+
+
+def _flatten_args(
+    r: tuple[Any, ...],
+    *,
+    selected_final: bool,
+    trust_stored_json: bool,
+) -> tuple[Any, ...]:
+    # Column affinities already give str/int/float values, and these tuples pickle as-is.
+    return (*r, selected_final, trust_stored_json)
+
+
+def _flatten_row_worker(args: tuple[Any, ...]) -> tuple[Any, ...]:
+    (
+        post_key,
+        url,
+        actor_source,
+        fetched_at,
+        raw_json,
+        model,
+        tokens_total,
+        decided_at,
+        overall_confidence,
+        decision_json,
+        selected_final,
+        trust_stored_json,
+    ) = args
+
+    row, _ = _flatten_row(
+        post_key=post_key,
+        url=url,
+        actor_source=actor_source,
+        fetched_at=fetched_at,
+        raw_json=raw_json,
+        model=model,
+        tokens_total=tokens_total,
+        decided_at=decided_at,
+        overall_confidence=overall_confidence,
+        decision_json=decision_json,
+        selected_final=selected_final,
+        trust_stored_json=trust_stored_json,
+    )
+    return row
+
+
+class _FlattenPool:
+    """
+    Lazily started process pool for the CPU-bound JSON parsing in _flatten_row.
+
+    Workers are spawned rather than forked: the exporting process holds an open sqlite3
+    connection and may be running the rejected-sheet prefetch thread. If the pool cannot
+    start or breaks, the remaining rows are flattened serially instead.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._unavailable = False
+
+    def flatten(self, args: list[tuple[Any, ...]]) -> Iterator[tuple[Any, ...]]:
+        """
+        Yield flattened rows in input order, one at a time, so callers can write as they go.
+        """
+        workers = os.cpu_count() or 1
+        if len(args) < _PARALLEL_MIN_ROWS or workers <= 1 or self._unavailable:
+            return map(_flatten_row_worker, args)
+        return self._flatten_parallel(args, workers)
+
+    def _flatten_parallel(self, args: list[tuple[Any, ...]], workers: int) -> Iterator[tuple[Any, ...]]:
+        done = 0
+        try:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            for row in self._executor.map(_flatten_row_worker, args, chunksize=_PARALLEL_CHUNKSIZE):
+                yield row
+                done += 1
+        except (BrokenProcessPool, OSError):
+            self._unavailable = True
+            self.close()
+
+        yield from map(_flatten_row_worker, args[done:])
+
+    def close(self) -> None:
+        if self._executor is not None:
+            try:
+                self._executor.shutdown()
+            except Exception:
+                pass
+            self._executor = None
+
+
+def _append_header(ws: Any, columns: Iterable[str]) -> None:
+    from openpyxl.cell import WriteOnlyCell  # type: ignore[import-not-found]
+    from openpyxl.styles import Font  # type: ignore[import-not-found]
+
+    bold = Font(bold=True)
+    cells = []
+    for name in columns:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = bold
+        cells.append(cell)
+    ws.append(cells)
+
+
+def _new_sheet(wb: Any, name: str, columns: Iterable[str]) -> Any:
+    ws = wb.create_sheet(title=name)
+    ws.freeze_panes = "A2"
+    _append_header(ws, columns)
+    return ws
 
 
 def export_corpus_workbook(
@@ -259,11 +491,18 @@ def export_corpus_workbook(
     out_path: str | Path,
     *,
     run_id: str,
+    trust_stored_json: bool = True,
 ) -> Path:
+    """
+    Write the corpus workbook for a run.
+
+    Stored decisions were validated before they were written, so by default they are rebuilt
+    without re-running pydantic validation; pass trust_stored_json=False to re-validate.
+    """
     try:
-        import pandas as pd  # type: ignore[import-not-found]
+        from openpyxl import Workbook  # type: ignore[import-not-found]
     except Exception as e:
-        raise ExportError("pandas is required for Excel export") from e
+        raise ExportError("openpyxl is required for Excel export") from e
 
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
@@ -273,14 +512,12 @@ def export_corpus_workbook(
     seed = int(config.targets.sampling_seed)
     final_sheet = _final_sheet_name(final_n)
 
-    pool_raw = _fetch_latest_posts_with_decisions(
+    pool_keys = _fetch_latest_post_keys(
         store,
         eligible=True,
         limit=pool_limit,
         order_asc=True,
     )
-
-    pool_keys = [str(r["post_key"]) for r in pool_raw if str(r.get("post_key") or "").strip()]
     pool_sha = pool_keys_sha256(pool_keys)
 
     meta = load_final_sample_meta(store, run_id=run_id)
@@ -295,187 +532,190 @@ def export_corpus_workbook(
             pool_n=pool_limit,
             final_n=final_n,
             persist=len(pool_keys) >= pool_limit,
+            pool_sha256=pool_sha,
         )
 
-    genre_counts: Counter[str] = Counter()
-    narrative_counts: Counter[str] = Counter()
-    discourse_counts: Counter[str] = Counter()
-    neoliberal_counts: Counter[str] = Counter()
     hashtag_counts: Counter[str] = Counter()
-    model_counts: Counter[str] = Counter()
-
-    pool_rows: list[dict[str, Any]] = []
-    for r in pool_raw:
-        post_key = str(r["post_key"])
-        selected = post_key in final_keys
-        row, decision = _flatten_row(
-            post_key=post_key,
-            url=str(r["url"]),
-            actor_source=str(r["actor_source"]) if r["actor_source"] is not None else None,
-            fetched_at=str(r["fetched_at"]),
-            raw_json=str(r["raw_json"]),
-            model=str(r["model"]),
-            tokens_total=int(r["tokens_total"]) if r["tokens_total"] is not None else None,
-            decided_at=str(r["decided_at"]),
-            overall_confidence=float(r["overall_confidence"]),
-            decision_json=str(r["decision_json"]),
-            selected_final=selected,
-        )
-        pool_rows.append(row)
-
-        model_counts[str(r["model"])] += 1
-        genre_counts[str(decision.tags.genre)] += 1
-
-        for lab in decision.tags.narrative_labels:
-            t = (lab or "").strip()
-            if t:
-                narrative_counts[t] += 1
-
-        for mv in decision.tags.discourse_moves:
-            t = (mv or "").strip()
-            if t:
-                discourse_counts[t] += 1
-
-        for sig in decision.tags.neoliberal_signals:
-            t = (sig or "").strip()
-            if t:
-                neoliberal_counts[t] += 1
-
-        hashtags_text = str(row.get("hashtags") or "").strip()
-        if hashtags_text:
-            for token in hashtags_text.split():
-                h = token.lstrip("#").strip()
-                if h:
-                    hashtag_counts[h] += 1
 
-    final_rows = [r for r in pool_rows if bool(r.get("selected_final"))]
+    # Hashed membership for the per-row selected_final check.
+    final_key_set = frozenset(final_keys)
 
     rejected_limit = min(5000, int(config.loop.max_raw_items))
-    rejected_raw = _fetch_latest_posts_with_decisions(
-        store,
-        eligible=False,
-        limit=rejected_limit,
-        order_asc=False,
-    )
 
-    rejected_rows: list[dict[str, Any]] = []
-    for r in rejected_raw:
-        row, _ = _flatten_row(
-            post_key=str(r["post_key"]),
-            url=str(r["url"]),
-            actor_source=str(r["actor_source"]) if r["actor_source"] is not None else None,
-            fetched_at=str(r["fetched_at"]),
-            raw_json=str(r["raw_json"]),
-            model=str(r["model"]),
-            tokens_total=int(r["tokens_total"]) if r["tokens_total"] is not None else None,
-            decided_at=str(r["decided_at"]),
-            overall_confidence=float(r["overall_confidence"]),
-            decision_json=str(r["decision_json"]),
-            selected_final=False,
+    # Write-only workbooks stream each sheet to disk; sheets appear in creation order.
+    wb = Workbook(write_only=True)
+    flattener = _FlattenPool()
+
+    # The rejected sheet is capped, so its rows can be read on a second connection
+    # (WAL allows concurrent readers) while the pool sheet is flattened and written.
+    # This thread is already running when _FlattenPool starts its workers, which is why
+    # the pool spawns them instead of forking this process.
+    prefetch: ThreadPoolExecutor | None = None
+    rejected_future: Future[list[list[Any]]] | None = None
+    rejected_conn = _open_read_only_connection(store)
+    if rejected_conn is not None:
+        prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export-rejected")
+        rejected_future = prefetch.submit(
+            _prefetch_latest_post_batches,
+            rejected_conn,
+            eligible=False,
+            limit=rejected_limit,
+            order_asc=False,
         )
-        rejected_rows.append(row)
 
-    run = store.get_run(run_id)
-
-    versions = run.versions if run is not None else {}
-    versions_json = json.dumps(versions, ensure_ascii=False, sort_keys=True)
-    config_yaml = yaml.safe_dump(
-        config.model_dump(mode="json"),
-        sort_keys=True,
-        allow_unicode=True,
-    )
-
-    schema_version = _db_scalar_int(store, "SELECT MAX(version) FROM schema_migrations")
+    try:
+        ws_final = _new_sheet(wb, final_sheet, _ROW_COLUMNS)
+        ws_pool = _new_sheet(wb, "eligible_pool", _ROW_COLUMNS)
+        ws_rejected = _new_sheet(wb, "rejected", _ROW_COLUMNS)
+
+        pool_written = 0
+        final_written = 0
+        for batch in _iter_latest_post_batches(
+            store.conn,
+            eligible=True,
+            limit=pool_limit,
+            order_asc=True,
+        ):
+            args = [
+                _flatten_args(
+                    r,
+                    selected_final=str(r[0]) in final_key_set,
+                    trust_stored_json=trust_stored_json,
+                )
+                for r in batch
+            ]
+            for row in flattener.flatten(args):
+                ws_pool.append(row)
+                pool_written += 1
+                if row[_SELECTED_COL]:
+                    ws_final.append(row)
+                    final_written += 1
+
+                # split() already drops surrounding whitespace, so only the '#' needs trimming.
+                hashtag_counts.update(
+                    h for token in str(row[_HASHTAGS_COL] or "").split() if (h := token.lstrip("#"))
+                )
+
+        rejected_batches: Iterable[list[Any]]
+        if rejected_future is not None:
+            rejected_batches = rejected_future.result()
+        else:
+            rejected_batches = _iter_latest_post_batches(
+                store.conn,
+                eligible=False,
+                limit=rejected_limit,
+                order_asc=False,
+            )
+
+        rejected_written = 0
+        for batch in rejected_batches:
+            args = [
+                _flatten_args(r, selected_final=False, trust_stored_json=trust_stored_json)
+                for r in batch
+            ]
+            for row in flattener.flatten(args):
+                ws_rejected.append(row)
+                rejected_written += 1
+
+        run = store.get_run(run_id)
+
+        versions = run.versions if run is not None else {}
+        versions_json = json.dumps(versions, ensure_ascii=False, sort_keys=True)
+        config_yaml = yaml.dump(
+            config.model_dump(mode="json"),
+            Dumper=_YamlDumper,
+            sort_keys=True,
+            allow_unicode=True,
+        )
 
-    tokens_used = _db_scalar_int(
-        store,
-        """
-        SELECT COALESCE(SUM(tokens_total), 0)
-        FROM llm_decisions
-        """.strip(),
-    )
+        schema_version = _db_scalar_int(store, "SELECT MAX(version) FROM schema_migrations")
 
-    meta_rows: list[dict[str, Any]] = [
-        {"key": "run_id", "value": _safe_excel_text(run_id)},
-        {"key": "exported_at_utc", "value": _safe_excel_text(_utc_now_iso())},
-        {"key": "sqlite_schema_version", "value": int(schema_version)},
-        {"key": "status_note", "value": _safe_excel_text("See sheets for outputs")},
-        {"key": "targets.final_n", "value": final_n},
-        {"key": "targets.pool_n", "value": pool_limit},
-        {"key": "targets.sampling_seed", "value": seed},
-        {"key": "counts.eligible_in_sheet", "value": len(pool_rows)},
-        {"key": "counts.final_in_sheet", "value": len(final_rows)},
-        {"key": "counts.rejected_in_sheet", "value": len(rejected_rows)},
-        {"key": "limits.rejected_sheet_cap", "value": rejected_limit},
-        {"key": "run.started_at", "value": _safe_excel_text(run.started_at if run is not None else None)},
-        {"key": "run.ended_at", "value": _safe_excel_text(run.ended_at if run is not None else None)},
-        {"key": "run.config_hash", "value": _safe_excel_text(run.config_hash if run is not None else None)},
-        {"key": "run.sampling_seed", "value": run.sampling_seed if run is not None else None},
-        {"key": "versions_json", "value": _safe_excel_text(versions_json)},
-        {"key": "config_yaml", "value": _safe_excel_text(config_yaml)},
-        {"key": "repro.pool_keys_sha256", "value": _safe_excel_text(pool_sha)},
-        {
-            "key": "repro.final_post_keys_json",
-            "value": _safe_excel_text(json.dumps(sorted(final_keys), ensure_ascii=False)),
-        },
-        {"key": "repro.final_sample_recorded", "value": bool(meta is not None)},
-        {"key": "repro.final_sample_recorded_at", "value": _safe_excel_text(meta.created_at if meta is not None else None)},
-        {"key": "counts.llm_tokens_total_all_time", "value": int(tokens_used)},
-        {"key": "output_path", "value": _safe_excel_text(str(out))},
-    ]
-
-    actor_runs = _fetch_actor_runs(store, run_id=run_id)
-
-    tag_rows: list[dict[str, Any]] = []
-    for genre, n in genre_counts.most_common():
-        if (genre or "").strip():
-            tag_rows.append({"kind": "genre", "label": _safe_excel_text(genre), "count": int(n)})
-
-    for lab, n in narrative_counts.most_common(200):
-        if (lab or "").strip():
-            tag_rows.append({"kind": "narrative_label", "label": _safe_excel_text(lab), "count": int(n)})
-
-    for mv, n in discourse_counts.most_common(200):
-        if (mv or "").strip():
-            tag_rows.append({"kind": "discourse_move", "label": _safe_excel_text(mv), "count": int(n)})
-
-    for sig, n in neoliberal_counts.most_common(200):
-        if (sig or "").strip():
-            tag_rows.append({"kind": "neoliberal_signal", "label": _safe_excel_text(sig), "count": int(n)})
-
-    for h, n in hashtag_counts.most_common(200):
-        if (h or "").strip():
-            tag_rows.append({"kind": "hashtag", "label": _safe_excel_text(h), "count": int(n)})
-
-    for m, n in model_counts.most_common():
-        if (m or "").strip():
-            tag_rows.append({"kind": "model", "label": _safe_excel_text(m), "count": int(n)})
-
-    df_final = pd.DataFrame(final_rows)
-    df_pool = pd.DataFrame(pool_rows)
-    df_rejected = pd.DataFrame(rejected_rows)
-    df_meta = pd.DataFrame(meta_rows)
-    df_actor = pd.DataFrame(actor_runs)
-    df_tags = pd.DataFrame(tag_rows)
+        tokens_used = _db_scalar_int(
+            store,
+            """
+            SELECT COALESCE(SUM(tokens_total), 0)
+            FROM llm_decisions
+            """.strip(),
+        )
 
-    try:
-        with pd.ExcelWriter(out, engine="openpyxl") as writer:
-            df_final.to_excel(writer, sheet_name=final_sheet, index=False)
-            df_pool.to_excel(writer, sheet_name="eligible_pool", index=False)
-            df_rejected.to_excel(writer, sheet_name="rejected", index=False)
-
-            df_meta.to_excel(writer, sheet_name="run_metadata", index=False)
-            start = len(df_meta.index) + 2
-            df_actor.to_excel(writer, sheet_name="run_metadata", index=False, startrow=start)
-
-            df_tags.to_excel(writer, sheet_name="tag_summary", index=False)
-
-            wb = writer.book
-            for name in (final_sheet, "eligible_pool", "rejected", "run_metadata", "tag_summary"):
-                if name in wb.sheetnames:
-                    ws = wb[name]
-                    ws.freeze_panes = "A2"
+        # Decision tag and model tallies come straight from SQLite over the same pool window.
+        tag_counts = fetch_pool_tag_counts(store, limit=pool_limit, include_models=True)
+
+        meta_rows: list[tuple[str, Any]] = [
+            ("run_id", _safe_excel_text(run_id)),
+            ("exported_at_utc", _safe_excel_text(_utc_now_iso())),
+            ("sqlite_schema_version", int(schema_version)),
+            ("status_note", _safe_excel_text("See sheets for outputs")),
+            ("targets.final_n", final_n),
+            ("targets.pool_n", pool_limit),
+            ("targets.sampling_seed", seed),
+            ("counts.eligible_in_sheet", pool_written),
+            ("counts.final_in_sheet", final_written),
+            ("counts.rejected_in_sheet", rejected_written),
+            ("counts.invalid_decisions_in_pool", tag_counts.invalid_decisions),
+            ("limits.rejected_sheet_cap", rejected_limit),
+            ("run.started_at", _safe_excel_text(run.started_at if run is not None else None)),
+            ("run.ended_at", _safe_excel_text(run.ended_at if run is not None else None)),
+            ("run.config_hash", _safe_excel_text(run.config_hash if run is not None else None)),
+            ("run.sampling_seed", run.sampling_seed if run is not None else None),
+            ("versions_json", _safe_excel_text(versions_json)),
+            ("config_yaml", _safe_excel_text(config_yaml)),
+            ("repro.pool_keys_sha256", _safe_excel_text(pool_sha)),
+            (
+                "repro.final_post_keys_json",
+                _safe_excel_text(json.dumps(sorted(final_keys), ensure_ascii=False)),
+            ),
+            ("repro.final_sample_recorded", bool(meta is not None)),
+            ("repro.final_sample_recorded_at", _safe_excel_text(meta.created_at if meta is not None else None)),
+            ("counts.llm_tokens_total_all_time", int(tokens_used)),
+            ("output_path", _safe_excel_text(str(out))),
+        ]
+
+        ws_meta = _new_sheet(wb, "run_metadata", ("key", "value"))
+        for meta_row in meta_rows:
+            ws_meta.append(meta_row)
+
+        actor_runs = _fetch_actor_runs(store, run_id=run_id)
+        if actor_runs:
+            ws_meta.append(())
+            _append_header(ws_meta, _ACTOR_RUN_COLUMNS)
+            for actor_row in actor_runs:
+                ws_meta.append(actor_row)
+
+        ws_tags = _new_sheet(wb, "tag_summary", ("kind", "label", "count"))
+
+        for genre, n in tag_counts.genre.most_common():
+            if (genre or "").strip():
+                ws_tags.append(("genre", _safe_excel_text(genre), int(n)))
+
+        for lab, n in tag_counts.narrative_labels.most_common(200):
+            if (lab or "").strip():
+                ws_tags.append(("narrative_label", _safe_excel_text(lab), int(n)))
+
+        for mv, n in tag_counts.discourse_moves.most_common(200):
+            if (mv or "").strip():
+                ws_tags.append(("discourse_move", _safe_excel_text(mv), int(n)))
+
+        for sig, n in tag_counts.neoliberal_signals.most_common(200):
+            if (sig or "").strip():
+                ws_tags.append(("neoliberal_signal", _safe_excel_text(sig), int(n)))
+
+        for h, n in hashtag_counts.most_common(200):
+            if (h or "").strip():
+                ws_tags.append(("hashtag", _safe_excel_text(h), int(n)))
+
+        for m, n in tag_counts.model.most_common():
+            if (m or "").strip():
+                ws_tags.append(("model", _safe_excel_text(m), int(n)))
+
+        wb.save(out)
+    except ExportError:
+        raise
     except Exception as e:
         raise ExportError(f"Failed to write workbook: {out}: {e}") from e
+    finally:
+        flattener.close()
+        if prefetch is not None:
+            prefetch.shutdown()
 
     return out
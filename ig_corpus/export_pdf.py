@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
-from xml.sax.saxutils import escape
+from typing import Any, Callable, Iterable
 
 from .codebook import CodebookData, collect_codebook_data
 from .config_schema import AppConfig
@@ -17,8 +17,75 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _fmt_text(value: Any) -> Any:
+    return value
+
+
+def _fmt_bool(value: Any) -> str:
+    return str(bool(value))
+
+
+def _fmt_int(value: Any) -> str:
+    return str(int(value))
+
+
+def _fmt_float(value: Any) -> str:
+    return str(float(value))
+
+
+_RowSpec = tuple[tuple[str, Callable[[Any], Any], Callable[[Any], Any]], ...]
+
+
+def _row_spec(*rows: tuple[str, str, Callable[[Any], Any]]) -> _RowSpec:
+    return tuple((label, attrgetter(path), fmt) for label, path, fmt in rows)
+
+
+def _spec_rows(spec: _RowSpec, obj: Any) -> list[tuple[str, str]]:
+    return [(label, fmt(get(obj))) for label, get, fmt in spec]
+
+
+# (label, attribute path on AppConfig, formatter) for the "Configuration snapshot" table.
+_CONFIG_ROWS = _row_spec(
+    ("primary_actor", "apify.primary_actor", _fmt_text),
+    ("fallback_actor", "apify.fallback_actor", _fmt_text),
+    ("keyword_search", "apify.keyword_search", _fmt_bool),
+    ("results_limit_per_query", "apify.results_limit_per_query", _fmt_int),
+    ("run_batch_queries", "apify.run_batch_queries", _fmt_int),
+    ("openai_model_primary", "openai.model_primary", _fmt_text),
+    ("openai_model_escalation", "openai.model_escalation", _fmt_text),
+    ("escalation_conf_threshold", "openai.escalation_confidence_threshold", _fmt_float),
+    ("openai_max_concurrent_requests", "openai.max_concurrent_requests", _fmt_int),
+    ("min_caption_chars", "filters.min_caption_chars", _fmt_int),
+    ("max_posts_per_user", "filters.max_posts_per_user", _fmt_int),
+    ("allow_reels", "filters.allow_reels", _fmt_bool),
+    ("reject_if_sponsored_true", "filters.reject_if_sponsored_true", _fmt_bool),
+    ("targets_pool_n", "targets.pool_n", _fmt_int),
+    ("targets_final_n", "targets.final_n", _fmt_int),
+)
+
+# (label, attribute path on CodebookData, formatter) for the "Corpus counts" table.
+_COUNT_ROWS = _row_spec(
+    ("raw_posts_total", "counts.raw_posts", _fmt_int),
+    ("decision_records_total", "counts.decision_records", _fmt_int),
+    ("labeled_posts_distinct", "counts.labeled_posts", _fmt_int),
+    ("eligible_total", "counts.eligible_total", _fmt_int),
+    ("rejected_total", "counts.rejected_total", _fmt_int),
+    ("eligible_in_pool_used", "counts.eligible_in_pool", _fmt_int),
+    ("final_sample_n", "counts.final_sample_n", _fmt_int),
+    ("invalid_decisions_in_pool", "counts.invalid_pool_decisions", _fmt_int),
+)
+
+
+# Same output as xml.sax.saxutils.escape(...).replace("\n", "<br/>"), in one pass.
+_PARAGRAPH_MARKUP = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br/>"})
+
+
+def _paragraph_markup(text: str | None) -> str:
+    return (text or "").translate(_PARAGRAPH_MARKUP)
+
+
 def _p(text: str, style: Any) -> Any:
-    safe = escape(text or "").replace("\n", "<br/>")
+    safe = _paragraph_markup(text)
     return style.__class__(safe, style) if hasattr(style, "__class__") else safe
 
 
@@ -33,6 +100,7 @@ def export_codebook_pdf(
         from reportlab.lib.pagesizes import LETTER
         from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
         from reportlab.lib.units import inch
+        from reportlab.pdfbase.pdfmetrics import stringWidth
         from reportlab.platypus import (
             ListFlowable,
             ListItem,
@@ -75,30 +143,63 @@ def export_codebook_pdf(
     )
 
     def P(text: str, style: Any = body) -> Paragraph:
-        return Paragraph(escape(text or "").replace("\n", "<br/>"), style)
+        return Paragraph(_paragraph_markup(text), style)
 
-    def bullets(items: list[str]) -> ListFlowable:
+    def bullets(items: Iterable[str]) -> ListFlowable:
+        # ListFlowable may iterate its items again when it wraps or splits, so keep a list.
         flow_items = [ListItem(P(i, body), leftIndent=14) for i in items]
         return ListFlowable(flow_items, bulletType="bullet", leftIndent=20)
 
+    # Matches the Table default cell font (Helvetica 10 on 12) for cells that must wrap.
+    table_cell = ParagraphStyle(
+        "TableCell",
+        parent=body,
+        fontSize=10,
+        leading=12,
+    )
+    cell_padding = 8  # LEFTPADDING + RIGHTPADDING in every table below
+
+    def fit_cell(text: str | None, width: float, style: Any) -> Any:
+        # Plain strings skip Paragraph markup parsing; only text that must wrap needs one.
+        s = text or ""
+        if "\n" not in s and stringWidth(s, style.fontName, style.fontSize) <= width - cell_padding:
+            return s
+        return P(s, style)
+
+    # Every table of a kind shares one TableStyle instead of rebuilding the command list.
+    cell_padding_cmds = [
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 3),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ]
+    kv_style = TableStyle(
+        [
+            ("FONT", (0, 0), (-1, -1), body_small.fontName, body_small.fontSize, body_small.leading),
+            ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+            *cell_padding_cmds,
+        ]
+    )
+    grid_style = TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            *cell_padding_cmds,
+        ]
+    )
+
+    kv_widths = (2.1 * inch, 4.7 * inch)
+
     def kv_table(rows: list[tuple[str, str]]) -> Table:
+        key_w, val_w = kv_widths
         tbl = Table(
-            [[P(k, body_small), P(v, body_small)] for k, v in rows],
-            colWidths=[2.1 * inch, 4.7 * inch],
+            [[fit_cell(k, key_w, body_small), fit_cell(v, val_w, body_small)] for k, v in rows],
+            colWidths=list(kv_widths),
             hAlign="LEFT",
         )
-        tbl.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.lightgrey),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
-        )
+        tbl.setStyle(kv_style)
         return tbl
 
     def top_table(title: str, pairs: list[tuple[str, int]], *, limit: int) -> list[Any]:
@@ -107,24 +208,12 @@ def export_codebook_pdf(
             story.append(P("No data available.", body_small))
             return story
 
-        rows = [["label", "count"]]
-        for label, n in pairs[: max(0, int(limit))]:
-            rows.append([label, str(int(n))])
-
-        tbl = Table(rows, colWidths=[5.4 * inch, 1.4 * inch], hAlign="LEFT")
-        tbl.setStyle(
-            TableStyle(
-                [
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
-        )
+        label_w = 5.4 * inch
+        rows: list[list[Any]] = [["label", "count"]]
+        rows.extend([fit_cell(label, label_w, table_cell), str(int(n))] for label, n in pairs[: max(0, int(limit))])
+
+        tbl = Table(rows, colWidths=[label_w, 1.4 * inch], hAlign="LEFT")
+        tbl.setStyle(grid_style)
         story.append(tbl)
         return story
 
@@ -145,33 +234,8 @@ def export_codebook_pdf(
         run_rows.append(("pool_keys_sha256", "not_recorded"))
         run_rows.append(("final_sample_recorded_at", "not_recorded"))
 
-    cfg_rows: list[tuple[str, str]] = [
-        ("primary_actor", config.apify.primary_actor),
-        ("fallback_actor", config.apify.fallback_actor),
-        ("keyword_search", str(bool(config.apify.keyword_search))),
-        ("results_limit_per_query", str(int(config.apify.results_limit_per_query))),
-        ("run_batch_queries", str(int(config.apify.run_batch_queries))),
-        ("openai_model_primary", config.openai.model_primary),
-        ("openai_model_escalation", config.openai.model_escalation),
-        ("escalation_conf_threshold", str(float(config.openai.escalation_confidence_threshold))),
-        ("openai_max_concurrent_requests", str(int(config.openai.max_concurrent_requests))),
-        ("min_caption_chars", str(int(config.filters.min_caption_chars))),
-        ("max_posts_per_user", str(int(config.filters.max_posts_per_user))),
-        ("allow_reels", str(bool(config.filters.allow_reels))),
-        ("reject_if_sponsored_true", str(bool(config.filters.reject_if_sponsored_true))),
-        ("targets_pool_n", str(int(config.targets.pool_n))),
-        ("targets_final_n", str(int(config.targets.final_n))),
-    ]
-
-    count_rows: list[tuple[str, str]] = [
-        ("raw_posts_total", str(int(data.counts.raw_posts))),
-        ("decision_records_total", str(int(data.counts.decision_records))),
-        ("labeled_posts_distinct", str(int(data.counts.labeled_posts))),
-        ("eligible_total", str(int(data.counts.eligible_total))),
-        ("rejected_total", str(int(data.counts.rejected_total))),
-        ("eligible_in_pool_used", str(int(data.counts.eligible_in_pool))),
-        ("final_sample_n", str(int(data.counts.final_sample_n))),
-    ]
+    cfg_rows = _spec_rows(_CONFIG_ROWS, config)
+    count_rows = _spec_rows(_COUNT_ROWS, data)
 
     story: list[Any] = []
     story.append(P("Instagram Corpus Codebook", h1))
@@ -185,7 +249,7 @@ def export_codebook_pdf(
     if run is not None and run.versions:
         versions_lines = "\n".join(f"{k}={v}" for k, v in sorted(run.versions.items()))
         story.append(P("Environment versions", h3))
-        story.append(Paragraph(escape(versions_lines).replace("\n", "<br/>"), mono))
+        story.append(Paragraph(_paragraph_markup(versions_lines), mono))
         story.append(Spacer(1, 8))
 
     overview = build_methods_overview(config, data)
@@ -194,7 +258,7 @@ def export_codebook_pdf(
         story.append(P(para, body))
     if overview.steps:
         story.append(Spacer(1, 4))
-        story.append(bullets(list(overview.steps)))
+        story.append(bullets(overview.steps))
     story.append(Spacer(1, 10))
 
     story.append(P("Configuration snapshot", h2))
@@ -208,11 +272,11 @@ def export_codebook_pdf(
     story.append(P("Operational rules", h2))
     story.append(P("Include posts only if all inclusion criteria are satisfied.", body))
     story.append(P("Inclusion criteria", h3))
-    story.append(bullets(list(data.inclusion_rules)))
+    story.append(bullets(data.inclusion_rules))
     story.append(Spacer(1, 6))
 
     story.append(P("Common exclusions", h3))
-    story.append(bullets(list(data.exclusion_rules)))
+    story.append(bullets(data.exclusion_rules))
     story.append(Spacer(1, 10))
 
     story.append(P("Tag fields", h2))
@@ -224,7 +288,7 @@ def export_codebook_pdf(
     story.append(Spacer(1, 8))
 
     story.append(P("Genre values", h3))
-    story.append(bullets([f"`{g}`" for g in data.genre_values]))
+    story.append(bullets(f"`{g}`" for g in data.genre_values))
     story.append(PageBreak())
 
     story.append(P("Summary statistics (eligible pool)", h2))
@@ -245,27 +309,21 @@ def export_codebook_pdf(
     if not data.actor_runs:
         story.append(P("No actor runs were recorded for this run_id.", body_small))
     else:
-        runs_rows = [["actor_id", "actor_run_id", "dataset_id", "created_at"]]
-        for r in data.actor_runs[:200]:
-            runs_rows.append([r.actor_id, r.actor_run_id, r.dataset_id, r.created_at])
+        runs_widths = (2.0 * inch, 1.4 * inch, 1.6 * inch, 1.8 * inch)
+        runs_rows: list[list[Any]] = [["actor_id", "actor_run_id", "dataset_id", "created_at"]]
+        runs_rows.extend(
+            [
+                fit_cell(v, w, table_cell)
+                for v, w in zip((r.actor_id, r.actor_run_id, r.dataset_id, r.created_at), runs_widths)
+            ]
+            for r in data.actor_runs[:200]
+        )
         tbl = Table(
             runs_rows,
-            colWidths=[2.0 * inch, 1.4 * inch, 1.6 * inch, 1.8 * inch],
+            colWidths=list(runs_widths),
             hAlign="LEFT",
         )
-        tbl.setStyle(
-            TableStyle(
-                [
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
-        )
+        tbl.setStyle(grid_style)
         story.append(tbl)
 
     doc = SimpleDocTemplate(
@@ -5,7 +5,8 @@ import json
 import random
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Sequence
+from itertools import chain, islice
+from typing import Iterable, Sequence
 
 from .errors import StorageError
 from .storage import SQLiteStateStore
@@ -15,23 +16,59 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _sha256_bytes(payload: bytes) -> str:
-    return hashlib.sha256(payload).hexdigest()
+_HASH_CHUNK_KEYS = 4096
 
+_POOL_KEYS_SQL = """
+SELECT p.post_key
+FROM raw_posts p
+JOIN latest_llm_decisions d
+  ON d.post_key = p.post_key
+WHERE d.eligible = 1
+ORDER BY d.created_at ASC, d.post_key ASC
+LIMIT ?
+""".strip()
 
-def pool_keys_sha256(pool_keys: Sequence[str]) -> str:
+_LOAD_META_SQL = """
+SELECT run_id, sampling_seed, pool_n, final_n, pool_keys_sha256, created_at
+FROM final_sample_runs
+WHERE run_id = ?
+""".strip()
+
+_LOAD_KEYS_SQL = """
+SELECT post_key
+FROM final_samples
+WHERE run_id = ?
+""".strip()
+
+_INSERT_META_SQL = """
+INSERT OR IGNORE INTO final_sample_runs(
+  run_id, sampling_seed, pool_n, final_n, pool_keys_sha256, created_at
+) VALUES (?, ?, ?, ?, ?, ?)
+""".strip()
+
+# Two bound parameters per row keeps each statement under SQLite's legacy 999-variable limit.
+_FINAL_SAMPLE_INSERT_ROWS = 400
+
+
+def pool_keys_sha256(pool_keys: Iterable[str]) -> str:
     """
     Hash the ordered pool key list used for sampling.
 
     The order matters because sampling is performed over the ordered pool.
+    The digest is sha256 over the compact JSON array of keys (ensure_ascii=False),
+    fed in chunks so the whole document is never held in memory at once.
     """
-    payload = json.dumps(
-        list(pool_keys),
-        ensure_ascii=False,
-        sort_keys=False,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    return _sha256_bytes(payload)
+    h = hashlib.sha256(b"[")
+    it = iter(pool_keys)
+    sep = b""
+    while chunk := list(islice(it, _HASH_CHUNK_KEYS)):
+        # A compact JSON array minus its brackets is exactly the comma-joined elements.
+        body = json.dumps(chunk, ensure_ascii=False, separators=(",", ":"))[1:-1]
+        h.update(sep)
+        h.update(body.encode("utf-8"))
+        sep = b","
+    h.update(b"]")
+    return h.hexdigest()
 
 
 def pick_final_keys(pool_keys: Sequence[str], *, final_n: int, seed: int) -> set[str]:
@@ -40,7 +77,9 @@ def pick_final_keys(pool_keys: Sequence[str], *, final_n: int, seed: int) -> set
 
     n = min(int(final_n), len(pool_keys))
     rng = random.Random(int(seed))
-    chosen = rng.sample(list(pool_keys), k=n)
+    # random.sample accepts any Sequence; only copy inputs that are not one.
+    population = pool_keys if isinstance(pool_keys, Sequence) else list(pool_keys)
+    chosen = rng.sample(population, k=n)
     return set(chosen)
 
 
@@ -48,23 +87,10 @@ def fetch_eligible_pool_keys(store: SQLiteStateStore, *, limit: int) -> list[str
     if limit <= 0:
         return []
 
-    rows = store.conn.execute(
-        """
-        SELECT p.post_key
-        FROM raw_posts p
-        JOIN latest_llm_decisions d
-          ON d.post_key = p.post_key
-        WHERE d.eligible = 1
-        ORDER BY d.created_at ASC, p.post_key ASC
-        LIMIT ?
-        """.strip(),
-        (int(limit),),
-    ).fetchall()
-
-    out: list[str] = []
-    for r in rows:
-        out.append(str(r["post_key"]))
-    return out
+    cur = store.conn.execute(_POOL_KEYS_SQL, (int(limit),))
+    # The latest-decision view yields one row per key; dedupe anyway so the ordered
+    # pool (and its hash) can never carry a repeated key into sampling.
+    return list(dict.fromkeys(k for (k,) in cur))
 
 
 @dataclass(frozen=True)
@@ -82,25 +108,20 @@ def load_final_sample_meta(store: SQLiteStateStore, *, run_id: str) -> FinalSamp
     if not rid:
         raise ValueError("run_id must be non-empty")
 
-    row = store.conn.execute(
-        """
-        SELECT run_id, sampling_seed, pool_n, final_n, pool_keys_sha256, created_at
-        FROM final_sample_runs
-        WHERE run_id = ?
-        """.strip(),
-        (rid,),
-    ).fetchone()
+    row = store.conn.execute(_LOAD_META_SQL, (rid,)).fetchone()
 
     if row is None:
         return None
 
+    # Columns are NOT NULL TEXT/INTEGER, so sqlite3 already returns str/int values.
+    run_id_v, sampling_seed, pool_n, final_n, pool_sha, created_at = row
     return FinalSampleMeta(
-        run_id=str(row["run_id"]),
-        sampling_seed=int(row["sampling_seed"]),
-        pool_n=int(row["pool_n"]),
-        final_n=int(row["final_n"]),
-        pool_keys_sha256=str(row["pool_keys_sha256"]),
-        created_at=str(row["created_at"]),
+        run_id=run_id_v,
+        sampling_seed=sampling_seed,
+        pool_n=pool_n,
+        final_n=final_n,
+        pool_keys_sha256=pool_sha,
+        created_at=created_at,
     )
 
 
@@ -109,16 +130,8 @@ def load_final_sample_keys(store: SQLiteStateStore, *, run_id: str) -> set[str]:
     if not rid:
         raise ValueError("run_id must be non-empty")
 
-    rows = store.conn.execute(
-        """
-        SELECT post_key
-        FROM final_samples
-        WHERE run_id = ?
-        """.strip(),
-        (rid,),
-    ).fetchall()
-
-    return {str(r["post_key"]) for r in rows}
+    cur = store.conn.execute(_LOAD_KEYS_SQL, (rid,))
+    return {k for (k,) in cur}
 
 
 def ensure_final_sample(
@@ -130,12 +143,14 @@ def ensure_final_sample(
     pool_n: int,
     final_n: int,
     persist: bool,
+    pool_sha256: str | None = None,
 ) -> tuple[set[str], FinalSampleMeta | None]:
     """
     Return final sample keys for a run, optionally persisting if missing.
 
     If a persisted sample exists, it is always used.
     If persistence is requested and the stored meta conflicts, StorageError is raised.
+    Callers that already hashed `pool_keys` can pass `pool_sha256` to skip rehashing.
     """
     rid = (run_id or "").strip()
     if not rid:
@@ -150,7 +165,7 @@ def ensure_final_sample(
     if not persist:
         return keys, None
 
-    actual_pool_sha = pool_keys_sha256(pool_keys)
+    actual_pool_sha = pool_sha256 or pool_keys_sha256(pool_keys)
     meta = FinalSampleMeta(
         run_id=rid,
         sampling_seed=int(sampling_seed),
@@ -162,12 +177,8 @@ def ensure_final_sample(
 
     try:
         with store.conn:
-            store.conn.execute(
-                """
-                INSERT OR IGNORE INTO final_sample_runs(
-                  run_id, sampling_seed, pool_n, final_n, pool_keys_sha256, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """.strip(),
+            cur = store.conn.execute(
+                _INSERT_META_SQL,
                 (
                     meta.run_id,
                     meta.sampling_seed,
@@ -177,17 +188,24 @@ def ensure_final_sample(
                     meta.created_at,
                 ),
             )
-
-            store.conn.executemany(
-                """
-                INSERT OR IGNORE INTO final_samples(run_id, post_key)
-                VALUES (?, ?)
-                """.strip(),
-                [(meta.run_id, k) for k in sorted(keys)],
-            )
+            # An ignored insert means another writer recorded this run first; its keys stand.
+            inserted = cur.rowcount == 1
+
+            if inserted:
+                ordered = sorted(keys)
+                for i in range(0, len(ordered), _FINAL_SAMPLE_INSERT_ROWS):
+                    batch = ordered[i : i + _FINAL_SAMPLE_INSERT_ROWS]
+                    store.conn.execute(
+                        "INSERT OR IGNORE INTO final_samples(run_id, post_key) VALUES "
+                        + ",".join(["(?, ?)"] * len(batch)),
+                        tuple(chain.from_iterable((meta.run_id, k) for k in batch)),
+                    )
     except Exception as e:
         raise StorageError(f"Failed to persist final sample: {e}") from e
 
+    if inserted:
+        return keys, meta
+
     stored = load_final_sample_meta(store, run_id=rid)
     if stored is None:
         raise StorageError("Failed to read final sample metadata after insert")
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any, Protocol, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Protocol, Sequence
 
 from openai import OpenAI
 
 from .config_schema import OpenAIConfig
+from .eligibility import compute_structured_eligibility
 from .errors import LLMError
-from .llm_schema import DECISION_JSON_SCHEMA, DECISION_SCHEMA_NAME, LLMDecision
+from .llm_cache import LLMResponseCache, LRUCache
+from .llm_schema import (
+    DECISION_JSON_SCHEMA,
+    DECISION_LIST_JSON_SCHEMA,
+    DECISION_LIST_SCHEMA_NAME,
+    DECISION_SCHEMA_NAME,
+    SCREEN_JSON_SCHEMA,
+    SCREEN_SCHEMA_NAME,
+    LLMDecision,
+    LLMDecisionList,
+)
 from .openai_retry import is_retryable_openai_exception
+from .rate_limit import RateLimiter
 from .retry import OnRetryFn, RetryConfig, SleepFn, call_with_retries
 
 
@@ -57,6 +69,64 @@ _TEXT_FORMAT: dict[str, Any] = {
     }
 }
 
+_GROUP_INSTRUCTIONS = (
+    _SYSTEM_INSTRUCTIONS
+    + """
+The input is a JSON array of posts. Judge each post independently and return {"decisions": [...]}
+with exactly one decision per post, in the same order as the input.
+"""
+)
+
+_GROUP_TEXT_FORMAT: dict[str, Any] = {
+    "format": {
+        "type": "json_schema",
+        "name": DECISION_LIST_SCHEMA_NAME,
+        "strict": True,
+        "schema": DECISION_LIST_JSON_SCHEMA,
+    }
+}
+
+_SCREEN_INSTRUCTIONS = (
+    _SYSTEM_INSTRUCTIONS
+    + """
+This is a screening pass: the schema omits tags. Fill every other field as usual.
+"""
+)
+
+_SCREEN_TEXT_FORMAT: dict[str, Any] = {
+    "format": {
+        "type": "json_schema",
+        "name": SCREEN_SCHEMA_NAME,
+        "strict": True,
+        "schema": SCREEN_JSON_SCHEMA,
+    }
+}
+
+# Stored with screened rejects in place of tags the model was not asked for.
+_UNTAGGED: dict[str, Any] = {
+    "genre": "other",
+    "narrative_labels": [],
+    "discourse_moves": [],
+    "neoliberal_signals": [],
+}
+
+
+def _parse_screen_output(raw: str) -> LLMDecision:
+    return LLMDecision.model_validate({**json.loads(raw), "tags": _UNTAGGED})
+
+
+@dataclass(frozen=True)
+class _Prompt:
+    instructions: str
+    text_format: dict[str, Any]
+    # Parses an output under this prompt's schema; raises when the output is unusable.
+    parse: Callable[[str], Any]
+
+
+_SINGLE_PROMPT = _Prompt(_SYSTEM_INSTRUCTIONS, _TEXT_FORMAT, LLMDecision.model_validate_json)
+_GROUP_PROMPT = _Prompt(_GROUP_INSTRUCTIONS, _GROUP_TEXT_FORMAT, LLMDecisionList.model_validate_json)
+_SCREEN_PROMPT = _Prompt(_SCREEN_INSTRUCTIONS, _SCREEN_TEXT_FORMAT, _parse_screen_output)
+
 _DEFAULT_OPENAI_RETRY = RetryConfig(
     # 1 try + 5 retries
     max_attempts=6,
@@ -67,6 +137,9 @@ _DEFAULT_OPENAI_RETRY = RetryConfig(
 )
 
 
+_USER_MESSAGE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 @dataclass(frozen=True)
 class PostForLLM:
     url: str
@@ -80,19 +153,113 @@ class PostForLLM:
     timestamp: str | None = None
 
 
-def _build_user_message(post: PostForLLM) -> str:
-    payload = {
+def _post_payload(post: PostForLLM) -> dict[str, Any]:
+    # tuple() returns normalized (tuple) fields as-is and () is a constant, so the common
+    # case copies nothing; the encoder writes tuples as JSON arrays.
+    return {
         "url": post.url,
         "caption": post.caption,
-        "hashtags": list(post.hashtags or []),
-        "mentions": list(post.mentions or []),
+        "hashtags": tuple(post.hashtags or ()),
+        "mentions": tuple(post.mentions or ()),
         "alt": post.alt,
         "type": post.type,
         "productType": post.product_type,
         "isSponsored": post.is_sponsored,
         "timestamp": post.timestamp,
     }
-    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_user_message(post: PostForLLM) -> str:
+    return _USER_MESSAGE_ENCODER.encode(_post_payload(post))
+
+
+def _content_key(post: PostForLLM) -> str:
+    # Everything the model judges except url and timestamp, with caption whitespace and
+    # hashtag/mention order normalized, so verbatim reposts share one key.
+    return _USER_MESSAGE_ENCODER.encode(
+        (
+            " ".join((post.caption or "").split()),
+            sorted({h.casefold() for h in post.hashtags or ()}),
+            sorted({m.casefold() for m in post.mentions or ()}),
+            post.alt,
+            post.type,
+            post.product_type,
+            post.is_sponsored,
+        )
+    )
+
+
+def _build_group_message(posts: Sequence[PostForLLM]) -> str:
+    return _USER_MESSAGE_ENCODER.encode([_post_payload(post) for post in posts])
+
+
+def _response_request(
+    *,
+    model: str,
+    user_message: str,
+    max_output_tokens: int,
+    prompt: _Prompt = _SINGLE_PROMPT,
+) -> dict[str, Any]:
+    # Shared by live calls and Batch API lines so both paths send identical requests.
+    return {
+        "model": model,
+        "instructions": prompt.instructions,
+        "input": [
+            {"role": "user", "content": user_message},
+        ],
+        "text": prompt.text_format,
+        "max_output_tokens": int(max_output_tokens),
+    }
+
+
+def _estimate_request_tokens(
+    user_message: str,
+    *,
+    max_output_tokens: int,
+    prompt: _Prompt = _SINGLE_PROMPT,
+) -> int:
+    # ~4 characters per token for the prompt, plus the full output allowance; the unused
+    # part is refunded once the response reports its actual usage.
+    prompt_chars = len(prompt.instructions) + len(user_message)
+    return prompt_chars // 4 + int(max_output_tokens)
+
+
+def _split_tokens(total: int | None, n: int) -> list[int | None]:
+    # Spread a shared request's usage over its posts so per-decision totals still add up.
+    if total is None:
+        return [None] * n
+    share, extra = divmod(int(total), n)
+    return [share + (1 if i < extra else 0) for i in range(n)]
+
+
+def _is_cacheable_output(response: Any, raw: str, prompt: _Prompt) -> bool:
+    """
+    Only complete outputs that parse under the prompt's schema are worth replaying.
+
+    Empty, truncated, or invalid outputs would otherwise be replayed on every rerun.
+    """
+    status = getattr(response, "status", None)
+    if isinstance(status, str) and status != "completed":
+        return False
+    try:
+        prompt.parse(raw)
+    except Exception:
+        return False
+    return True
+
+
+def _sum_tokens(*parts: int | None) -> int | None:
+    known = [p for p in parts if p is not None]
+    return sum(known) if known else None
+
+
+def _rate_limiter_from_config(cfg: OpenAIConfig) -> RateLimiter | None:
+    if cfg.max_requests_per_minute is None and cfg.max_tokens_per_minute is None:
+        return None
+    return RateLimiter(
+        requests_per_minute=cfg.max_requests_per_minute,
+        tokens_per_minute=cfg.max_tokens_per_minute,
+    )
 
 
 def _extract_output_text(response: Any) -> str:
@@ -100,9 +267,10 @@ def _extract_output_text(response: Any) -> str:
     if direct:
         return direct
 
-    output = getattr(response, "output", None) or []
+    # Empty tuples are constants, so missing attributes cost no allocation.
+    output = getattr(response, "output", None) or ()
     for item in output:
-        content = getattr(item, "content", None) or []
+        content = getattr(item, "content", None) or ()
         for part in content:
             text = getattr(part, "text", None)
             if isinstance(text, str) and text.strip():
@@ -152,6 +320,9 @@ class OpenAIPostClassifier:
         retry: RetryConfig | None = None,
         on_retry: OnRetryFn | None = None,
         sleep_fn: SleepFn | None = None,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: LLMResponseCache | None = None,
+        content_cache: LRUCache[str, tuple[LLMDecision, str]] | None = None,
     ) -> None:
         key = (api_key or "").strip()
         if not key:
@@ -159,9 +330,21 @@ class OpenAIPostClassifier:
 
         self._api_key = key
         self._cfg = openai_cfg
-        self._retry = retry or _DEFAULT_OPENAI_RETRY
+        self._retry = retry or replace(_DEFAULT_OPENAI_RETRY, max_attempts=openai_cfg.max_attempts)
         self._on_retry = on_retry
         self._sleep_fn = sleep_fn
+        self._rate_limiter = rate_limiter if rate_limiter is not None else _rate_limiter_from_config(openai_cfg)
+
+        # A cache opened from config belongs to this instance; forks borrow it.
+        self._owns_cache = False
+        if response_cache is None and openai_cfg.response_cache_path is not None:
+            response_cache = LLMResponseCache.open(openai_cfg.response_cache_path)
+            self._owns_cache = True
+        self._response_cache = response_cache
+
+        if content_cache is None and openai_cfg.content_cache_size > 0:
+            content_cache = LRUCache(openai_cfg.content_cache_size)
+        self._content_cache = content_cache
 
         # Disable SDK-level retries because we implement retries with jitter here.
         if client is not None:
@@ -174,7 +357,7 @@ class OpenAIPostClassifier:
         Create a new classifier instance with the same configuration.
 
         This is intended for running concurrent labeling without sharing an underlying HTTP
-        client across threads.
+        client across threads. The rate limiter and both caches are shared across forks.
         """
         return OpenAIPostClassifier(
             self._api_key,
@@ -182,6 +365,9 @@ class OpenAIPostClassifier:
             retry=self._retry,
             on_retry=self._on_retry,
             sleep_fn=self._sleep_fn,
+            rate_limiter=self._rate_limiter,
+            response_cache=self._response_cache,
+            content_cache=self._content_cache,
         )
 
     def close(self) -> None:
@@ -192,6 +378,10 @@ class OpenAIPostClassifier:
             except Exception:
                 pass
 
+        if self._owns_cache and self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+
     def _escalation_model(self) -> str | None:
         primary = (self._cfg.model_primary or "").strip()
         escalation = (self._cfg.model_escalation or "").strip()
@@ -199,17 +389,43 @@ class OpenAIPostClassifier:
             return None
         return escalation
 
-    def _call_raw(self, *, model: str, post: PostForLLM) -> tuple[str, int | None]:
+    def _call_raw(
+        self,
+        *,
+        model: str,
+        post: PostForLLM,
+        user_message: str,
+        prompt: _Prompt = _SINGLE_PROMPT,
+    ) -> tuple[str, int | None]:
+        request = _response_request(
+            model=model,
+            user_message=user_message,
+            max_output_tokens=self._cfg.max_output_tokens,
+            prompt=prompt,
+        )
+
+        cache = self._response_cache
+        if cache is not None:
+            cached = cache.get(request)
+            if cached is not None:
+                # A replay makes no request, so it spends no tokens.
+                return cached[0], 0
+
+        limiter = self._rate_limiter
+        timeout = self._cfg.request_timeout_seconds
+        estimated_tokens = _estimate_request_tokens(
+            user_message,
+            max_output_tokens=self._cfg.max_output_tokens,
+            prompt=prompt,
+        )
+
         def _do_call() -> Any:
-            return self._client.responses.create(
-                model=model,
-                instructions=_SYSTEM_INSTRUCTIONS,
-                input=[
-                    {"role": "user", "content": _build_user_message(post)},
-                ],
-                text=_TEXT_FORMAT,
-                max_output_tokens=self._cfg.max_output_tokens,
-            )
+            # Every attempt is a request against the account limits, retries included.
+            if limiter is not None:
+                limiter.acquire(estimated_tokens)
+            if timeout is None:
+                return self._client.responses.create(**request)
+            return self._client.responses.create(**request, timeout=timeout)
 
         try:
             response = call_with_retries(
@@ -224,7 +440,14 @@ class OpenAIPostClassifier:
         except Exception as e:
             raise LLMError(f"OpenAI call failed ({model}): {e}") from e
 
-        return _extract_output_text(response), _extract_total_tokens(response)
+        total_tokens = _extract_total_tokens(response)
+        if limiter is not None and total_tokens is not None:
+            limiter.refund(estimated_tokens - total_tokens)
+
+        raw = _extract_output_text(response)
+        if cache is not None and _is_cacheable_output(response, raw, prompt):
+            cache.put(request, raw=raw, total_tokens=total_tokens)
+        return raw, total_tokens
 
     def _parse_decision(self, raw: str, *, model: str) -> LLMDecision:
         try:
@@ -232,41 +455,145 @@ class OpenAIPostClassifier:
         except Exception as e:
             raise LLMError(f"Failed to parse structured output ({model}): {e}") from e
 
-    def _classify_internal(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
-        if not (post.url or "").strip():
-            raise ValueError("post.url must be non-empty")
-
+    def _primary_model(self) -> str:
         primary_model = (self._cfg.model_primary or "").strip()
         if not primary_model:
             raise ValueError("openai_cfg.model_primary must be non-empty")
+        return primary_model
 
+    def _escalate(
+        self,
+        post: PostForLLM,
+        *,
+        user_message: str,
+        model: str,
+    ) -> tuple[LLMDecision, str, int | None]:
+        raw, tokens_total = self._call_raw(model=model, post=post, user_message=user_message)
+        return self._parse_decision(raw, model=model), model, tokens_total
+
+    def _accept_or_escalate(
+        self,
+        post: PostForLLM,
+        *,
+        user_message: str,
+        decision: LLMDecision,
+        primary_model: str,
+        tokens_total: int | None,
+    ) -> tuple[LLMDecision, str, int | None]:
         escalation_model = self._escalation_model()
+        if (
+            escalation_model is not None
+            and decision.overall_confidence < self._cfg.escalation_confidence_threshold
+        ):
+            return self._escalate(post, user_message=user_message, model=escalation_model)
+
+        return decision, primary_model, tokens_total
 
-        raw_primary, tok_primary = self._call_raw(model=primary_model, post=post)
+    def _resolve_primary(
+        self,
+        post: PostForLLM,
+        *,
+        user_message: str,
+        primary_model: str,
+        raw_primary: str,
+        tok_primary: int | None,
+    ) -> tuple[LLMDecision, str, int | None]:
         try:
             decision_primary = self._parse_decision(raw_primary, model=primary_model)
         except LLMError:
+            escalation_model = self._escalation_model()
             if escalation_model is None:
                 raise
-            raw_escalation, tok_escalation = self._call_raw(model=escalation_model, post=post)
-            return (
-                self._parse_decision(raw_escalation, model=escalation_model),
-                escalation_model,
-                tok_escalation,
-            )
+            return self._escalate(post, user_message=user_message, model=escalation_model)
+
+        return self._accept_or_escalate(
+            post,
+            user_message=user_message,
+            decision=decision_primary,
+            primary_model=primary_model,
+            tokens_total=tok_primary,
+        )
 
-        if (
-            escalation_model is not None
-            and decision_primary.overall_confidence < self._cfg.escalation_confidence_threshold
-        ):
-            raw_escalation, tok_escalation = self._call_raw(model=escalation_model, post=post)
-            return (
-                self._parse_decision(raw_escalation, model=escalation_model),
-                escalation_model,
-                tok_escalation,
-            )
+    def _screen(
+        self,
+        post: PostForLLM,
+        *,
+        user_message: str,
+        model: str,
+    ) -> tuple[LLMDecision | None, int | None]:
+        """
+        Run the tag-free screening call; return a decision only for settled rejects.
 
-        return decision_primary, primary_model, tok_primary
+        A reject is settled when it is confident and the structured rules agree with it, so
+        enforce_structured_eligibility() can never flip it to an (untagged) accept.
+        """
+        raw, tokens_total = self._call_raw(
+            model=model,
+            post=post,
+            user_message=user_message,
+            prompt=_SCREEN_PROMPT,
+        )
+        try:
+            decision = _parse_screen_output(raw)
+        except Exception:
+            return None, tokens_total
+
+        settled = (
+            not decision.eligible
+            and decision.overall_confidence >= self._cfg.escalation_confidence_threshold
+            and not compute_structured_eligibility(decision)[0]
+        )
+        if not settled:
+            return None, tokens_total
+
+        reasons = [*decision.eligibility_reasons, "screened_reject"]
+        return decision.model_copy(update={"eligibility_reasons": reasons}), tokens_total
+
+    def _classify_internal(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
+        if not (post.url or "").strip():
+            raise ValueError("post.url must be non-empty")
+
+        cache = self._content_cache
+        if cache is None:
+            return self._classify_uncached(post)
+
+        key = _content_key(post)
+        hit = cache.get(key)
+        if hit is not None:
+            # Reused from an identical post earlier in this process; nothing was spent.
+            decision, model_used = hit
+            return decision, model_used, 0
+
+        decision, model_used, tokens_total = self._classify_uncached(post)
+        cache.put(key, (decision, model_used))
+        return decision, model_used, tokens_total
+
+    def _classify_uncached(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
+        primary_model = self._primary_model()
+
+        # Encoded once and reused across retries and the escalation call.
+        user_message = _build_user_message(post)
+
+        tok_screen: int | None = None
+        if self._cfg.screen_rejects:
+            screened, tok_screen = self._screen(post, user_message=user_message, model=primary_model)
+            if screened is not None:
+                return screened, primary_model, tok_screen
+
+        raw_primary, tok_primary = self._call_raw(
+            model=primary_model,
+            post=post,
+            user_message=user_message,
+        )
+        decision, model_used, tokens_total = self._resolve_primary(
+            post,
+            user_message=user_message,
+            primary_model=primary_model,
+            raw_primary=raw_primary,
+            tok_primary=tok_primary,
+        )
+        # A screen that did not settle the post was still paid for.
+        return decision, model_used, _sum_tokens(tok_screen, tokens_total)
 
     def classify(self, post: PostForLLM) -> LLMDecision:
         decision, _, _ = self._classify_internal(post)
@@ -274,3 +601,150 @@ class OpenAIPostClassifier:
 
     def classify_with_metadata(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
         return self._classify_internal(post)
+
+    def classify_from_primary_output(
+        self,
+        post: PostForLLM,
+        *,
+        raw_primary: str,
+        tokens_total: int | None,
+    ) -> tuple[LLMDecision, str, int | None]:
+        """
+        Finish labeling from a primary-model output obtained elsewhere (e.g. the Batch API).
+
+        Parsing and escalation follow the same rules as classify_with_metadata().
+        """
+        if not (post.url or "").strip():
+            raise ValueError("post.url must be non-empty")
+
+        decision, model_used, tokens = self._resolve_primary(
+            post,
+            user_message=_build_user_message(post),
+            primary_model=self._primary_model(),
+            raw_primary=raw_primary,
+            tok_primary=tokens_total,
+        )
+        if self._content_cache is not None:
+            self._content_cache.put(_content_key(post), (decision, model_used))
+        return decision, model_used, tokens
+
+    def cached_result(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None] | None:
+        """
+        Answer a post from the content or response cache without a primary request.
+
+        Returns None on a miss. Hits record 0 tokens; a replayed primary output is still
+        escalated like classify_from_primary_output().
+        """
+        cache = self._content_cache
+        if cache is not None:
+            hit = cache.get(_content_key(post))
+            if hit is not None:
+                return hit[0], hit[1], 0
+
+        if self._response_cache is None:
+            return None
+        request = _response_request(
+            model=self._primary_model(),
+            user_message=_build_user_message(post),
+            max_output_tokens=self._cfg.max_output_tokens,
+        )
+        cached = self._response_cache.get(request)
+        if cached is None:
+            return None
+        return self.classify_from_primary_output(post, raw_primary=cached[0], tokens_total=0)
+
+    def remember_primary_output(
+        self,
+        post: PostForLLM,
+        *,
+        raw_primary: str,
+        tokens_total: int | None,
+    ) -> None:
+        """
+        Store a primary-model output obtained elsewhere under the live request's cache key.
+        """
+        cache = self._response_cache
+        if cache is None or not _is_cacheable_output(None, raw_primary, _SINGLE_PROMPT):
+            return
+        request = _response_request(
+            model=self._primary_model(),
+            user_message=_build_user_message(post),
+            max_output_tokens=self._cfg.max_output_tokens,
+        )
+        cache.put(request, raw=raw_primary, total_tokens=tokens_total)
+
+    def classify_group_with_metadata(
+        self,
+        posts: Sequence[PostForLLM],
+    ) -> list[tuple[LLMDecision, str, int | None]]:
+        """
+        Label several posts with one primary-model request, returning results in input order.
+
+        Posts already in the content cache are answered from it and left out of the request.
+        Each decision is escalated on its own when its confidence is low. If the grouped
+        output cannot be parsed or does not hold one decision per post, every post falls back
+        to classify_with_metadata() and the failed request's tokens are spread over them.
+        """
+        if len(posts) <= 1:
+            return [self._classify_internal(post) for post in posts]
+
+        for post in posts:
+            if not (post.url or "").strip():
+                raise ValueError("post.url must be non-empty")
+
+        cache = self._content_cache
+        if cache is None:
+            return self._classify_group_uncached(posts)
+
+        keys = [_content_key(post) for post in posts]
+        results: list[tuple[LLMDecision, str, int | None] | None] = []
+        for key in keys:
+            hit = cache.get(key)
+            results.append(None if hit is None else (hit[0], hit[1], 0))
+
+        pending = [i for i, res in enumerate(results) if res is None]
+        if len(pending) == 1:
+            results[pending[0]] = self._classify_internal(posts[pending[0]])
+        elif pending:
+            fresh = self._classify_group_uncached([posts[i] for i in pending])
+            for i, res in zip(pending, fresh):
+                results[i] = res
+                cache.put(keys[i], (res[0], res[1]))
+
+        return [res for res in results if res is not None]
+
+    def _classify_group_uncached(
+        self,
+        posts: Sequence[PostForLLM],
+    ) -> list[tuple[LLMDecision, str, int | None]]:
+        primary_model = self._primary_model()
+        raw, tokens_total = self._call_raw(
+            model=primary_model,
+            post=posts[0],
+            user_message=_build_group_message(posts),
+            prompt=_GROUP_PROMPT,
+        )
+        shares = _split_tokens(tokens_total, len(posts))
+
+        try:
+            decisions = LLMDecisionList.model_validate_json(raw).decisions
+        except Exception:
+            decisions = []
+        if len(decisions) != len(posts):
+            # The unusable grouped request was still paid for.
+            out: list[tuple[LLMDecision, str, int | None]] = []
+            for post, share in zip(posts, shares):
+                decision, model_used, tok = self._classify_internal(post)
+                out.append((decision, model_used, _sum_tokens(share, tok)))
+            return out
+
+        return [
+            self._accept_or_escalate(
+                post,
+                user_message=_build_user_message(post),
+                decision=decision,
+                primary_model=primary_model,
+                tokens_total=share,
+            )
+            for post, decision, share in zip(posts, decisions, shares)
+        ]
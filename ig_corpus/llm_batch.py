@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import replace
+from typing import Any, Callable, Sequence
+
+from openai import OpenAI
+
+from .config_schema import OpenAIConfig
+from .errors import LLMError
+from .llm import (
+    _DEFAULT_OPENAI_RETRY,
+    OpenAIPostClassifier,
+    PostForLLM,
+    _build_user_message,
+    _extract_total_tokens,
+    _response_request,
+)
+from .llm_schema import LLMDecision
+from .openai_retry import is_retryable_openai_exception
+from .retry import OnRetryFn, RetryConfig, SleepFn, call_with_retries
+
+BatchStatusFn = Callable[[str, str, dict[str, int]], None]
+
+_BATCH_ENDPOINT = "/v1/responses"
+_BATCH_COMPLETION_WINDOW = "24h"
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Per-file request cap documented for the Batch API.
+_MAX_BATCH_REQUESTS = 50_000
+
+
+def _batch_line(custom_id: str, *, model: str, post: PostForLLM, max_output_tokens: int) -> str:
+    line = {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": _BATCH_ENDPOINT,
+        "body": _response_request(
+            model=model,
+            user_message=_build_user_message(post),
+            max_output_tokens=max_output_tokens,
+        ),
+    }
+    return json.dumps(line, ensure_ascii=False, separators=(",", ":"))
+
+
+def _output_text_from_body(body: dict[str, Any]) -> str | None:
+    direct = body.get("output_text")
+    if isinstance(direct, str) and direct.strip():
+        return direct.strip()
+
+    for item in body.get("output") or ():
+        if not isinstance(item, dict):
+            continue
+        for part in item.get("content") or ():
+            text = part.get("text") if isinstance(part, dict) else None
+            if isinstance(text, str) and text.strip():
+                return text.strip()
+
+    return None
+
+
+def _request_counts(batch: Any) -> dict[str, int]:
+    counts = getattr(batch, "request_counts", None)
+    out: dict[str, int] = {}
+    for name in ("total", "completed", "failed"):
+        val = getattr(counts, name, None) if counts is not None else None
+        out[name] = int(val) if isinstance(val, int) else 0
+    return out
+
+
+def parse_batch_output(text: str) -> dict[str, tuple[str, int | None]]:
+    """
+    Parse a Batch API output file into {custom_id: (output_text, total_tokens)}.
+
+    Lines that errored, returned a non-200 status, or carry no output text are omitted.
+    """
+    out: dict[str, tuple[str, int | None]] = {}
+    for ln in text.splitlines():
+        if not ln.strip():
+            continue
+
+        try:
+            row = json.loads(ln)
+        except json.JSONDecodeError as e:
+            raise LLMError(f"Batch output line is not valid JSON: {e}") from e
+
+        custom_id = row.get("custom_id")
+        response = row.get("response")
+        if not isinstance(custom_id, str) or row.get("error") or not isinstance(response, dict):
+            continue
+        if response.get("status_code") != 200:
+            continue
+
+        body = response.get("body")
+        if not isinstance(body, dict):
+            continue
+
+        raw = _output_text_from_body(body)
+        if raw is None:
+            continue
+
+        out[custom_id] = (raw, _extract_total_tokens(body))
+
+    return out
+
+
+class OpenAIBatchClassifier:
+    """
+    Labels many posts per OpenAI Batch API job, for the primary model.
+
+    Batch results are parsed and escalated through the live classifier, so decisions follow
+    the same rules as one-post calls and share its caches. Posts missing from the batch
+    output fall back to a live call.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        openai_cfg: OpenAIConfig,
+        classifier: OpenAIPostClassifier,
+        client: Any | None = None,
+        retry: RetryConfig | None = None,
+        on_retry: OnRetryFn | None = None,
+        on_status: BatchStatusFn | None = None,
+        sleep_fn: SleepFn | None = None,
+    ) -> None:
+        key = (api_key or "").strip()
+        if not key:
+            raise ValueError("api_key must be a non-empty string")
+
+        self._cfg = openai_cfg
+        self._classifier = classifier
+        self._retry = retry or replace(_DEFAULT_OPENAI_RETRY, max_attempts=openai_cfg.max_attempts)
+        self._on_retry = on_retry
+        self._on_status = on_status
+        self._sleep = sleep_fn or time.sleep
+
+        # Disable SDK-level retries because we implement retries with jitter here.
+        self._client = client if client is not None else OpenAI(api_key=key, max_retries=0)
+
+    def close(self) -> None:
+        closer = getattr(self._client, "close", None)
+        if callable(closer):
+            try:
+                closer()
+            except Exception:
+                pass
+
+    def _call(self, fn: Callable[[], Any], *, operation: str) -> Any:
+        try:
+            return call_with_retries(
+                fn,
+                cfg=self._retry,
+                is_retryable=is_retryable_openai_exception,
+                operation=operation,
+                on_retry=self._on_retry,
+                sleep_fn=self._sleep,
+            )
+        except Exception as e:
+            raise LLMError(f"OpenAI batch call failed ({operation}): {e}") from e
+
+    def submit_batch(self, posts: Sequence[tuple[str, PostForLLM]]) -> str:
+        """
+        Upload (custom_id, post) pairs as a JSONL batch for the primary model.
+
+        Returns the batch id.
+        """
+        if not posts:
+            raise ValueError("posts must be non-empty")
+        if len(posts) > _MAX_BATCH_REQUESTS:
+            raise ValueError(f"A batch holds at most {_MAX_BATCH_REQUESTS} requests")
+
+        model = (self._cfg.model_primary or "").strip()
+        if not model:
+            raise ValueError("openai_cfg.model_primary must be non-empty")
+
+        payload = "\n".join(
+            _batch_line(
+                custom_id,
+                model=model,
+                post=post,
+                max_output_tokens=self._cfg.max_output_tokens,
+            )
+            for custom_id, post in posts
+        ).encode("utf-8")
+
+        uploaded = self._call(
+            lambda: self._client.files.create(file=("batch.jsonl", payload), purpose="batch"),
+            operation="openai.files.create",
+        )
+        batch = self._call(
+            lambda: self._client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window=_BATCH_COMPLETION_WINDOW,
+            ),
+            operation="openai.batches.create",
+        )
+        return str(batch.id)
+
+    def wait_for_batch(self, batch_id: str) -> Any:
+        """
+        Poll until the batch reaches a terminal status and return the final batch object.
+        """
+        interval = float(self._cfg.batch_poll_interval_seconds)
+        while True:
+            batch = self._call(
+                lambda: self._client.batches.retrieve(batch_id),
+                operation="openai.batches.retrieve",
+            )
+            status = str(getattr(batch, "status", "") or "")
+            if self._on_status is not None:
+                self._on_status(batch_id, status, _request_counts(batch))
+
+            if status in _TERMINAL_STATUSES:
+                return batch
+
+            self._sleep(interval)
+
+    def collect_batch(self, batch_id: str) -> dict[str, tuple[str, int | None]]:
+        """
+        Wait for a batch and return {custom_id: (output_text, total_tokens)}.
+
+        Expired batches return whatever finished; failed or cancelled batches raise LLMError.
+        """
+        batch = self.wait_for_batch(batch_id)
+        status = str(getattr(batch, "status", "") or "")
+        if status in ("failed", "cancelled"):
+            raise LLMError(f"OpenAI batch {batch_id} ended with status={status}")
+
+        output_file_id = getattr(batch, "output_file_id", None)
+        if not output_file_id:
+            return {}
+
+        content = self._call(
+            lambda: self._client.files.content(output_file_id),
+            operation="openai.files.content",
+        )
+        return parse_batch_output(str(content.text))
+
+    def classify_many(
+        self,
+        posts: Sequence[tuple[str, PostForLLM]],
+    ) -> list[tuple[LLMDecision, str, int | None]]:
+        """
+        Label (custom_id, post) pairs, returning results in input order.
+
+        Posts answered by the live classifier's content or response cache are left out of
+        the batch, and batch outputs are stored in the response cache for later runs.
+        """
+        out: list[tuple[LLMDecision, str, int | None] | None] = [
+            self._classifier.cached_result(post) for _, post in posts
+        ]
+        pending = [(custom_id, post) for (custom_id, post), res in zip(posts, out) if res is None]
+
+        results: dict[str, tuple[str, int | None]] = {}
+        for start in range(0, len(pending), _MAX_BATCH_REQUESTS):
+            chunk = pending[start : start + _MAX_BATCH_REQUESTS]
+            results.update(self.collect_batch(self.submit_batch(chunk)))
+
+        for i, (custom_id, post) in enumerate(posts):
+            if out[i] is not None:
+                continue
+
+            found = results.get(custom_id)
+            if found is None:
+                out[i] = self._classifier.classify_with_metadata(post)
+                continue
+
+            raw, tokens_total = found
+            self._classifier.remember_primary_output(post, raw_primary=raw, tokens_total=tokens_total)
+            out[i] = self._classifier.classify_from_primary_output(
+                post,
+                raw_primary=raw,
+                tokens_total=tokens_total,
+            )
+        return [res for res in out if res is not None]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Generic, Hashable, Mapping, TypeVar
+
+from .errors import StorageError
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+  prompt_sha256 BLOB PRIMARY KEY,
+  model TEXT NOT NULL,
+  raw_json TEXT NOT NULL,
+  total_tokens INTEGER,
+  created_at TEXT NOT NULL
+)
+""".strip()
+
+_GET_SQL = "SELECT raw_json, total_tokens FROM llm_cache WHERE prompt_sha256 = ?"
+
+_PUT_SQL = """
+INSERT OR IGNORE INTO llm_cache(prompt_sha256, model, raw_json, total_tokens, created_at)
+VALUES (?, ?, ?, ?, ?)
+""".strip()
+
+
+def request_sha256(request: Mapping[str, Any]) -> bytes:
+    """
+    Digest of a full Responses API request (model, instructions, input, output schema).
+
+    Any prompt or schema change produces a new key, so stale outputs are never replayed.
+    """
+    payload = json.dumps(request, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+class LLMResponseCache:
+    """
+    Persistent exact-match cache of model output text, keyed on the full request.
+
+    Kept in its own SQLite file so paid labels survive a fresh state database. One instance
+    can be shared by forked classifiers; reads and writes are best-effort.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._lock = Lock()
+
+    @classmethod
+    def open(cls, path: str | Path) -> "LLMResponseCache":
+        db_path = str(path)
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout = 5000")
+            try:
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+            except sqlite3.DatabaseError:
+                pass
+            with conn:
+                conn.execute(_CREATE_SQL)
+        except sqlite3.DatabaseError as e:
+            raise StorageError(f"Failed to open LLM cache database: {db_path}: {e}") from e
+
+        return cls(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, request: Mapping[str, Any]) -> tuple[str, int | None] | None:
+        key = request_sha256(request)
+        try:
+            with self._lock:
+                row = self._conn.execute(_GET_SQL, (key,)).fetchone()
+        except sqlite3.DatabaseError:
+            return None
+
+        if row is None:
+            return None
+        raw, total_tokens = row
+        return str(raw), (int(total_tokens) if total_tokens is not None else None)
+
+    def put(self, request: Mapping[str, Any], *, raw: str, total_tokens: int | None) -> None:
+        params = (
+            request_sha256(request),
+            str(request.get("model") or ""),
+            raw,
+            total_tokens,
+            datetime.now(timezone.utc).isoformat(),
+        )
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(_PUT_SQL, params)
+        except sqlite3.DatabaseError:
+            pass
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Small thread-safe in-memory LRU map, shared by forked classifiers within one process.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = int(maxsize)
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+import json
+from typing import Any, Literal, get_args
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -108,6 +109,29 @@ DECISION_JSON_SCHEMA: dict[str, Any] = {
 }
 
 
+# Screening pass: the decision without tags. Confident, rule-consistent rejects stop here and
+# never pay for the open-ended tag fields.
+SCREEN_SCHEMA_NAME = "ig_corpus_post_screen"
+
+SCREEN_JSON_SCHEMA: dict[str, Any] = {
+    **DECISION_JSON_SCHEMA,
+    "properties": {k: v for k, v in DECISION_JSON_SCHEMA["properties"].items() if k != "tags"},
+    "required": [k for k in DECISION_JSON_SCHEMA["required"] if k != "tags"],
+}
+
+# Wrapper for requests that label several posts at once; one decision per post, in order.
+DECISION_LIST_SCHEMA_NAME = "ig_corpus_post_decisions"
+
+DECISION_LIST_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "decisions": {"type": "array", "items": DECISION_JSON_SCHEMA},
+    },
+    "required": ["decisions"],
+}
+
+
 class LanguageResult(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
@@ -157,3 +181,86 @@ class LLMDecision(BaseModel):
     caption_quality: CaptionQualityResult
     tags: TagResult
     overall_confidence: float = Field(ge=0.0, le=1.0)
+
+
+class LLMDecisionList(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    decisions: list[LLMDecision]
+
+
+def _typed(value: Any, kind: type | tuple[type, ...]) -> Any:
+    if isinstance(value, bool) and kind is not bool:
+        raise TypeError(f"unexpected bool for {kind}")
+    if not isinstance(value, kind):
+        raise TypeError(f"expected {kind}, got {type(value).__name__}")
+    return value
+
+
+def _fields(value: Any, model: type[BaseModel]) -> dict[str, Any]:
+    if not isinstance(value, dict) or value.keys() != model.model_fields.keys():
+        raise TypeError(f"keys do not match {model.__name__}")
+    return value
+
+
+def _str_list(value: Any) -> list[str]:
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise TypeError("expected a list of strings")
+    return list(value)
+
+
+def _confidence(value: Any) -> float:
+    number = float(_typed(value, (int, float)))
+    if not 0.0 <= number <= 1.0:
+        raise ValueError("confidence out of range")
+    return number
+
+
+def decision_from_stored_json(raw: str) -> LLMDecision:
+    """
+    Rebuild a decision that was validated before it was stored, skipping re-validation.
+
+    Every field is type-checked while rebuilding; any mismatch (a missing or unknown key,
+    a tag list stored as a string, ...) falls back to full validation, so a corrupt row
+    raises a pydantic ValidationError instead of yielding a silently coerced model.
+    """
+    data = json.loads(raw)
+    try:
+        data = _fields(data, LLMDecision)
+        lang = _fields(data["language"], LanguageResult)
+        topic = _fields(data["topic"], TopicResult)
+        commercial = _fields(data["commercial"], CommercialResult)
+        quality = _fields(data["caption_quality"], CaptionQualityResult)
+        tags = _fields(data["tags"], TagResult)
+        if tags["genre"] not in get_args(GENRE):
+            raise ValueError("unknown genre")
+        return LLMDecision.model_construct(
+            eligible=_typed(data["eligible"], bool),
+            eligibility_reasons=_str_list(data["eligibility_reasons"]),
+            language=LanguageResult.model_construct(
+                is_english=_typed(lang["is_english"], bool),
+                confidence=_confidence(lang["confidence"]),
+            ),
+            topic=TopicResult.model_construct(
+                is_bodyweight_calisthenics=_typed(topic["is_bodyweight_calisthenics"], bool),
+                confidence=_confidence(topic["confidence"]),
+                topic_notes=_typed(topic["topic_notes"], str),
+            ),
+            commercial=CommercialResult.model_construct(
+                is_exclusively_commercial=_typed(commercial["is_exclusively_commercial"], bool),
+                signals=_str_list(commercial["signals"]),
+            ),
+            caption_quality=CaptionQualityResult.model_construct(
+                is_analyzable=_typed(quality["is_analyzable"], bool),
+                issues=_str_list(quality["issues"]),
+            ),
+            tags=TagResult.model_construct(
+                genre=tags["genre"],
+                narrative_labels=_str_list(tags["narrative_labels"]),
+                discourse_moves=_str_list(tags["discourse_moves"]),
+                neoliberal_signals=_str_list(tags["neoliberal_signals"]),
+            ),
+            overall_confidence=_confidence(data["overall_confidence"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return LLMDecision.model_validate_json(raw)
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
-import json
+import heapq
+import re
 import sys
 import time
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, TypeVar
 from urllib.parse import urlsplit
 
-from .apify_client import ActorRunRef, InstagramHashtagScraper, InstagramScraper
+from .apify_client import ActorRunRef, InstagramHashtagScraper, InstagramScraper, build_scrapers
 from .config import RuntimeSecrets, config_sha256
-from .config_schema import AppConfig
+from .config_schema import ApifyConfig, AppConfig
 from .dedupe import dedupe_key
 from .eligibility import enforce_structured_eligibility
 from .errors import ConfigError, StorageError
 from .failure_report import build_failure_report
 from .final_sample import ensure_final_sample, fetch_eligible_pool_keys
 from .llm import OpenAIPostClassifier
+from .llm_batch import OpenAIBatchClassifier
 from .llm_schema import LLMDecision
-from .normalize import normalized_post_from_apify_item, post_for_llm
+from .normalize import normalized_post_from_apify_item, owner_key, post_for_llm
 from .prechecks import run_prechecks
 from .query_queue import TermQueue, normalize_term
 from .run_log import RunLogger
 from .stagnation import StagnationTracker
-from .storage import SQLiteStateStore
+from .storage import DecisionWrite, RawPostWrite, SQLiteStateStore
+
+_PrimaryFetch = Callable[[], tuple[ActorRunRef, list[dict[str, Any]]]]
+# (decision, model, tokens_total, latency_ms) per labeled post.
+_Labeled = tuple[LLMDecision, str, int | None, int | None]
+
+_T = TypeVar("_T")
+
+# How often an unused prefetch is re-aborted while the loop shuts down.
+_PREFETCH_ABORT_POLL_SECONDS = 1.0
+# Batch API jobs hold at most this many candidates per post still needed for the pool.
+_BATCH_CANDIDATES_PER_NEEDED_POST = 4
+
+# Rolling window of per-call labeling latencies reported with each ingested batch.
+_LATENCY_WINDOW = 100
 
 
 @dataclass(frozen=True)
@@ -49,26 +66,59 @@ def _pkg_version(name: str) -> str:
         return "unknown"
 
 
-def _db_count(store: SQLiteStateStore, sql: str) -> int:
-    row = store.conn.execute(sql).fetchone()
-    if row is None:
-        return 0
-    try:
-        return int(row[0])
-    except Exception:
-        return 0
+def _timed_call(fn: Callable[[], _T]) -> tuple[_T, int]:
+    started = time.perf_counter()
+    out = fn()
+    return out, int(round((time.perf_counter() - started) * 1000.0))
+
 
+def _latency_percentiles(latencies: Iterable[int]) -> dict[str, int]:
+    ordered = sorted(latencies)
+    if not ordered:
+        return {}
 
-def _eligible_count(store: SQLiteStateStore) -> int:
-    return _db_count(store, "SELECT COUNT(1) FROM eligible_posts")
+    def _pick(q: float) -> int:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
 
+    return {"llm_latency_p50_ms": _pick(0.5), "llm_latency_p95_ms": _pick(0.95)}
 
-def _decision_count(store: SQLiteStateStore) -> int:
-    return _db_count(store, "SELECT COUNT(1) FROM llm_decisions")
 
+_STORE_TOTALS_SQL = """
+SELECT
+  (SELECT COUNT(1) FROM raw_posts),
+  (SELECT COUNT(1) FROM llm_decisions),
+  (SELECT COUNT(1) FROM eligible_posts)
+""".strip()
 
-def _raw_count(store: SQLiteStateStore) -> int:
-    return _db_count(store, "SELECT COUNT(1) FROM raw_posts")
+
+def _store_totals(store: SQLiteStateStore) -> tuple[int, int, int]:
+    """
+    Return (raw, decision, eligible) row counts in one round trip.
+
+    Only read at startup; the loop keeps these totals in memory afterwards.
+    """
+    row = store.conn.execute(_STORE_TOTALS_SQL).fetchone()
+    if row is None:
+        return 0, 0, 0
+    try:
+        return int(row[0] or 0), int(row[1] or 0), int(row[2] or 0)
+    except Exception:
+        return 0, 0, 0
+
+
+# "explore/tags/<tag>" as whole path segments; repeated slashes count as one, like the
+# empty-segment filtering of a split("/").
+_HASHTAG_PATH_RE = re.compile(r"(?:^|/)explore/+tags/+([^/]+)")
+
+_SEARCH_URL_KEYS = (
+    "url",
+    "pageUrl",
+    "page_url",
+    "hashtagUrl",
+    "hashtag_url",
+    "tagUrl",
+    "tag_url",
+)
 
 
 def _extract_hashtag_from_url(url: str) -> str | None:
@@ -77,103 +127,57 @@ def _extract_hashtag_from_url(url: str) -> str | None:
         return None
 
     try:
-        parts = urlsplit(u)
+        path = urlsplit(u).path or ""
     except Exception:
         return None
 
-    path = (parts.path or "").strip("/")
-    if not path:
+    m = _HASHTAG_PATH_RE.search(path)
+    if m is None:
         return None
+    return m.group(1).strip() or None
 
-    segs = [s for s in path.split("/") if s]
-    for i in range(len(segs) - 2):
-        if segs[i] == "explore" and segs[i + 1] == "tags":
-            tag = (segs[i + 2] or "").strip()
-            return tag or None
-
-    return None
 
+def _iter_item_urls(item: dict[str, Any]) -> Iterable[Any]:
+    for k in _SEARCH_URL_KEYS:
+        yield item.get(k)
 
-def _extract_hashtag_search_urls(items: Iterable[dict[str, Any]]) -> list[str]:
-    keys = (
-        "url",
-        "pageUrl",
-        "page_url",
-        "hashtagUrl",
-        "hashtag_url",
-        "tagUrl",
-        "tag_url",
-    )
+    v_urls = item.get("urls")
+    if isinstance(v_urls, list):
+        yield from v_urls
 
-    out: list[str] = []
-    seen: set[str] = set()
 
+def _extract_hashtag_search_urls(items: Iterable[dict[str, Any]]) -> list[str]:
+    # First spelling wins per casefolded URL; dicts keep insertion order.
+    by_key: dict[str, str] = {}
     for item in items:
-        for k in keys:
-            v = item.get(k)
-            if isinstance(v, str) and v.strip():
-                url = v.strip()
-                key = url.casefold()
-                if key in seen:
-                    continue
-                seen.add(key)
-                out.append(url)
-
-        v_urls = item.get("urls")
-        if isinstance(v_urls, list):
-            for v in v_urls:
-                if isinstance(v, str) and v.strip():
-                    url = v.strip()
-                    key = url.casefold()
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    out.append(url)
-
-    return out
-
-
-def _load_existing_counters(store: SQLiteStateStore) -> tuple[Counter[str], Counter[str]]:
-    hashtag_counts: Counter[str] = Counter()
-    user_counts: Counter[str] = Counter()
-
-    rows = store.conn.execute(
-        """
-        SELECT p.raw_json
-        FROM raw_posts p
-        JOIN latest_llm_decisions d ON d.post_key = p.post_key
-        WHERE d.eligible = 1
-        """.strip()
-    ).fetchall()
-
-    for r in rows:
-        raw = (r[0] or "").strip()
-        if not raw:
-            continue
+        for v in _iter_item_urls(item):
+            if isinstance(v, str) and (url := v.strip()):
+                by_key.setdefault(url.casefold(), url)
+    return list(by_key.values())
 
-        try:
-            item = json.loads(raw)
-        except Exception:
-            continue
 
-        if not isinstance(item, dict):
-            continue
+_ELIGIBLE_HASHTAG_COUNTS_SQL = """
+SELECT h.hashtag, COUNT(*)
+FROM raw_post_hashtags h
+JOIN latest_llm_decisions d ON d.post_key = h.post_key
+WHERE d.eligible = 1
+GROUP BY h.hashtag
+""".strip()
 
-        post = normalized_post_from_apify_item(item)
-        if post is None:
-            continue
+_ELIGIBLE_OWNER_COUNTS_SQL = """
+SELECT p.owner_key, COUNT(*)
+FROM raw_posts p
+JOIN latest_llm_decisions d ON d.post_key = p.post_key
+WHERE d.eligible = 1 AND p.owner_key IS NOT NULL
+GROUP BY p.owner_key
+""".strip()
 
-        for tag in post.hashtags:
-            hashtag_counts[tag] += 1
-
-        user_key = None
-        if post.owner_username:
-            user_key = f"user:{post.owner_username.casefold()}"
-        elif post.owner_id:
-            user_key = f"user_id:{post.owner_id}"
-        if user_key:
-            user_counts[user_key] += 1
 
+def _load_existing_counters(store: SQLiteStateStore) -> tuple[Counter[str], Counter[str]]:
+    # Hashtags and owner keys are derived when raw posts are written, so SQLite does the
+    # tallying and no raw_json payload is parsed here.
+    hashtag_counts: Counter[str] = Counter(dict(store.conn.execute(_ELIGIBLE_HASHTAG_COUNTS_SQL)))
+    user_counts: Counter[str] = Counter(dict(store.conn.execute(_ELIGIBLE_OWNER_COUNTS_SQL)))
     return hashtag_counts, user_counts
 
 
@@ -189,8 +193,11 @@ def _selected_expansion_terms(
     if max_terms <= 0:
         return []
 
-    candidates: list[tuple[int, str]] = []
+    # The casefolded key is computed once per term and reused as the ordering tiebreak.
+    candidates: list[tuple[int, str, str]] = []
     for term, freq in hashtag_counts.items():
+        if freq < min_freq:
+            continue
         key = term.casefold()
         if key in blocklist_keys:
             continue
@@ -198,18 +205,9 @@ def _selected_expansion_terms(
             continue
         if key in present_keys:
             continue
-        candidates.append((int(freq), term))
+        candidates.append((-int(freq), key, term))
 
-    candidates.sort(key=lambda x: (-x[0], x[1].casefold(), x[1]))
-
-    out: list[str] = []
-    for freq, term in candidates:
-        if freq < min_freq:
-            break
-        out.append(term)
-        if len(out) >= max_terms:
-            break
-    return out
+    return [term for _, _, term in heapq.nsmallest(max_terms, candidates)]
 
 
 def _apply_dominance_guard(
@@ -225,12 +223,7 @@ def _apply_dominance_guard(
     if max_posts_per_user <= 0:
         return decision
 
-    user_key = None
-    if owner_username:
-        user_key = f"user:{owner_username.casefold()}"
-    elif owner_id:
-        user_key = f"user_id:{owner_id}"
-
+    user_key = owner_key(owner_username, owner_id)
     if not user_key:
         return decision
 
@@ -270,6 +263,7 @@ def run_feedback_loop(
     scraper: InstagramHashtagScraper | None = None,
     fallback_scraper: InstagramScraper | None = None,
     classifier: OpenAIPostClassifier | None = None,
+    batch_classifier: OpenAIBatchClassifier | None = None,
     logger: RunLogger | None = None,
 ) -> FeedbackLoopResult:
     cfg_hash = config_sha256(config)
@@ -290,6 +284,8 @@ def run_feedback_loop(
             apify_fallback_actor=config.apify.fallback_actor,
             apify_keyword_search=bool(config.apify.keyword_search),
             openai_max_concurrent_requests=int(config.openai.max_concurrent_requests),
+            openai_use_batch_api=bool(config.openai.use_batch_api),
+            openai_posts_per_request=int(config.openai.posts_per_request),
             requested_run_id=(run_id or "").strip() or None,
             resume_requested=bool(resume),
         )
@@ -350,8 +346,12 @@ def run_feedback_loop(
                 versions=versions,
             )
 
-    primary = scraper or InstagramHashtagScraper(secrets.apify_token)
-    fallback = fallback_scraper or InstagramScraper(secrets.apify_token)
+    primary = scraper
+    fallback = fallback_scraper
+    if primary is None or fallback is None:
+        default_primary, default_fallback = build_scrapers(secrets.apify_token, apify=config.apify)
+        primary = primary or default_primary
+        fallback = fallback or default_fallback
 
     classifier_provided = classifier is not None
     post_classifier = classifier or OpenAIPostClassifier(
@@ -359,19 +359,47 @@ def run_feedback_loop(
         openai_cfg=config.openai,
     )
 
+    def _on_batch_status(batch_id: str, status: str, counts: dict[str, int]) -> None:
+        if logger is not None:
+            logger.info("llm_batch_status", batch_id=batch_id, status=status, **counts)
+
+    batch_provided = batch_classifier is not None
+    if (
+        batch_classifier is None
+        and config.openai.use_batch_api
+        and isinstance(post_classifier, OpenAIPostClassifier)
+    ):
+        batch_classifier = OpenAIBatchClassifier(
+            secrets.openai_api_key,
+            openai_cfg=config.openai,
+            classifier=post_classifier,
+            on_status=_on_batch_status,
+        )
+
     openai_concurrency = max(1, int(config.openai.max_concurrent_requests))
+    # Grouped requests need the OpenAI classifier; other classifiers label one post per call.
+    group_size = 1
+    if batch_classifier is None and isinstance(post_classifier, OpenAIPostClassifier):
+        group_size = max(1, int(config.openai.posts_per_request))
     classifier_pool: list[OpenAIPostClassifier] | None = None
     executor: ThreadPoolExecutor | None = None
 
-    if isinstance(post_classifier, OpenAIPostClassifier) and openai_concurrency > 1:
+    if (
+        batch_classifier is None
+        and isinstance(post_classifier, OpenAIPostClassifier)
+        and openai_concurrency > 1
+    ):
         classifier_pool = [post_classifier]
         for _ in range(openai_concurrency - 1):
             classifier_pool.append(post_classifier.fork())
         executor = ThreadPoolExecutor(max_workers=openai_concurrency, thread_name_prefix="openai")
 
-    eligible_total = _eligible_count(store)
-    raw_total = _raw_count(store)
-    decision_total = _decision_count(store)
+    # One worker runs the next primary scrape while the current batch is being labeled.
+    scrape_executor: ThreadPoolExecutor | None = None
+    if config.loop.prefetch_next_batch:
+        scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="apify")
+
+    raw_total, decision_total, eligible_total = _store_totals(store)
 
     seen_keys = store.seen_post_keys()
     hashtag_counts, user_counts = _load_existing_counters(store)
@@ -389,6 +417,8 @@ def run_feedback_loop(
     current_results_limit = int(config.apify.results_limit_per_query)
     max_results_limit = 500
 
+    recent_latencies: deque[int] = deque(maxlen=_LATENCY_WINDOW)
+
     @dataclass(frozen=True)
     class _LLMCandidate:
         post_key: str
@@ -421,16 +451,135 @@ def run_feedback_loop(
                 dataset_id=run_ref.default_dataset_id,
             )
 
-    def _classify_batch(candidates: list[_LLMCandidate]) -> list[tuple[LLMDecision, str, int | None]]:
+    def _start_primary_fetch(
+        iteration: int,
+        batch: list[str],
+    ) -> tuple[ApifyConfig, _PrimaryFetch]:
+        for b in batch:
+            attempted_keys.add(b.casefold())
+
+        apify_cfg = config.apify.model_copy(update={"results_limit_per_query": int(current_results_limit)})
+
+        if logger is not None:
+            logger.info(
+                "apify_batch_started",
+                iteration=int(iteration),
+                terms=list(batch),
+                actor=apify_cfg.primary_actor,
+                results_limit=int(apify_cfg.results_limit_per_query),
+            )
+
+        fetch = partial(primary.run_and_fetch, batch, apify=apify_cfg, dataset_limit=None, clean=True)
+        return apify_cfg, fetch
+
+    def _discard_prefetch(
+        batch: list[str],
+        pending: Future[tuple[ActorRunRef, list[dict[str, Any]]]],
+    ) -> bool:
+        """
+        Stop an unused prefetch. Returns False when its run is still in flight and the
+        scraper cannot abort it, in which case the caller must not wait for it.
+        """
+        # An unused run would otherwise keep billing and hold up interpreter exit, since
+        # executor threads are joined at shutdown.
+        if pending.cancel():
+            return True
+
+        abort = getattr(primary, "abort_active_runs", None)
+        if not callable(abort) and not pending.done():
+            if logger is not None:
+                logger.warning("apify_prefetch_left_running", terms=list(batch))
+            return False
+
+        aborted: list[str] = []
+        while callable(abort) and not pending.done():
+            # Retry until done: the run may not have been started yet on the first pass.
+            aborted.extend(abort())
+            wait([pending], timeout=_PREFETCH_ABORT_POLL_SECONDS)
+
+        if logger is None:
+            return True
+        if aborted:
+            logger.warning("apify_prefetch_aborted", terms=list(batch), actor_run_ids=sorted(set(aborted)))
+        elif pending.exception() is None:
+            run_ref, _ = pending.result()
+            logger.info(
+                "apify_prefetch_discarded",
+                terms=list(batch),
+                actor_run_id=run_ref.run_id,
+                dataset_id=run_ref.default_dataset_id,
+            )
+        return True
+
+    def _classify_batch(candidates: list[_LLMCandidate]) -> list[_Labeled]:
         if not candidates:
             return []
 
+        if batch_classifier is not None:
+            # Batch jobs have no per-post call to time.
+            try:
+                return [
+                    (decision, model_used, tokens_total, None)
+                    for decision, model_used, tokens_total in batch_classifier.classify_many(
+                        [(cand.post_key, post_for_llm(cand.post)) for cand in candidates]
+                    )
+                ]
+            except Exception as e:
+                if logger is not None:
+                    logger.exception(
+                        "llm_batch_classify_failed",
+                        exc=e,
+                        post_keys=[cand.post_key for cand in candidates],
+                    )
+                raise
+
+        if group_size > 1:
+            groups = [candidates[i : i + group_size] for i in range(0, len(candidates), group_size)]
+            if executor is not None and classifier_pool is not None:
+                fetchers = [
+                    executor.submit(
+                        _timed_call,
+                        partial(
+                            classifier_pool[idx].classify_group_with_metadata,
+                            [post_for_llm(cand.post) for cand in group],
+                        ),
+                    ).result
+                    for idx, group in enumerate(groups)
+                ]
+            else:
+                fetchers = [
+                    partial(
+                        _timed_call,
+                        partial(
+                            post_classifier.classify_group_with_metadata,
+                            [post_for_llm(cand.post) for cand in group],
+                        ),
+                    )
+                    for group in groups
+                ]
+
+            # Every post in a group shares the latency of the one request that labeled it.
+            grouped_out: list[_Labeled] = []
+            for group, fetch in zip(groups, fetchers):
+                try:
+                    group_results, latency_ms = fetch()
+                    grouped_out.extend((d, m, t, latency_ms) for d, m, t in group_results)
+                except Exception as e:
+                    if logger is not None:
+                        logger.exception(
+                            "llm_classify_failed",
+                            exc=e,
+                            post_keys=[cand.post_key for cand in group],
+                        )
+                    raise
+            return grouped_out
+
         if executor is None or classifier_pool is None:
-            out: list[tuple[LLMDecision, str, int | None]] = []
+            out: list[_Labeled] = []
             for cand in candidates:
                 try:
-                    decision, model_used, tokens_total = post_classifier.classify_with_metadata(
-                        post_for_llm(cand.post)
+                    (decision, model_used, tokens_total), latency_ms = _timed_call(
+                        partial(post_classifier.classify_with_metadata, post_for_llm(cand.post))
                     )
                 except Exception as e:
                     if logger is not None:
@@ -441,18 +590,20 @@ def run_feedback_loop(
                             post_key=cand.post_key,
                         )
                     raise
-                out.append((decision, model_used, tokens_total))
+                out.append((decision, model_used, tokens_total, latency_ms))
             return out
 
         futures = []
         for idx, cand in enumerate(candidates):
             clf = classifier_pool[idx]
-            futures.append(executor.submit(clf.classify_with_metadata, post_for_llm(cand.post)))
+            futures.append(
+                executor.submit(_timed_call, partial(clf.classify_with_metadata, post_for_llm(cand.post)))
+            )
 
-        out: list[tuple[LLMDecision, str, int | None]] = []
+        out: list[_Labeled] = []
         for cand, fut in zip(candidates, futures):
             try:
-                decision, model_used, tokens_total = fut.result()
+                (decision, model_used, tokens_total), latency_ms = fut.result()
             except Exception as e:
                 if logger is not None:
                     logger.exception(
@@ -462,7 +613,7 @@ def run_feedback_loop(
                         post_key=cand.post_key,
                     )
                 raise
-            out.append((decision, model_used, tokens_total))
+            out.append((decision, model_used, tokens_total, latency_ms))
         return out
 
     def _ingest_post_items(items: list[dict[str, Any]], *, actor_source: str) -> tuple[int, int]:
@@ -471,18 +622,56 @@ def run_feedback_loop(
         new_eligible = 0
         processed = 0
 
-        batch_target = len(classifier_pool) if classifier_pool is not None else 1
+        if classifier_pool is not None:
+            batch_target = len(classifier_pool) * group_size
+        else:
+            batch_target = group_size
+
+        def _batch_target() -> int:
+            if batch_classifier is None:
+                return batch_target
+            # One Batch API job per flush, sized to the remaining pool need so a large
+            # dataset is not submitted (and billed) far past pool_n.
+            remaining = max(1, int(config.targets.pool_n) - int(eligible_total))
+            return max(1, min(len(items), remaining * _BATCH_CANDIDATES_PER_NEEDED_POST))
+
         candidates: list[_LLMCandidate] = []
+        # Raw posts are written in one transaction per batch, always before the decisions
+        # that reference them.
+        pending_raw: list[RawPostWrite] = []
+
+        def _flush_raw_posts() -> None:
+            if not pending_raw:
+                return
+
+            try:
+                store.upsert_raw_posts(pending_raw)
+            except Exception as e:
+                if logger is not None:
+                    logger.exception(
+                        "storage_upsert_raw_post_failed",
+                        exc=e,
+                        post_keys=[r.post_key for r in pending_raw],
+                        actor_source=actor_source,
+                    )
+                raise
+
+            pending_raw.clear()
 
         def _flush_candidates() -> None:
             nonlocal eligible_total, decision_total, processed, new_eligible
 
+            _flush_raw_posts()
+
             if not candidates:
                 return
 
             results = _classify_batch(candidates)
 
-            for cand, (decision, model_used, tokens_total) in zip(candidates, results):
+            rows: list[DecisionWrite] = []
+            eligible_posts: list[Any] = []
+
+            for cand, (decision, model_used, tokens_total, latency_ms) in zip(candidates, results):
                 decision = enforce_structured_eligibility(decision)
                 decision = _apply_dominance_guard(
                     decision,
@@ -493,37 +682,44 @@ def run_feedback_loop(
                 )
                 decision = _apply_pool_cap(
                     decision,
-                    eligible_total=int(eligible_total),
+                    eligible_total=int(eligible_total) + len(eligible_posts),
                     pool_target=int(config.targets.pool_n),
                 )
 
-                try:
-                    store.record_llm_decision(
+                rows.append(
+                    DecisionWrite(
                         post_key=cand.post_key,
                         url=str(getattr(cand.post, "url", "") or ""),
                         model=model_used,
                         decision=decision,
                         tokens_total=tokens_total,
+                        latency_ms=latency_ms,
                     )
-                except Exception as e:
-                    if logger is not None:
-                        logger.exception(
-                            "storage_record_llm_decision_failed",
-                            exc=e,
-                            url=str(getattr(cand.post, "url", "") or ""),
-                            post_key=cand.post_key,
-                            model=model_used,
-                        )
-                    raise
+                )
+                if latency_ms is not None:
+                    recent_latencies.append(latency_ms)
+                if decision.eligible:
+                    eligible_posts.append(cand.post)
 
-                decision_total += 1
-                processed += 1
+            try:
+                store.record_llm_decisions(rows)
+            except Exception as e:
+                if logger is not None:
+                    logger.exception(
+                        "storage_record_llm_decision_failed",
+                        exc=e,
+                        post_keys=[r.post_key for r in rows],
+                        models=sorted({r.model for r in rows}),
+                    )
+                raise
 
-                if decision.eligible:
-                    eligible_total += 1
-                    new_eligible += 1
-                    for tag in getattr(cand.post, "hashtags", ()) or ():
-                        hashtag_counts[tag] += 1
+            decision_total += len(rows)
+            processed += len(rows)
+            eligible_total += len(eligible_posts)
+            new_eligible += len(eligible_posts)
+            for post in eligible_posts:
+                for tag in getattr(post, "hashtags", ()) or ():
+                    hashtag_counts[tag] += 1
 
             candidates.clear()
 
@@ -540,23 +736,14 @@ def run_feedback_loop(
                 if raw_total >= config.loop.max_raw_items:
                     break
 
-                try:
-                    store.upsert_raw_post(
+                pending_raw.append(
+                    RawPostWrite(
                         post_key=post_key,
                         url=post.url,
                         actor_source=actor_source,
                         raw_item=item,
                     )
-                except Exception as e:
-                    if logger is not None:
-                        logger.exception(
-                            "storage_upsert_raw_post_failed",
-                            exc=e,
-                            url=post.url,
-                            post_key=post_key,
-                            actor_source=actor_source,
-                        )
-                    raise
+                )
 
                 seen_keys.add(post_key)
                 raw_total += 1
@@ -566,7 +753,7 @@ def run_feedback_loop(
                     continue
 
                 candidates.append(_LLMCandidate(post_key=post_key, post=post))
-                if len(candidates) >= batch_target:
+                if len(candidates) >= _batch_target():
                     _flush_candidates()
                     if eligible_total >= config.targets.pool_n:
                         break
@@ -575,9 +762,12 @@ def run_feedback_loop(
         finally:
             # Ensure we never leave candidates unrecorded if an exception escapes mid-batch.
             candidates.clear()
+            pending_raw.clear()
 
         return processed, new_eligible
 
+    prefetched: tuple[list[str], ApifyConfig, Future[tuple[ActorRunRef, list[dict[str, Any]]]]] | None = None
+
     try:
         for iteration in range(int(config.loop.max_iterations)):
             if eligible_total >= config.targets.pool_n:
@@ -652,10 +842,16 @@ def run_feedback_loop(
                     failure_report=report,
                 )
 
-            batch = queue.pop_batch(int(config.apify.run_batch_queries))
-            if not batch:
-                queue.add_many(config.querying.seed_terms)
+            fetch: _PrimaryFetch | None = None
+            if prefetched is not None:
+                batch, apify_cfg, pending = prefetched
+                prefetched = None
+                fetch = pending.result
+            else:
                 batch = queue.pop_batch(int(config.apify.run_batch_queries))
+                if not batch:
+                    queue.add_many(config.querying.seed_terms)
+                    batch = queue.pop_batch(int(config.apify.run_batch_queries))
 
             if not batch:
                 report = build_failure_report(
@@ -695,27 +891,11 @@ def run_feedback_loop(
                     failure_report=report,
                 )
 
-            for b in batch:
-                attempted_keys.add(b.casefold())
-
-            apify_cfg = config.apify.model_copy(update={"results_limit_per_query": int(current_results_limit)})
-
-            if logger is not None:
-                logger.info(
-                    "apify_batch_started",
-                    iteration=int(iteration),
-                    terms=list(batch),
-                    actor=apify_cfg.primary_actor,
-                    results_limit=int(apify_cfg.results_limit_per_query),
-                )
+            if fetch is None:
+                apify_cfg, fetch = _start_primary_fetch(iteration, batch)
 
             try:
-                run_ref, items = primary.run_and_fetch(
-                    batch,
-                    apify=apify_cfg,
-                    dataset_limit=None,
-                    clean=True,
-                )
+                run_ref, items = fetch()
             except Exception as e:
                 if logger is not None:
                     logger.exception(
@@ -738,6 +918,18 @@ def run_feedback_loop(
 
             _record_actor_run(run_ref)
 
+            # Only prefetch when this pass cannot fill the pool on its own: otherwise the
+            # next run would likely be started just to be aborted.
+            if (
+                scrape_executor is not None
+                and iteration + 1 < int(config.loop.max_iterations)
+                and len(items) < int(config.targets.pool_n) - int(eligible_total)
+            ):
+                next_batch = queue.pop_batch(int(config.apify.run_batch_queries))
+                if next_batch:
+                    next_cfg, next_fetch = _start_primary_fetch(iteration + 1, next_batch)
+                    prefetched = (next_batch, next_cfg, scrape_executor.submit(next_fetch))
+
             processed_primary, new_eligible_primary = _ingest_post_items(items, actor_source=run_ref.actor_id)
 
             if logger is not None:
@@ -750,6 +942,7 @@ def run_feedback_loop(
                     eligible_total=int(eligible_total),
                     raw_total=int(raw_total),
                     decision_total=int(decision_total),
+                    **_latency_percentiles(recent_latencies),
                 )
 
             if config.querying.expansion.enabled:
@@ -847,13 +1040,18 @@ def run_feedback_loop(
                     seen_url_keys.add(k)
                     deduped_urls.append(u)
 
-                discovered_terms: list[str] = []
+                # Parse each URL once; tag URLs feed both the queue and the scrape below.
+                tag_urls: list[tuple[str, str]] = []
                 for u in deduped_urls:
                     tag = _extract_hashtag_from_url(u)
                     if tag:
-                        key = tag.casefold()
-                        if key not in blocklist_keys and key not in attempted_keys:
-                            discovered_terms.append(tag)
+                        tag_urls.append((u, tag))
+
+                discovered_terms: list[str] = []
+                for _, tag in tag_urls:
+                    key = tag.casefold()
+                    if key not in blocklist_keys and key not in attempted_keys:
+                        discovered_terms.append(tag)
 
                 added = queue.add_many(discovered_terms)
                 if logger is not None and added > 0:
@@ -863,8 +1061,7 @@ def run_feedback_loop(
                         added_terms=int(added),
                     )
 
-                scrape_urls = [u for u in deduped_urls if _extract_hashtag_from_url(u)]
-                scrape_urls = scrape_urls[:10]
+                scrape_urls = [u for u, _ in tag_urls[:10]]
                 if scrape_urls:
                     if logger is not None:
                         logger.info(
@@ -952,6 +1149,12 @@ def run_feedback_loop(
         if executor is not None:
             executor.shutdown(wait=True)
 
+        if scrape_executor is not None:
+            settled = True
+            if prefetched is not None:
+                settled = _discard_prefetch(prefetched[0], prefetched[2])
+            scrape_executor.shutdown(wait=settled, cancel_futures=True)
+
         if classifier_pool is not None:
             for c in classifier_pool[1:]:
                 try:
@@ -959,6 +1162,9 @@ def run_feedback_loop(
                 except Exception:
                     pass
 
+        if batch_classifier is not None and not batch_provided:
+            batch_classifier.close()
+
         if not classifier_provided:
             try:
                 post_classifier.close()
@@ -72,6 +72,52 @@ def _dedupe_terms(values: list[str]) -> tuple[str, ...]:
     return tuple(out)
 
 
+def hashtags_from_apify_item(item: Mapping[str, Any]) -> tuple[str, ...]:
+    """
+    Extract the normalized hashtag list exactly as normalized_post_from_apify_item does.
+
+    Useful for tallies that only need hashtags and not a full NormalizedPost.
+    """
+    hashtags = _coerce_str_list(item.get("hashtags"), strip_prefix="#")
+    if hashtags is None:
+        hashtags = _coerce_str_list(item.get("hashTags"), strip_prefix="#")
+    return _dedupe_terms(hashtags or [])
+
+
+def owner_key(owner_username: str | None, owner_id: str | None) -> str | None:
+    """
+    Stable per-account key used by the dominance guard and its persisted tallies.
+    """
+    if owner_username:
+        return f"user:{owner_username.casefold()}"
+    if owner_id:
+        return f"user_id:{owner_id}"
+    return None
+
+
+def _owner_from_apify_item(item: Mapping[str, Any]) -> tuple[str | None, str | None]:
+    owner_username = (
+        _coerce_str(item.get("ownerUsername"))
+        or _coerce_str(item.get("owner_username"))
+        or _coerce_str(item.get("username"))
+    )
+    owner_id = _coerce_id(item.get("ownerId")) or _coerce_id(item.get("owner_id"))
+
+    owner_obj = item.get("owner")
+    if (owner_username is None or owner_id is None) and isinstance(owner_obj, Mapping):
+        owner_username = owner_username or _coerce_str(owner_obj.get("username"))
+        owner_id = owner_id or _coerce_id(owner_obj.get("id"))
+
+    return owner_username, owner_id
+
+
+def owner_key_from_apify_item(item: Mapping[str, Any]) -> str | None:
+    """
+    Owner key exactly as owner_key() would derive it from the normalized post.
+    """
+    return owner_key(*_owner_from_apify_item(item))
+
+
 def normalized_post_from_apify_item(item: Mapping[str, Any]) -> NormalizedPost | None:
     """
     Best-effort extraction of a normalized post record from Apify dataset items.
@@ -105,10 +151,7 @@ def normalized_post_from_apify_item(item: Mapping[str, Any]) -> NormalizedPost |
         or _coerce_str(item.get("caption_text"))
     )
 
-    hashtags = _coerce_str_list(item.get("hashtags"), strip_prefix="#")
-    if hashtags is None:
-        hashtags = _coerce_str_list(item.get("hashTags"), strip_prefix="#")
-    hashs = _dedupe_terms(hashtags or [])
+    hashs = hashtags_from_apify_item(item)
 
     mentions = _coerce_str_list(item.get("mentions"), strip_prefix="@")
     if mentions is None:
@@ -136,17 +179,7 @@ def normalized_post_from_apify_item(item: Mapping[str, Any]) -> NormalizedPost |
         or _coerce_str(item.get("date"))
     )
 
-    owner_username = (
-        _coerce_str(item.get("ownerUsername"))
-        or _coerce_str(item.get("owner_username"))
-        or _coerce_str(item.get("username"))
-    )
-    owner_id = _coerce_id(item.get("ownerId")) or _coerce_id(item.get("owner_id"))
-
-    owner_obj = item.get("owner")
-    if (owner_username is None or owner_id is None) and isinstance(owner_obj, Mapping):
-        owner_username = owner_username or _coerce_str(owner_obj.get("username"))
-        owner_id = owner_id or _coerce_id(owner_obj.get("id"))
+    owner_username, owner_id = _owner_from_apify_item(item)
 
     return NormalizedPost(
         url=url,
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable
+
+ClockFn = Callable[[], float]
+SleepFn = Callable[[float], None]
+
+
+class RateLimiter:
+    """
+    Thread-safe token buckets for requests per minute and tokens per minute.
+
+    Both buckets start full and refill continuously. acquire() blocks until both can cover
+    the request; a limit of None leaves that dimension unbounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        clock: ClockFn | None = None,
+        sleep_fn: SleepFn | None = None,
+    ) -> None:
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+
+        self._rpm = float(requests_per_minute) if requests_per_minute is not None else None
+        self._tpm = float(tokens_per_minute) if tokens_per_minute is not None else None
+        self._clock = clock or time.monotonic
+        self._sleep = sleep_fn or time.sleep
+
+        self._lock = Lock()
+        self._requests = self._rpm or 0.0
+        self._tokens = self._tpm or 0.0
+        self._updated = self._clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        if self._rpm is not None:
+            self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60.0)
+        if self._tpm is not None:
+            self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60.0)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Take one request and `tokens` tokens, sleeping until both buckets allow it.
+
+        Requests larger than the whole token budget are clamped to it so they can still run.
+        """
+        need = max(0.0, float(tokens))
+        if self._tpm is not None:
+            need = min(need, self._tpm)
+
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+
+                wait = 0.0
+                if self._rpm is not None and self._requests < 1.0:
+                    wait = max(wait, (1.0 - self._requests) * 60.0 / self._rpm)
+                if self._tpm is not None and self._tokens < need:
+                    wait = max(wait, (need - self._tokens) * 60.0 / self._tpm)
+
+                if wait <= 0.0:
+                    if self._rpm is not None:
+                        self._requests -= 1.0
+                    if self._tpm is not None:
+                        self._tokens -= need
+                    return
+
+            self._sleep(wait)
+
+    def refund(self, tokens: int) -> None:
+        """
+        Return tokens that were reserved by acquire() but not used.
+        """
+        if self._tpm is None or tokens <= 0:
+            return
+
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tpm, self._tokens + float(tokens))
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import json
+import time
 import traceback
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
 from typing import Any, TextIO
 
 
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed; reuse one.
+_RECORD_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    sort_keys=True,
+    separators=(",", ":"),
+    default=str,
+)
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -27,8 +37,14 @@ class RunLogger:
     Tiny JSONL logger for long-running corpus builds.
 
     Each log line is a single JSON object, making it easy to parse for audits.
+
+    Writes are buffered and flushed at most every `flush_interval_s` seconds; a timer flushes
+    buffered records even when no later write arrives, e.g. during a long Actor run. WARN/ERROR
+    records, `flush()` and `close()` always flush, so failures reach disk immediately.
     """
 
+    _BUFFER_SIZE = 1 << 16
+
     def __init__(
         self,
         path: str | Path,
@@ -36,6 +52,7 @@ class RunLogger:
         overwrite: bool = True,
         run_id: str | None = None,
         session_id: str | None = None,
+        flush_interval_s: float = 1.0,
     ) -> None:
         self._path = Path(path)
         self._overwrite = bool(overwrite)
@@ -44,6 +61,9 @@ class RunLogger:
         self._fp: TextIO | None = None
         self._lock = Lock()
         self._opened = False
+        self._flush_interval_s = max(0.0, float(flush_interval_s))
+        self._last_flush = time.monotonic()
+        self._flush_timer: Timer | None = None
 
     @classmethod
     def open(
@@ -53,13 +73,29 @@ class RunLogger:
         overwrite: bool = True,
         run_id: str | None = None,
         session_id: str | None = None,
+        flush_interval_s: float = 1.0,
     ) -> "RunLogger":
-        logger = cls(path, overwrite=overwrite, run_id=run_id, session_id=session_id)
+        logger = cls(
+            path,
+            overwrite=overwrite,
+            run_id=run_id,
+            session_id=session_id,
+            flush_interval_s=flush_interval_s,
+        )
         logger._ensure_open()
         return logger
 
+    def flush(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.flush()
+                self._last_flush = time.monotonic()
+
     def close(self) -> None:
         with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
             if self._fp is not None:
                 try:
                     self._fp.flush()
@@ -145,22 +181,37 @@ class RunLogger:
             self._path.parent.mkdir(parents=True, exist_ok=True)
             mode = "w" if self._overwrite and not self._opened else "a"
 
-            self._fp = self._path.open(mode, encoding="utf-8", newline="\n")
+            self._fp = self._path.open(
+                mode,
+                encoding="utf-8",
+                newline="\n",
+                buffering=self._BUFFER_SIZE,
+            )
             self._opened = True
 
     def _write(self, record: dict[str, Any]) -> None:
         self._ensure_open()
 
-        payload = json.dumps(
-            record,
-            ensure_ascii=False,
-            sort_keys=True,
-            separators=(",", ":"),
-            default=str,
-        )
+        payload = _RECORD_ENCODER.encode(record)
 
         with self._lock:
             if self._fp is None:
                 return
             self._fp.write(payload + "\n")
-            self._fp.flush()
+
+            now = time.monotonic()
+            if record.get("level") != "INFO" or now - self._last_flush >= self._flush_interval_s:
+                self._fp.flush()
+                self._last_flush = now
+            elif self._flush_timer is None:
+                delay = self._flush_interval_s - (now - self._last_flush)
+                self._flush_timer = Timer(delay, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            if self._fp is not None:
+                self._fp.flush()
+                self._last_flush = time.monotonic()
@@ -3,13 +3,15 @@ from __future__ import annotations
 import json
 import sqlite3
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Iterator, Mapping
 
 from .errors import StorageError
 from .llm_schema import LLMDecision
+from .normalize import hashtags_from_apify_item, owner_key_from_apify_item
 from .storage_schema import initialize_sqlite
 
 
@@ -56,6 +58,84 @@ class EligiblePostRecord:
     decision_json: str
 
 
+@dataclass(frozen=True)
+class RawPostWrite:
+    post_key: str
+    url: str
+    raw_item: Mapping[str, Any]
+    actor_source: str | None = None
+    fetched_at: str | None = None
+
+
+@dataclass(frozen=True)
+class DecisionWrite:
+    post_key: str
+    url: str
+    model: str
+    decision: LLMDecision
+    tokens_total: int | None = None
+    created_at: str | None = None
+    latency_ms: int | None = None
+
+
+_UPSERT_RAW_POST_SQL = """
+INSERT INTO raw_posts(post_key, url, actor_source, raw_json, fetched_at, owner_key)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(post_key) DO UPDATE SET
+  url = excluded.url,
+  actor_source = COALESCE(excluded.actor_source, raw_posts.actor_source),
+  raw_json = excluded.raw_json,
+  fetched_at = excluded.fetched_at,
+  owner_key = excluded.owner_key
+""".strip()
+
+_DELETE_RAW_POST_HASHTAGS_SQL = "DELETE FROM raw_post_hashtags WHERE post_key = ?"
+
+_INSERT_RAW_POST_HASHTAG_SQL = """
+INSERT OR IGNORE INTO raw_post_hashtags(post_key, hashtag) VALUES (?, ?)
+""".strip()
+
+_INSERT_DECISION_SQL = """
+INSERT INTO llm_decisions(
+  post_key, url, model, eligible, overall_confidence,
+  decision_json, tokens_total, created_at, latency_ms
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+""".strip()
+
+
+def _raw_post_params(row: RawPostWrite) -> tuple[Any, ...]:
+    key = (row.post_key or "").strip()
+    u = (row.url or "").strip()
+    if not key or not u:
+        raise ValueError("post_key and url must be non-empty")
+
+    raw_json = _json_dumps(dict(row.raw_item))
+    src = (row.actor_source or "").strip() or None
+    ts = (row.fetched_at or _utc_now_iso()).strip()
+    return (key, u, src, raw_json, ts, owner_key_from_apify_item(row.raw_item))
+
+
+def _decision_params(row: DecisionWrite) -> tuple[Any, ...]:
+    key = (row.post_key or "").strip()
+    u = (row.url or "").strip()
+    m = (row.model or "").strip()
+    if not key or not u or not m:
+        raise ValueError("post_key, url, and model must be non-empty")
+
+    decision = row.decision
+    eligible_int = 1 if decision.eligible else 0
+    confidence = float(decision.overall_confidence)
+    decision_json = decision.model_dump_json(
+        indent=None,
+        by_alias=False,
+        exclude_none=False,
+    )
+    ts = (row.created_at or _utc_now_iso()).strip()
+    tok = int(row.tokens_total) if row.tokens_total is not None else None
+    latency = int(row.latency_ms) if row.latency_ms is not None else None
+    return (key, u, m, eligible_int, confidence, decision_json, tok, ts, latency)
+
+
 class SQLiteStateStore:
     """
     Small persistence layer for a resume-capable run state.
@@ -100,6 +180,23 @@ class SQLiteStateStore:
     def conn(self) -> sqlite3.Connection:
         return self._conn
 
+    @contextmanager
+    def read_snapshot(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run several reads inside one transaction so they see a consistent snapshot.
+
+        Nested use (or use inside an open write transaction) simply reuses the outer one.
+        """
+        if self._conn.in_transaction:
+            yield self._conn
+            return
+
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        finally:
+            self._conn.rollback()
+
     def create_run(
         self,
         *,
@@ -247,31 +344,45 @@ class SQLiteStateStore:
         actor_source: str | None = None,
         fetched_at: str | None = None,
     ) -> None:
-        key = (post_key or "").strip()
-        u = (url or "").strip()
-        if not key or not u:
-            raise ValueError("post_key and url must be non-empty")
+        self.upsert_raw_posts(
+            [
+                RawPostWrite(
+                    post_key=post_key,
+                    url=url,
+                    raw_item=raw_item,
+                    actor_source=actor_source,
+                    fetched_at=fetched_at,
+                )
+            ]
+        )
 
-        raw_json = _json_dumps(dict(raw_item))
-        src = (actor_source or "").strip() or None
-        ts = (fetched_at or _utc_now_iso()).strip()
+    def upsert_raw_posts(self, rows: Iterable[RawPostWrite]) -> int:
+        """
+        Upsert a batch of raw posts in a single transaction.
+
+        Returns the number of rows written.
+        """
+        rows = list(rows)
+        params = [_raw_post_params(r) for r in rows]
+        if not params:
+            return 0
+
+        # An upsert may change raw_json, so each post's hashtag rows are replaced wholesale.
+        keys = [(p[0],) for p in params]
+        tag_rows = [
+            (key, tag)
+            for (key,), r in zip(keys, rows)
+            for tag in hashtags_from_apify_item(r.raw_item)
+        ]
 
         try:
             with self._conn:
-                self._conn.execute(
-                    """
-                    INSERT INTO raw_posts(post_key, url, actor_source, raw_json, fetched_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    ON CONFLICT(post_key) DO UPDATE SET
-                      url = excluded.url,
-                      actor_source = COALESCE(excluded.actor_source, raw_posts.actor_source),
-                      raw_json = excluded.raw_json,
-                      fetched_at = excluded.fetched_at
-                    """.strip(),
-                    (key, u, src, raw_json, ts),
-                )
+                self._conn.executemany(_UPSERT_RAW_POST_SQL, params)
+                self._conn.executemany(_DELETE_RAW_POST_HASHTAGS_SQL, keys)
+                self._conn.executemany(_INSERT_RAW_POST_HASHTAG_SQL, tag_rows)
         except sqlite3.DatabaseError as e:
             raise StorageError(f"Failed to upsert raw post: {e}") from e
+        return len(params)
 
     def seen_post_keys(self, *, limit: int | None = None) -> set[str]:
         if limit is not None and limit <= 0:
@@ -283,8 +394,7 @@ class SQLiteStateStore:
             sql += " LIMIT ?"
             params = (int(limit),)
 
-        rows = self._conn.execute(sql, params).fetchall()
-        return {str(r["post_key"]) for r in rows}
+        return {str(r["post_key"]) for r in self._conn.execute(sql, params)}
 
     def record_llm_decision(
         self,
@@ -295,41 +405,42 @@ class SQLiteStateStore:
         decision: LLMDecision,
         tokens_total: int | None = None,
         created_at: str | None = None,
+        latency_ms: int | None = None,
     ) -> None:
-        key = (post_key or "").strip()
-        u = (url or "").strip()
-        m = (model or "").strip()
-        if not key or not u or not m:
-            raise ValueError("post_key, url, and model must be non-empty")
-
-        eligible_int = 1 if decision.eligible else 0
-        confidence = float(decision.overall_confidence)
-        decision_json = decision.model_dump_json(
-            indent=None,
-            by_alias=False,
-            exclude_none=False,
+        self.record_llm_decisions(
+            [
+                DecisionWrite(
+                    post_key=post_key,
+                    url=url,
+                    model=model,
+                    decision=decision,
+                    tokens_total=tokens_total,
+                    created_at=created_at,
+                    latency_ms=latency_ms,
+                )
+            ]
         )
-        ts = (created_at or _utc_now_iso()).strip()
 
-        tok = int(tokens_total) if tokens_total is not None else None
+    def record_llm_decisions(self, rows: Iterable[DecisionWrite]) -> int:
+        """
+        Insert a batch of decisions in a single transaction.
+
+        Returns the number of rows written. The batch is rolled back as a whole on failure.
+        """
+        params = [_decision_params(r) for r in rows]
+        if not params:
+            return 0
 
         try:
             with self._conn:
-                self._conn.execute(
-                    """
-                    INSERT INTO llm_decisions(
-                      post_key, url, model, eligible, overall_confidence,
-                      decision_json, tokens_total, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """.strip(),
-                    (key, u, m, eligible_int, confidence, decision_json, tok, ts),
-                )
+                self._conn.executemany(_INSERT_DECISION_SQL, params)
         except sqlite3.IntegrityError as e:
             raise StorageError(
                 "Failed to record decision; ensure raw_posts contains post_key first"
             ) from e
         except sqlite3.DatabaseError as e:
             raise StorageError(f"Failed to record decision: {e}") from e
+        return len(params)
 
     def latest_decision(self, post_key: str) -> LLMDecision | None:
         key = (post_key or "").strip()
@@ -374,23 +485,20 @@ class SQLiteStateStore:
             sql += " LIMIT ?"
             params = (int(limit),)
 
-        rows = self._conn.execute(sql, params).fetchall()
-        out: list[EligiblePostRecord] = []
-        for r in rows:
-            out.append(
-                EligiblePostRecord(
-                    post_key=str(r["post_key"]),
-                    url=str(r["url"]),
-                    actor_source=str(r["actor_source"]) if r["actor_source"] is not None else None,
-                    fetched_at=str(r["fetched_at"]),
-                    model=str(r["model"]),
-                    overall_confidence=float(r["overall_confidence"]),
-                    tokens_total=int(r["tokens_total"]) if r["tokens_total"] is not None else None,
-                    decided_at=str(r["decided_at"]),
-                    decision_json=str(r["decision_json"]),
-                )
+        return [
+            EligiblePostRecord(
+                post_key=str(r["post_key"]),
+                url=str(r["url"]),
+                actor_source=str(r["actor_source"]) if r["actor_source"] is not None else None,
+                fetched_at=str(r["fetched_at"]),
+                model=str(r["model"]),
+                overall_confidence=float(r["overall_confidence"]),
+                tokens_total=int(r["tokens_total"]) if r["tokens_total"] is not None else None,
+                decided_at=str(r["decided_at"]),
+                decision_json=str(r["decision_json"]),
             )
-        return out
+            for r in self._conn.execute(sql, params)
+        ]
 
     def raw_post_count(self) -> int:
         row = self._conn.execute("SELECT COUNT(1) AS n FROM raw_posts").fetchone()
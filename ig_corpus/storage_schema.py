@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
 import sqlite3
 from datetime import datetime, timezone
+from typing import Callable
 
-SCHEMA_VERSION = 2
+from .normalize import hashtags_from_apify_item, owner_key_from_apify_item
+
+SCHEMA_VERSION = 5
 
 
 def _utc_now_iso() -> str:
@@ -24,6 +28,15 @@ def _configure_connection(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA busy_timeout = 5000")
 
+    # Read-heavy exports scan raw_json/decision_json repeatedly; keep temp b-trees in
+    # memory and give the page cache (64 MiB) and mmap window (256 MiB) some headroom.
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    try:
+        conn.execute("PRAGMA mmap_size = 268435456")
+    except sqlite3.DatabaseError:
+        pass
+
     # WAL is best-effort (e.g., in-memory DBs won't use it).
     try:
         conn.execute("PRAGMA journal_mode = WAL")
@@ -163,6 +176,75 @@ JOIN raw_posts p
 JOIN latest_llm_decisions d
   ON d.post_key = p.post_key;
 """.strip(),
+    3: """
+-- Pool/rejected reads filter on eligible and order by (created_at, post_key); let an index
+-- drive that order instead of sorting every decision in a temp b-tree.
+DROP INDEX IF EXISTS idx_llm_decisions_eligible;
+
+CREATE INDEX IF NOT EXISTS idx_llm_decisions_eligible_created
+  ON llm_decisions(eligible, created_at, post_key);
+
+-- Same rows as v1 (max id per post_key), but as an anti-join the planner can push filters
+-- and ORDER BY through instead of materializing the GROUP BY first.
+DROP VIEW IF EXISTS latest_llm_decisions;
+
+CREATE VIEW latest_llm_decisions AS
+SELECT d.*
+FROM llm_decisions d
+WHERE NOT EXISTS (
+  SELECT 1
+  FROM llm_decisions newer
+  WHERE newer.post_key = d.post_key AND newer.id > d.id
+);
+""".strip(),
+    4: """
+-- Per-post facts the feedback loop tallies on startup, derived from raw_json at write time
+-- so the counters come from GROUP BY queries instead of re-parsing every payload.
+ALTER TABLE raw_posts ADD COLUMN owner_key TEXT;
+
+CREATE TABLE IF NOT EXISTS raw_post_hashtags (
+  post_key TEXT NOT NULL,
+  hashtag TEXT NOT NULL,
+  PRIMARY KEY (post_key, hashtag),
+  FOREIGN KEY (post_key) REFERENCES raw_posts(post_key) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_raw_post_hashtags_hashtag
+  ON raw_post_hashtags(hashtag);
+""".strip(),
+    5: """
+-- Wall-clock milliseconds spent labeling a post (retries and escalation included);
+-- NULL for rows written before v5 and for Batch API results.
+ALTER TABLE llm_decisions ADD COLUMN latency_ms INTEGER;
+""".strip(),
+}
+
+
+def _backfill_raw_post_index(conn: sqlite3.Connection) -> None:
+    owners: list[tuple[str | None, str]] = []
+    tags: list[tuple[str, str]] = []
+
+    for post_key, raw_json in conn.execute("SELECT post_key, raw_json FROM raw_posts"):
+        try:
+            item = json.loads(raw_json)
+        except Exception:
+            continue
+        if not isinstance(item, dict):
+            continue
+
+        owners.append((owner_key_from_apify_item(item), post_key))
+        tags.extend((post_key, tag) for tag in hashtags_from_apify_item(item))
+
+    conn.executemany("UPDATE raw_posts SET owner_key = ? WHERE post_key = ?", owners)
+    conn.executemany(
+        "INSERT OR IGNORE INTO raw_post_hashtags(post_key, hashtag) VALUES (?, ?)",
+        tags,
+    )
+
+
+# Data backfills that need Python; each runs right after its version's script.
+_MIGRATION_HOOKS: dict[int, Callable[[sqlite3.Connection], None]] = {
+    4: _backfill_raw_post_index,
 }
 
 
@@ -185,6 +267,9 @@ def _apply_migrations(conn: sqlite3.Connection) -> None:
 
         with conn:
             conn.executescript(script)
+            hook = _MIGRATION_HOOKS.get(version)
+            if hook is not None:
+                hook(conn)
             conn.execute(
                 "INSERT INTO schema_migrations(version, applied_at) VALUES (?, ?)",
                 (version, _utc_now_iso()),
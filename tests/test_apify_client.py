@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import threading
 import unittest
 from typing import Any
 
 
-class _FakeDatasetClient:
+class _FakePage:
     def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items = items
+
+
+class _FakeDatasetClient:
+    def __init__(self, items: list[dict[str, Any]], *, item_count: int | None = None) -> None:
         self._items = items
+        self._item_count = len(items) if item_count is None else item_count
         self.calls: list[dict[str, Any]] = []
+        self.get_calls = 0
+        self._lock = threading.Lock()
+
+    def get(self) -> dict[str, Any]:
+        self.get_calls += 1
+        return {"itemCount": self._item_count}
 
-    def iterate_items(self, *, limit: int | None = None, clean: bool | None = None) -> Any:
-        self.calls.append({"limit": limit, "clean": clean})
-        n = len(self._items) if limit is None else min(limit, len(self._items))
-        for i in range(n):
-            yield self._items[i]
+    def list_items(
+        self, *, offset: int | None = None, limit: int | None = None, clean: bool | None = None
+    ) -> _FakePage:
+        with self._lock:
+            self.calls.append({"offset": offset, "limit": limit, "clean": clean})
+        start = offset or 0
+        end = len(self._items) if limit is None else min(start + limit, len(self._items))
+        return _FakePage(self._items[start:end])
 
 
 class _FakeActorClient:
@@ -21,22 +37,71 @@ class _FakeActorClient:
         self._run_result = run_result
         self.calls: list[dict[str, Any]] = []
 
-    def call(self, *, run_input: Any = None, timeout_secs: int | None = None) -> Any:
+    def start(self, *, run_input: Any = None, timeout_secs: int | None = None) -> Any:
         self.calls.append({"run_input": run_input, "timeout_secs": timeout_secs})
         return self._run_result
 
 
+class _FakeRunClient:
+    def __init__(self, run_result: dict[str, Any] | None) -> None:
+        self._run_result = run_result
+        self.aborted = threading.Event()
+
+    def wait_for_finish(self, *, wait_secs: int | None = None) -> Any:
+        return self._run_result
+
+    def abort(self) -> Any:
+        self.aborted.set()
+        return self._run_result
+
+
+class _PerBatchActorClient:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def start(self, *, run_input: Any = None, timeout_secs: int | None = None) -> Any:
+        with self._lock:
+            self.calls.append({"run_input": run_input, "timeout_secs": timeout_secs})
+        tag = "-".join(run_input["hashtags"])
+        return {"id": f"run_{tag}", "defaultDatasetId": f"ds_{tag}"}
+
+
+class _PerBatchDatasetClient(_FakeDatasetClient):
+    def __init__(self, dataset_id: str) -> None:
+        super().__init__([{"url": dataset_id}])
+
+
+class _PerBatchApifyClient:
+    def __init__(self) -> None:
+        self._actor_client = _PerBatchActorClient()
+
+    def actor(self, actor_id: str) -> _PerBatchActorClient:
+        return self._actor_client
+
+    def run(self, run_id: str) -> _FakeRunClient:
+        tag = run_id.removeprefix("run_")
+        return _FakeRunClient({"id": run_id, "defaultDatasetId": f"ds_{tag}"})
+
+    def dataset(self, dataset_id: str) -> _PerBatchDatasetClient:
+        return _PerBatchDatasetClient(dataset_id)
+
+
 class _FakeApifyClient:
     def __init__(self, *, run_result: dict[str, Any] | None, items: list[dict[str, Any]]) -> None:
         self.actor_ids: list[str] = []
         self.dataset_ids: list[str] = []
         self._actor_client = _FakeActorClient(run_result)
+        self._run_client = _FakeRunClient(run_result)
         self._dataset_client = _FakeDatasetClient(items)
 
     def actor(self, actor_id: str) -> _FakeActorClient:
         self.actor_ids.append(actor_id)
         return self._actor_client
 
+    def run(self, run_id: str) -> _FakeRunClient:
+        return self._run_client
+
     def dataset(self, dataset_id: str) -> _FakeDatasetClient:
         self.dataset_ids.append(dataset_id)
         return self._dataset_client
@@ -114,6 +179,126 @@ class TestInstagramHashtagScraper(unittest.TestCase):
         self.assertEqual(first_input["hashtags"], ["a", "b"])
         self.assertEqual(second_input["hashtags"], ["c"])
 
+    def test_run_and_fetch_many_concurrent_preserves_batch_order(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+        from ig_corpus.config_schema import ApifyConfig
+
+        fake = _PerBatchApifyClient()
+        apify_cfg = ApifyConfig(
+            token_env="APIFY_TOKEN",
+            primary_actor="apify/instagram-hashtag-scraper",
+            fallback_actor="apify/instagram-scraper",
+            results_type="posts",
+            results_limit_per_query=1,
+            keyword_search=True,
+            run_batch_queries=1,
+            max_concurrent_runs=3,
+        )
+        scraper = InstagramHashtagScraper("x", client=fake)  # type: ignore[arg-type]
+        runs, items = scraper.run_and_fetch_many(["a", "b", "c", "d"], apify=apify_cfg)
+
+        self.assertEqual([r.run_id for r in runs], ["run_a", "run_b", "run_c", "run_d"])
+        self.assertEqual(items, [{"url": "ds_a"}, {"url": "ds_b"}, {"url": "ds_c"}, {"url": "ds_d"}])
+        self.assertEqual(len(fake._actor_client.calls), 4)
+
+    def test_scrapers_share_client_per_token(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper, InstagramScraper
+
+        primary = InstagramHashtagScraper("token_a")
+        fallback = InstagramScraper("token_a")
+        other = InstagramScraper("token_b")
+
+        self.assertIs(primary._client, fallback._client)
+        self.assertIsNot(primary._client, other._client)
+
+    def test_fetch_dataset_items_reads_past_stale_item_count(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+
+        items = [{"url": f"u{i}"} for i in range(2500)]
+        fake = _FakeApifyClient(run_result=None, items=[])
+        fake._dataset_client = _FakeDatasetClient(items, item_count=1500)
+
+        scraper = InstagramHashtagScraper("x", client=fake)  # type: ignore[arg-type]
+        fetched = scraper.fetch_dataset_items("ds_1")
+        self.assertEqual(fetched, items)
+
+        limited = scraper.fetch_dataset_items("ds_1", limit=1200)
+        self.assertEqual(limited, items[:1200])
+
+    def test_iter_dataset_items_streams_pages(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+
+        items = [{"url": f"u{i}"} for i in range(1500)]
+        fake = _FakeApifyClient(run_result=None, items=items)
+        scraper = InstagramHashtagScraper("x", client=fake)  # type: ignore[arg-type]
+
+        it = scraper.iter_dataset_items("ds_1")
+        self.assertEqual(next(it), {"url": "u0"})
+        self.assertEqual(len(fake._dataset_client.calls), 1)
+
+        self.assertEqual(len(list(it)), 1499)
+        # The short second page ends the stream without an extra empty read.
+        self.assertEqual([c["offset"] for c in fake._dataset_client.calls], [0, 1000])
+
+    def test_fetch_dataset_items_round_trips(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+
+        small = _FakeApifyClient(run_result=None, items=[{"url": f"u{i}"} for i in range(5)])
+        scraper = InstagramHashtagScraper("x", client=small)  # type: ignore[arg-type]
+        self.assertEqual(len(scraper.fetch_dataset_items("ds_1")), 5)
+        self.assertEqual((len(small._dataset_client.calls), small._dataset_client.get_calls), (1, 0))
+
+        large = _FakeApifyClient(run_result=None, items=[{"url": f"u{i}"} for i in range(2500)])
+        scraper = InstagramHashtagScraper("x", client=large)  # type: ignore[arg-type]
+        self.assertEqual(len(scraper.fetch_dataset_items("ds_1")), 2500)
+        self.assertEqual(sorted(c["offset"] for c in large._dataset_client.calls), [0, 1000, 2000])
+        self.assertEqual(large._dataset_client.get_calls, 1)
+
+    def test_fetch_dataset_items_cache(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+
+        fake = _FakeApifyClient(run_result=None, items=[{"url": "u1"}])
+        scraper = InstagramHashtagScraper("x", client=fake, cache_datasets=True)  # type: ignore[arg-type]
+
+        self.assertEqual(scraper.fetch_dataset_items("ds_1"), [{"url": "u1"}])
+        self.assertEqual(scraper.fetch_dataset_items("ds_1"), [{"url": "u1"}])
+        self.assertEqual(fake.dataset_ids, ["ds_1"])
+
+        scraper.invalidate("ds_1")
+        scraper.fetch_dataset_items("ds_1")
+        self.assertEqual(fake.dataset_ids, ["ds_1", "ds_1"])
+
+    def test_iter_dataset_items_fills_cache_once_consumed(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+
+        fake = _FakeApifyClient(run_result=None, items=[{"url": "u1"}, {"url": "u2"}])
+        scraper = InstagramHashtagScraper("x", client=fake, cache_datasets=True)  # type: ignore[arg-type]
+
+        partial = scraper.iter_dataset_items("ds_1")
+        self.assertEqual(next(partial), {"url": "u1"})
+        partial.close()
+        self.assertEqual(list(scraper.iter_dataset_items("ds_1")), [{"url": "u1"}, {"url": "u2"}])
+        self.assertEqual(fake.dataset_ids, ["ds_1", "ds_1"])
+
+        self.assertEqual(list(scraper.iter_dataset_items("ds_1")), [{"url": "u1"}, {"url": "u2"}])
+        self.assertEqual(scraper.fetch_dataset_items("ds_1"), [{"url": "u1"}, {"url": "u2"}])
+        self.assertEqual(fake.dataset_ids, ["ds_1", "ds_1"])
+
+    def test_build_scrapers_shares_one_client(self) -> None:
+        from ig_corpus.apify_client import build_scrapers
+        from ig_corpus.config_schema import ApifyConfig
+
+        fake = _FakeApifyClient(run_result=None, items=[])
+        primary, fallback = build_scrapers(
+            "x",
+            apify=ApifyConfig(cache_datasets=True),
+            client=fake,  # type: ignore[arg-type]
+        )
+
+        self.assertIs(primary._client, fake)
+        self.assertIs(fallback._client, fake)
+        self.assertTrue(primary._cache_datasets)
+
     def test_run_once_raises_on_failed_run(self) -> None:
         from ig_corpus.apify_client import InstagramHashtagScraper
         from ig_corpus.config_schema import ApifyConfig
@@ -133,6 +318,43 @@ class TestInstagramHashtagScraper(unittest.TestCase):
         with self.assertRaises(ApifyError):
             scraper.run_once(["rainbow"], apify=apify_cfg)
 
+    def test_abort_active_runs_stops_a_blocked_run(self) -> None:
+        from ig_corpus.apify_client import InstagramHashtagScraper
+        from ig_corpus.config_schema import ApifyConfig
+        from ig_corpus.errors import ApifyError
+
+        class _BlockingRunClient(_FakeRunClient):
+            def wait_for_finish(self, *, wait_secs: int | None = None) -> Any:
+                self.aborted.wait(timeout=5)
+                return {"id": "run_1", "defaultDatasetId": "ds_1", "status": "ABORTED"}
+
+        fake = _FakeApifyClient(run_result={"id": "run_1", "defaultDatasetId": "ds_1"}, items=[])
+        fake._run_client = _BlockingRunClient(None)
+        scraper = InstagramHashtagScraper("x", client=fake)  # type: ignore[arg-type]
+
+        errors: list[BaseException] = []
+
+        def _run() -> None:
+            try:
+                scraper.run_once(["rainbow"], apify=ApifyConfig())
+            except BaseException as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=_run)
+        worker.start()
+        for _ in range(500):
+            if scraper._active_runs:
+                break
+            worker.join(timeout=0.01)
+
+        self.assertEqual(scraper.abort_active_runs(), ["run_1"])
+        worker.join(timeout=5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ApifyError)
+        self.assertEqual(scraper.abort_active_runs(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
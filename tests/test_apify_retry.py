@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+
+
+class TestApifyRetryPolicy(unittest.TestCase):
+    def test_transport_errors_are_retryable(self) -> None:
+        import impit
+
+        from ig_corpus.apify_retry import is_retryable_apify_exception
+
+        retryable, _, reason = is_retryable_apify_exception(impit.ReadError("reset"))
+        self.assertTrue(retryable)
+        self.assertEqual(reason, "network_error")
+
+    def test_name_heuristic_still_applies(self) -> None:
+        from ig_corpus.apify_retry import is_retryable_apify_exception
+
+        class GatewayTimeoutLike(Exception):
+            pass
+
+        self.assertTrue(is_retryable_apify_exception(GatewayTimeoutLike("x"))[0])
+        self.assertFalse(is_retryable_apify_exception(ValueError("x"))[0])
+
+    def test_extract_status_code_falls_back_to_alternate_attributes(self) -> None:
+        from ig_corpus.apify_retry import _extract_status_code
+
+        class _Exc(Exception):
+            def __init__(self, **attrs: object) -> None:
+                super().__init__("x")
+                for k, v in attrs.items():
+                    setattr(self, k, v)
+
+        self.assertEqual(_extract_status_code(_Exc(status_code=503)), 503)
+        self.assertEqual(_extract_status_code(_Exc(status_code="bad", statusCode="429")), 429)
+        self.assertIsNone(_extract_status_code(_Exc()))
+
+
+if __name__ == "__main__":
+    unittest.main()
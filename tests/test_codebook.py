@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import unittest
+from typing import Any
+
+from ig_corpus.codebook import collect_codebook_data, fetch_pool_tag_counts
+from ig_corpus.config_schema import AppConfig, TargetsConfig
+from ig_corpus.llm_schema import LLMDecision
+from ig_corpus.storage import SQLiteStateStore
+
+
+def _decision(
+    *,
+    eligible: bool,
+    genre: str = "training_log",
+    narrative_labels: list[str] | None = None,
+    discourse_moves: list[str] | None = None,
+    neoliberal_signals: list[str] | None = None,
+) -> LLMDecision:
+    payload: dict[str, Any] = {
+        "eligible": eligible,
+        "eligibility_reasons": ["ok" if eligible else "reject"],
+        "language": {"is_english": True, "confidence": 0.9},
+        "topic": {
+            "is_bodyweight_calisthenics": True,
+            "confidence": 0.9,
+            "topic_notes": "test",
+        },
+        "commercial": {"is_exclusively_commercial": False, "signals": []},
+        "caption_quality": {"is_analyzable": True, "issues": []},
+        "tags": {
+            "genre": genre,
+            "narrative_labels": narrative_labels or [],
+            "discourse_moves": discourse_moves or [],
+            "neoliberal_signals": neoliberal_signals or [],
+        },
+        "overall_confidence": 0.9,
+    }
+    return LLMDecision.model_validate(payload)
+
+
+def _add_post(
+    store: SQLiteStateStore,
+    n: int,
+    *,
+    hashtags: Any,
+    decision: LLMDecision,
+) -> None:
+    key = f"id:{n}"
+    url = f"https://example.com/p/{n}"
+    store.upsert_raw_post(
+        post_key=key,
+        url=url,
+        raw_item={"url": url, "caption": "x" * 80, "hashtags": hashtags},
+        fetched_at="2025-12-01T00:00:00+00:00",
+    )
+    store.record_llm_decision(
+        post_key=key,
+        url=url,
+        model="gpt-5-nano",
+        decision=decision,
+        created_at=f"2025-12-01T00:00:0{n}+00:00",
+    )
+
+
+class TestCollectCodebookData(unittest.TestCase):
+    def test_counts_and_tag_stats_cover_eligible_pool_only(self) -> None:
+        cfg = AppConfig(targets=TargetsConfig(final_n=1, pool_n=2, sampling_seed=1))
+
+        with SQLiteStateStore.open(":memory:") as store:
+            store.create_run(config_hash="h", sampling_seed=1, run_id="run_test")
+            store.record_apify_actor_run(
+                run_id="run_test",
+                actor_id="apify/instagram-hashtag-scraper",
+                actor_run_id="run_1",
+                dataset_id="ds_1",
+                created_at="2025-12-01T00:00:00+00:00",
+            )
+
+            _add_post(
+                store,
+                1,
+                hashtags=["#Pullups", "pullups", "dips"],
+                decision=_decision(
+                    eligible=True,
+                    narrative_labels=["consistency", "  "],
+                    discourse_moves=["advice"],
+                ),
+            )
+            _add_post(
+                store,
+                2,
+                hashtags="Dips",
+                decision=_decision(
+                    eligible=True,
+                    genre="motivation_mindset",
+                    narrative_labels=[" consistency "],
+                    neoliberal_signals=["hustle"],
+                ),
+            )
+            _add_post(
+                store,
+                3,
+                hashtags=["ignored"],
+                decision=_decision(eligible=False, narrative_labels=["ignored"]),
+            )
+            # Eligible, but outside the pool_n window.
+            _add_post(
+                store,
+                4,
+                hashtags=["late"],
+                decision=_decision(eligible=True, narrative_labels=["late"]),
+            )
+
+            data = collect_codebook_data(cfg, store, run_id="run_test")
+
+        self.assertEqual(data.counts.raw_posts, 4)
+        self.assertEqual(data.counts.decision_records, 4)
+        self.assertEqual(data.counts.labeled_posts, 4)
+        self.assertEqual(data.counts.eligible_total, 3)
+        self.assertEqual(data.counts.rejected_total, 1)
+        self.assertEqual(data.counts.eligible_in_pool, 2)
+        self.assertEqual(data.counts.final_sample_n, 1)
+        self.assertEqual(data.counts.invalid_pool_decisions, 0)
+
+        self.assertEqual(data.stats.top_hashtags, [("Dips", 1), ("dips", 1), ("Pullups", 1)])
+        self.assertEqual(data.stats.top_genres, [("motivation_mindset", 1), ("training_log", 1)])
+        self.assertEqual(data.stats.top_narrative_labels, [("consistency", 2)])
+        self.assertEqual(data.stats.top_discourse_moves, [("advice", 1)])
+        self.assertEqual(data.stats.top_neoliberal_signals, [("hustle", 1)])
+
+        self.assertEqual([r.actor_run_id for r in data.actor_runs], ["run_1"])
+        self.assertIsNotNone(data.run)
+
+    def test_tag_counts_strip_unicode_whitespace_and_count_invalid_rows(self) -> None:
+        with SQLiteStateStore.open(":memory:") as store:
+            _add_post(
+                store,
+                1,
+                hashtags=[],
+                decision=_decision(eligible=True, narrative_labels=["\u00a0grind\u2003", "\u00a0"]),
+            )
+            _add_post(store, 2, hashtags=[], decision=_decision(eligible=True, narrative_labels=["grind"]))
+            _add_post(store, 3, hashtags=[], decision=_decision(eligible=True, narrative_labels=["grind"]))
+            store.conn.execute("UPDATE llm_decisions SET decision_json = '{' WHERE post_key = 'id:3'")
+
+            counts = fetch_pool_tag_counts(store, limit=10, include_models=True)
+
+        self.assertEqual(counts.narrative_labels, {"grind": 2})
+        self.assertEqual(counts.genre, {"training_log": 2})
+        self.assertEqual(counts.model, {"gpt-5-nano": 3})
+        self.assertEqual(counts.invalid_decisions, 1)
+
+    def test_blank_run_id_skips_run_lookups(self) -> None:
+        cfg = AppConfig(targets=TargetsConfig(final_n=1, pool_n=2, sampling_seed=1))
+
+        with SQLiteStateStore.open(":memory:") as store:
+            _add_post(store, 1, hashtags=["pullups"], decision=_decision(eligible=True))
+            data = collect_codebook_data(cfg, store, run_id="  ")
+
+        self.assertIsNone(data.run)
+        self.assertEqual(data.actor_runs, [])
+        self.assertEqual(data.counts.eligible_in_pool, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
 
-from ig_corpus.config import load_config, resolve_runtime_secrets
+from ig_corpus.config import config_sha256, load_config, resolve_runtime_secrets
 from ig_corpus.errors import ConfigError
 
 
@@ -74,6 +75,64 @@ class TestConfig(unittest.TestCase):
             with self.assertRaises(ConfigError):
                 load_config(path)
 
+    def test_load_config_rejects_screening_with_grouped_requests(self) -> None:
+        bad_yaml = _VALID_YAML.replace(
+            "  max_output_tokens: 16000\n",
+            "  max_output_tokens: 16000\n  posts_per_request: 4\n  screen_rejects: true\n",
+        )
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "config.yaml"
+            path.write_text(bad_yaml, encoding="utf-8")
+
+            with self.assertRaises(ConfigError):
+                load_config(path)
+
+    def test_load_config_rejects_batch_api_with_screening_or_grouping(self) -> None:
+        for extra in ("  screen_rejects: true\n", "  posts_per_request: 4\n"):
+            bad_yaml = _VALID_YAML.replace(
+                "  max_output_tokens: 16000\n",
+                "  max_output_tokens: 16000\n  use_batch_api: true\n" + extra,
+            )
+            with self.subTest(extra=extra.strip()), tempfile.TemporaryDirectory() as td:
+                path = Path(td) / "config.yaml"
+                path.write_text(bad_yaml, encoding="utf-8")
+
+                with self.assertRaises(ConfigError):
+                    load_config(path)
+
+    def test_load_config_reuses_cached_config_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "config.yaml"
+            path.write_text(_VALID_YAML, encoding="utf-8")
+
+            first = load_config(path)
+            self.assertIs(load_config(path), first)
+
+            path.write_text(_VALID_YAML.replace("final_n: 5", "final_n: 4"), encoding="utf-8")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            reloaded = load_config(path)
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(reloaded.targets.final_n, 4)
+
+    def test_config_sha256_is_memoized_and_matches_equal_configs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "config.yaml"
+            path.write_text(_VALID_YAML, encoding="utf-8")
+            cfg = load_config(path)
+
+            digest = config_sha256(cfg)
+            self.assertEqual(len(digest), 64)
+            self.assertEqual(config_sha256(cfg), digest)
+
+            copy = cfg.model_copy(deep=True)
+            self.assertIsNot(copy, cfg)
+            self.assertEqual(config_sha256(copy), digest)
+
+            changed = cfg.model_copy(update={"targets": cfg.targets.model_copy(update={"final_n": 4})})
+            self.assertNotEqual(config_sha256(changed), digest)
+
     def test_resolve_runtime_secrets_requires_env(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             path = Path(td) / "config.yaml"
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import unittest
 
-from ig_corpus.dedupe import canonicalize_url, dedupe_key
+from ig_corpus.dedupe import SeenKeys, canonicalize_url, dedupe_key
 from ig_corpus.post import NormalizedPost
 
 
@@ -12,6 +12,13 @@ class TestDedupe(unittest.TestCase):
         url = "https://www.instagram.com/p/AbC/?utm_source=x#frag"
         self.assertEqual(canonicalize_url(url), "https://instagram.com/p/AbC")
 
+    def test_canonicalize_handles_bare_host_and_other_domains(self) -> None:
+        self.assertEqual(canonicalize_url("HTTP://Instagram.COM?x=1"), "http://instagram.com/")
+        self.assertEqual(
+            canonicalize_url("https://www.example.com/Path/?q=1"),
+            "https://example.com/Path",
+        )
+
     def test_dedupe_key_prefers_id(self) -> None:
         post = NormalizedPost(
             url="https://instagram.com/p/x/",
@@ -28,6 +35,18 @@ class TestDedupe(unittest.TestCase):
         )
         self.assertEqual(dedupe_key(post), "shortcode:abc")
 
+    def test_seen_keys_tracks_added_keys(self) -> None:
+        seen = SeenKeys()
+        post = NormalizedPost(url="https://instagram.com/p/x/", post_id="123")
+
+        self.assertFalse(seen.has_post(post))
+        self.assertEqual(seen.add_post(post), "id:123")
+        self.assertTrue(seen.has("id:123"))
+        self.assertFalse(seen.has("id:1234"))
+
+        seen.add("id:123")
+        self.assertEqual(len(seen), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
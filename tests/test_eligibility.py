@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from typing import Any
 
-from ig_corpus.eligibility import enforce_structured_eligibility
+from ig_corpus.eligibility import compute_structured_eligibility, enforce_structured_eligibility
 from ig_corpus.llm_schema import LLMDecision
 
 
@@ -56,6 +56,24 @@ class TestEligibilityEnforcement(unittest.TestCase):
         self.assertIn("eligibility_overridden_accept", enforced.eligibility_reasons)
         self.assertIn("model_reject", enforced.eligibility_reasons)
 
+    def test_consistent_decisions_are_returned_unchanged(self) -> None:
+        accepted = _mk_decision({})
+        rejected = _mk_decision(
+            {
+                "eligible": False,
+                "language": {"is_english": False, "confidence": 0.9},
+            }
+        )
+
+        self.assertIs(enforce_structured_eligibility(accepted), accepted)
+        self.assertIs(enforce_structured_eligibility(rejected), rejected)
+
+        self.assertEqual(compute_structured_eligibility(accepted), (True, ()))
+        self.assertEqual(
+            compute_structured_eligibility(rejected),
+            (False, ("language_not_english",)),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
 from typing import Any
+from unittest import mock
 
 from ig_corpus.config_schema import AppConfig, TargetsConfig
+from ig_corpus import export_excel
 from ig_corpus.export_excel import export_corpus_workbook
 from ig_corpus.llm_schema import LLMDecision
 from ig_corpus.storage import SQLiteStateStore
@@ -121,6 +124,167 @@ class TestExportExcel(unittest.TestCase):
             url_idx = header.index("url")
             self.assertEqual(rows[1][url_idx], "https://example.com/p/1")
 
+            tags = set(wb["tag_summary"].iter_rows(min_row=2, values_only=True))
+            self.assertIn(("genre", "training_log", 1), tags)
+            self.assertIn(("narrative_label", "consistency", 1), tags)
+            self.assertIn(("hashtag", "tag1", 1), tags)
+            self.assertIn(("model", "gpt-5-nano", 1), tags)
+            self.assertNotIn(("genre", "other", 1), tags)
+
+    def test_safe_excel_text_escapes_formula_prefixes(self) -> None:
+        f = export_excel._safe_excel_text
+        self.assertIsNone(f(None))
+        self.assertEqual(f(""), "")
+        self.assertEqual(f("=SUM(A1)"), "'=SUM(A1)")
+        self.assertEqual(f("-5 reps"), "'-5 reps")
+        self.assertEqual(f("@coach"), "'@coach")
+        self.assertEqual(f("pullups"), "pullups")
+        self.assertEqual(f(12), "12")
+
+        class _Text(str):
+            pass
+
+        self.assertEqual(f(_Text("+1")), "'+1")
+
+    def test_parallel_flatten_matches_serial(self) -> None:
+        args = [
+            (
+                f"id:{i}",
+                f"https://example.com/p/{i}",
+                "apify/actor",
+                "2025-12-01T00:00:00+00:00",
+                json.dumps({"url": f"https://example.com/p/{i}", "caption": "=x" * 40, "hashtags": ["a"]}),
+                "gpt-5-nano",
+                i if i % 2 else None,
+                "2025-12-01T00:00:01+00:00",
+                0.9,
+                _decision(eligible=bool(i % 2)).model_dump_json(),
+                i == 0,
+                True,
+            )
+            for i in range(4)
+        ]
+
+        serial = list(export_excel._FlattenPool().flatten(args))
+
+        pool = export_excel._FlattenPool()
+        try:
+            with mock.patch.object(export_excel, "_PARALLEL_MIN_ROWS", 1), mock.patch.object(
+                export_excel.os, "cpu_count", return_value=2
+            ):
+                parallel = list(pool.flatten(args))
+        finally:
+            pool.close()
+
+        self.assertEqual(parallel, serial)
+        self.assertTrue(serial[0][-1])
+
+        validated = list(export_excel._FlattenPool().flatten([a[:-1] + (False,) for a in args]))
+        self.assertEqual(validated, serial)
+
+    def test_flatten_falls_back_to_serial_when_pool_cannot_start(self) -> None:
+        args = [
+            (
+                f"id:{i}",
+                f"https://example.com/p/{i}",
+                None,
+                "2025-12-01T00:00:00+00:00",
+                json.dumps({"url": f"https://example.com/p/{i}", "caption": "x"}),
+                "gpt-5-nano",
+                None,
+                "2025-12-01T00:00:01+00:00",
+                0.9,
+                _decision(eligible=True).model_dump_json(),
+                False,
+                True,
+            )
+            for i in range(3)
+        ]
+        serial = list(export_excel._FlattenPool().flatten(args))
+
+        pool = export_excel._FlattenPool()
+        with mock.patch.object(export_excel, "_PARALLEL_MIN_ROWS", 1), mock.patch.object(
+            export_excel.os, "cpu_count", return_value=2
+        ), mock.patch.object(export_excel, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            self.assertEqual(list(pool.flatten(args)), serial)
+            # Later batches go straight to the serial path.
+            self.assertEqual(list(pool.flatten(args)), serial)
+        pool.close()
+
+    def test_flatten_pool_spawns_workers(self) -> None:
+        # The rejected-sheet prefetch thread runs while the pool starts; forking would copy it.
+        args = [
+            (
+                f"id:{i}",
+                f"https://example.com/p/{i}",
+                None,
+                "2025-12-01T00:00:00+00:00",
+                json.dumps({"url": f"https://example.com/p/{i}"}),
+                "gpt-5-nano",
+                None,
+                "2025-12-01T00:00:01+00:00",
+                0.9,
+                _decision(eligible=True).model_dump_json(),
+                False,
+                True,
+            )
+            for i in range(2)
+        ]
+        created: list[Any] = []
+        real_executor = export_excel.ProcessPoolExecutor
+
+        def _record(*a: Any, **kw: Any) -> Any:
+            created.append(kw.get("mp_context"))
+            return real_executor(*a, **kw)
+
+        pool = export_excel._FlattenPool()
+        try:
+            with mock.patch.object(export_excel, "_PARALLEL_MIN_ROWS", 1), mock.patch.object(
+                export_excel.os, "cpu_count", return_value=2
+            ), mock.patch.object(export_excel, "ProcessPoolExecutor", side_effect=_record):
+                self.assertEqual(len(list(pool.flatten(args))), 2)
+        finally:
+            pool.close()
+
+        self.assertEqual([ctx.get_start_method() for ctx in created], ["spawn"])
+
+    def test_rejected_prefetch_reads_a_second_connection(self) -> None:
+        with SQLiteStateStore.open(":memory:") as mem_store:
+            self.assertIsNone(export_excel._open_read_only_connection(mem_store))
+
+        with tempfile.TemporaryDirectory() as td, SQLiteStateStore.open(Path(td) / "state.db") as store:
+            for i in range(3):
+                key = f"id:{i}"
+                url = f"https://example.com/p/{i}"
+                store.upsert_raw_post(
+                    post_key=key,
+                    url=url,
+                    actor_source="apify/actor",
+                    raw_item={"url": url, "caption": "z" * 80},
+                    fetched_at="2025-12-01T00:00:00+00:00",
+                )
+                store.record_llm_decision(
+                    post_key=key,
+                    url=url,
+                    model="gpt-5-nano",
+                    decision=_decision(eligible=False),
+                    created_at=f"2025-12-01T00:00:0{i}+00:00",
+                )
+
+            conn = export_excel._open_read_only_connection(store)
+            self.assertIsNotNone(conn)
+            assert conn is not None
+
+            prefetched = export_excel._prefetch_latest_post_batches(
+                conn, eligible=False, limit=2, order_asc=False
+            )
+            serial = list(
+                export_excel._iter_latest_post_batches(store.conn, eligible=False, limit=2, order_asc=False)
+            )
+
+            self.assertEqual(prefetched, serial)
+            self.assertEqual([r[0] for b in prefetched for r in b], ["id:2", "id:1"])
+
 
 if __name__ == "__main__":
     unittest.main()
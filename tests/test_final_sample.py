@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import unittest
+from unittest import mock
+
+from ig_corpus import final_sample
+from ig_corpus.errors import StorageError
+from ig_corpus.final_sample import ensure_final_sample, load_final_sample_keys, pool_keys_sha256
+from ig_corpus.storage import SQLiteStateStore
+
+
+def _reference_sha(keys: list[str]) -> str:
+    payload = json.dumps(keys, ensure_ascii=False, sort_keys=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TestPoolKeysSha256(unittest.TestCase):
+    def test_matches_compact_json_digest_across_chunks(self) -> None:
+        cases = [
+            [],
+            ["id:1"],
+            ["shortcode:ABC", "url:https://www.instagram.com/p/é/", 'q"uote'],
+            [f"id:{i}" for i in range(10)],
+        ]
+
+        with mock.patch.object(final_sample, "_HASH_CHUNK_KEYS", 3):
+            for keys in cases:
+                with self.subTest(n=len(keys)):
+                    self.assertEqual(pool_keys_sha256(keys), _reference_sha(keys))
+                    self.assertEqual(pool_keys_sha256(iter(keys)), _reference_sha(keys))
+
+    def test_order_changes_digest(self) -> None:
+        self.assertNotEqual(pool_keys_sha256(["a", "b"]), pool_keys_sha256(["b", "a"]))
+
+
+class TestEnsureFinalSample(unittest.TestCase):
+    def test_persists_every_key_across_insert_chunks(self) -> None:
+        pool = [f"id:{i}" for i in range(10)]
+
+        with SQLiteStateStore.open(":memory:") as store:
+            store.create_run(config_hash="h", sampling_seed=7, versions={}, run_id="run_1")
+            for key in pool:
+                store.upsert_raw_post(
+                    post_key=key,
+                    url=f"https://example.com/p/{key}",
+                    actor_source=None,
+                    raw_item={},
+                )
+
+            with mock.patch.object(final_sample, "_FINAL_SAMPLE_INSERT_ROWS", 3):
+                keys, meta = ensure_final_sample(
+                    store,
+                    run_id="run_1",
+                    pool_keys=pool,
+                    sampling_seed=7,
+                    pool_n=10,
+                    final_n=7,
+                    persist=True,
+                )
+
+            self.assertIsNotNone(meta)
+            self.assertEqual(len(keys), 7)
+            self.assertEqual(load_final_sample_keys(store, run_id="run_1"), keys)
+
+    def test_conflicting_concurrent_meta_raises_without_writing_keys(self) -> None:
+        with SQLiteStateStore.open(":memory:") as store:
+            store.create_run(config_hash="h", sampling_seed=7, versions={}, run_id="run_1")
+            store.upsert_raw_post(post_key="id:1", url="https://example.com/p/1", raw_item={})
+            with store.conn:
+                store.conn.execute(
+                    "INSERT INTO final_sample_runs VALUES (?, ?, ?, ?, ?, ?)",
+                    ("run_1", 99, 1, 1, "other", "2025-12-01T00:00:00+00:00"),
+                )
+
+            # Simulate another writer landing between the existence check and the insert.
+            real_load = final_sample.load_final_sample_meta
+            with mock.patch.object(
+                final_sample,
+                "load_final_sample_meta",
+                side_effect=[None, real_load(store, run_id="run_1")],
+            ):
+                with self.assertRaises(StorageError):
+                    ensure_final_sample(
+                        store,
+                        run_id="run_1",
+                        pool_keys=["id:1"],
+                        sampling_seed=7,
+                        pool_n=1,
+                        final_n=1,
+                        persist=True,
+                    )
+
+            self.assertEqual(load_final_sample_keys(store, run_id="run_1"), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from typing import Any
 
+import httpx
+from openai import APITimeoutError
+from pydantic import ValidationError
+
 from ig_corpus.config_schema import OpenAIConfig
+from ig_corpus.errors import LLMError
 from ig_corpus.llm import OpenAIPostClassifier, PostForLLM
-from ig_corpus.llm_schema import DECISION_JSON_SCHEMA, DECISION_SCHEMA_NAME
+from ig_corpus.llm_cache import LRUCache
+from ig_corpus.llm_schema import (
+    DECISION_JSON_SCHEMA,
+    DECISION_SCHEMA_NAME,
+    LLMDecision,
+    decision_from_stored_json,
+)
 
 
 class _FakeOutputTextPart:
@@ -19,13 +33,32 @@ class _FakeOutputMessage:
 
 
 class _FakeResponse:
-    def __init__(self, *, output_text: str, output: list[Any] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        output_text: str,
+        output: list[Any] | None = None,
+        usage: dict[str, Any] | None = None,
+    ) -> None:
         self.output_text = output_text
         self.output = output or []
+        self.usage = usage
+
+
+class _RecordingLimiter:
+    def __init__(self) -> None:
+        self.acquired: list[int] = []
+        self.refunded: list[int] = []
+
+    def acquire(self, tokens: int = 0) -> None:
+        self.acquired.append(tokens)
+
+    def refund(self, tokens: int) -> None:
+        self.refunded.append(tokens)
 
 
 class _FakeResponses:
-    def __init__(self, responses: list[_FakeResponse]) -> None:
+    def __init__(self, responses: list[Any]) -> None:
         self._responses = list(responses)
         self.calls: list[dict[str, Any]] = []
 
@@ -33,11 +66,14 @@ class _FakeResponses:
         self.calls.append(kwargs)
         if not self._responses:
             raise AssertionError("Fake client received more calls than expected")
-        return self._responses.pop(0)
+        nxt = self._responses.pop(0)
+        if isinstance(nxt, BaseException):
+            raise nxt
+        return nxt
 
 
 class _FakeClient:
-    def __init__(self, response: _FakeResponse | list[_FakeResponse]) -> None:
+    def __init__(self, response: _FakeResponse | list[Any]) -> None:
         responses = response if isinstance(response, list) else [response]
         self.responses = _FakeResponses(responses)
 
@@ -144,6 +180,11 @@ class TestOpenAIPostClassifier(unittest.TestCase):
         self.assertEqual(len(fake.responses.calls), 2)
         self.assertEqual(fake.responses.calls[0]["model"], "gpt-5-nano")
         self.assertEqual(fake.responses.calls[1]["model"], "gpt-5-mini")
+        self.assertEqual(fake.responses.calls[0]["input"], fake.responses.calls[1]["input"])
+        self.assertEqual(
+            json.loads(fake.responses.calls[0]["input"][0]["content"])["caption"],
+            "Hi",
+        )
 
     def test_classify_escalates_on_parse_failure(self) -> None:
         cfg = OpenAIConfig(
@@ -168,5 +209,293 @@ class TestOpenAIPostClassifier(unittest.TestCase):
         self.assertEqual(fake.responses.calls[1]["model"], "gpt-5-mini")
 
 
+    def test_rate_limiter_is_charged_per_call_and_shared_by_forks(self) -> None:
+        cfg = OpenAIConfig(max_output_tokens=100, max_requests_per_minute=60)
+        fake = _FakeClient(_FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 150}))
+        limiter = _RecordingLimiter()
+        classifier = OpenAIPostClassifier(
+            "sk-test",
+            openai_cfg=cfg,
+            client=fake,  # type: ignore[arg-type]
+            rate_limiter=limiter,  # type: ignore[arg-type]
+        )
+
+        classifier.classify(PostForLLM(url="https://example.com/p/rl", caption="Hello"))
+
+        self.assertEqual(len(limiter.acquired), 1)
+        self.assertGreater(limiter.acquired[0], 100)
+        self.assertEqual(limiter.refunded, [limiter.acquired[0] - 150])
+
+        fork = classifier.fork()
+        try:
+            self.assertIs(fork._rate_limiter, limiter)
+        finally:
+            fork.close()
+
+        default = OpenAIPostClassifier("sk-test", openai_cfg=OpenAIConfig(), client=fake)  # type: ignore[arg-type]
+        self.assertIsNone(default._rate_limiter)
+
+    def test_response_cache_replays_identical_requests(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cfg = OpenAIConfig(model_escalation="", response_cache_path=str(Path(td) / "cache.sqlite"))
+            post = PostForLLM(url="https://example.com/p/cached", caption="Hello")
+
+            fake = _FakeClient(_FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 42}))
+            first = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+            try:
+                self.assertEqual(first.classify_with_metadata(post)[2], 42)
+            finally:
+                first.close()
+
+            # A fresh classifier (e.g. a rerun) reads the same file and makes no call.
+            empty = _FakeClient([])
+            second = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=empty)  # type: ignore[arg-type]
+            try:
+                decision, model, tokens = second.classify_with_metadata(post)
+                self.assertTrue(decision.eligible)
+                # Replays make no request, so they spend no tokens.
+                self.assertEqual((model, tokens), (cfg.model_primary, 0))
+                self.assertEqual(empty.responses.calls, [])
+
+                # A different post is a different request, so it still reaches the client.
+                with self.assertRaises(LLMError):
+                    second.classify(PostForLLM(url="https://example.com/p/other", caption="Hello"))
+                self.assertEqual(len(empty.responses.calls), 1)
+            finally:
+                second.close()
+
+    def test_response_cache_skips_unusable_outputs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cfg = OpenAIConfig(model_escalation="", response_cache_path=str(Path(td) / "cache.sqlite"))
+            post = PostForLLM(url="https://example.com/p/bad", caption="Hello")
+
+            truncated = _FakeResponse(output_text=_DECISION_JSON)
+            truncated.status = "incomplete"  # type: ignore[attr-defined]
+            fake = _FakeClient(
+                [
+                    _FakeResponse(output_text='{"eligible": tr'),
+                    truncated,
+                    _FakeResponse(output_text=_DECISION_JSON),
+                ]
+            )
+            classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+            try:
+                with self.assertRaises(LLMError):
+                    classifier.classify(post)
+                # Neither the invalid nor the incomplete output was stored, so each rerun calls out.
+                classifier.classify(post)
+                classifier.classify(post)
+                self.assertEqual(len(fake.responses.calls), 3)
+
+                # The first complete, valid output is the one replayed.
+                self.assertEqual(classifier.classify_with_metadata(post)[2], 0)
+                self.assertEqual(len(fake.responses.calls), 3)
+            finally:
+                classifier.close()
+
+    def test_request_timeout_is_sent_and_timed_out_attempts_are_retried(self) -> None:
+        cfg = OpenAIConfig(request_timeout_seconds=12.5, max_attempts=2, model_escalation="")
+        timeout = APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/responses"))
+        fake = _FakeClient([timeout, _FakeResponse(output_text=_DECISION_JSON)])
+        classifier = OpenAIPostClassifier(
+            "sk-test",
+            openai_cfg=cfg,
+            client=fake,  # type: ignore[arg-type]
+            sleep_fn=lambda _s: None,
+        )
+
+        self.assertTrue(classifier.classify(PostForLLM(url="https://example.com/p/t")).eligible)
+        self.assertEqual([c["timeout"] for c in fake.responses.calls], [12.5, 12.5])
+
+        fake = _FakeClient([timeout, timeout])
+        classifier = OpenAIPostClassifier(
+            "sk-test",
+            openai_cfg=cfg,
+            client=fake,  # type: ignore[arg-type]
+            sleep_fn=lambda _s: None,
+        )
+        with self.assertRaises(LLMError):
+            classifier.classify(PostForLLM(url="https://example.com/p/t"))
+        self.assertEqual(len(fake.responses.calls), 2)
+
+    def test_screening_settles_confident_rejects_and_labels_the_rest(self) -> None:
+        cfg = OpenAIConfig(screen_rejects=True, model_escalation="")
+        reject = json.loads(_DECISION_JSON)
+        reject.update(eligible=False, eligibility_reasons=["Not English"], overall_confidence=0.95)
+        reject["language"] = {"is_english": False, "confidence": 0.95}
+        del reject["tags"]
+
+        fake = _FakeClient(_FakeResponse(output_text=json.dumps(reject), usage={"total_tokens": 30}))
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        decision, _, tokens = classifier.classify_with_metadata(PostForLLM(url="https://example.com/p/s1"))
+        self.assertFalse(decision.eligible)
+        self.assertEqual(decision.eligibility_reasons, ["Not English", "screened_reject"])
+        self.assertEqual(tokens, 30)
+        self.assertEqual(len(fake.responses.calls), 1)
+        self.assertEqual(fake.responses.calls[0]["text"]["format"]["name"], "ig_corpus_post_screen")
+
+        accept = json.loads(_DECISION_JSON)
+        del accept["tags"]
+        fake = _FakeClient(
+            [
+                _FakeResponse(output_text=json.dumps(accept), usage={"total_tokens": 25}),
+                _FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 60}),
+            ]
+        )
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        decision, _, tokens = classifier.classify_with_metadata(PostForLLM(url="https://example.com/p/s2"))
+        self.assertTrue(decision.eligible)
+        # The unsettled screen is billed on top of the full labeling call.
+        self.assertEqual(tokens, 85)
+        self.assertEqual(decision.tags.genre, "training_log")
+        self.assertEqual(fake.responses.calls[1]["text"]["format"]["name"], DECISION_SCHEMA_NAME)
+
+    def test_content_cache_reuses_decisions_for_reposts(self) -> None:
+        cfg = OpenAIConfig(content_cache_size=8, model_escalation="")
+        fake = _FakeClient(_FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 40}))
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        original = PostForLLM(
+            url="https://example.com/p/a",
+            caption="Day 5  of 30",
+            hashtags=("Pullups", "calisthenics"),
+            timestamp="2025-01-01T00:00:00Z",
+        )
+        repost = PostForLLM(
+            url="https://example.com/p/b",
+            caption="Day 5 of 30",
+            hashtags=["calisthenics", "pullups"],
+            timestamp="2025-02-01T00:00:00Z",
+        )
+
+        self.assertEqual(classifier.classify_with_metadata(original)[2], 40)
+        decision, model, tokens = classifier.fork().classify_with_metadata(repost)
+
+        self.assertTrue(decision.eligible)
+        self.assertEqual((model, tokens), (cfg.model_primary, 0))
+        self.assertEqual(len(fake.responses.calls), 1)
+
+    def test_lru_cache_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c"), len(cache)), (1, 3, 2))
+
+    def test_group_request_splits_tokens_and_escalates_per_post(self) -> None:
+        cfg = OpenAIConfig(model_primary="gpt-5-nano", model_escalation="gpt-5-mini")
+        grouped = json.dumps(
+            {"decisions": [json.loads(_DECISION_JSON), json.loads(_DECISION_JSON_LOW_CONF)]}
+        )
+        fake = _FakeClient(
+            [
+                _FakeResponse(output_text=grouped, usage={"total_tokens": 101}),
+                _FakeResponse(output_text=_DECISION_JSON),
+            ]
+        )
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        posts = [
+            PostForLLM(url="https://example.com/p/g1", caption="one"),
+            PostForLLM(url="https://example.com/p/g2", caption="two"),
+        ]
+        results = classifier.classify_group_with_metadata(posts)
+
+        self.assertEqual([model for _, model, _ in results], ["gpt-5-nano", "gpt-5-mini"])
+        self.assertEqual(results[0][2], 51)
+
+        first, second = fake.responses.calls
+        self.assertEqual(first["text"]["format"]["name"], "ig_corpus_post_decisions")
+        self.assertEqual(len(json.loads(first["input"][0]["content"])), 2)
+        self.assertEqual(json.loads(second["input"][0]["content"])["url"], "https://example.com/p/g2")
+
+    def test_group_request_falls_back_to_single_calls_on_count_mismatch(self) -> None:
+        cfg = OpenAIConfig(model_primary="gpt-5-nano", model_escalation="gpt-5-nano")
+        grouped = json.dumps({"decisions": [json.loads(_DECISION_JSON)]})
+        fake = _FakeClient(
+            [
+                _FakeResponse(output_text=grouped, usage={"total_tokens": 21}),
+                _FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 30}),
+                _FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 40}),
+            ]
+        )
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        results = classifier.classify_group_with_metadata(
+            [
+                PostForLLM(url="https://example.com/p/m1"),
+                PostForLLM(url="https://example.com/p/m2"),
+            ]
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(fake.responses.calls), 3)
+        self.assertEqual(fake.responses.calls[1]["text"]["format"]["name"], DECISION_SCHEMA_NAME)
+        # The failed grouped request's 21 tokens are spread over the fallback results.
+        self.assertEqual([tokens for _, _, tokens in results], [41, 50])
+
+    def test_group_request_uses_and_fills_content_cache(self) -> None:
+        cfg = OpenAIConfig(content_cache_size=8, model_escalation="")
+        grouped = json.dumps({"decisions": [json.loads(_DECISION_JSON)] * 2})
+        fake = _FakeClient(
+            [
+                _FakeResponse(output_text=_DECISION_JSON, usage={"total_tokens": 10}),
+                _FakeResponse(output_text=grouped, usage={"total_tokens": 20}),
+            ]
+        )
+        classifier = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=fake)  # type: ignore[arg-type]
+
+        seen = PostForLLM(url="https://example.com/p/c1", caption="seen")
+        classifier.classify(seen)
+
+        posts = [
+            PostForLLM(url="https://example.com/p/c2", caption="seen"),
+            PostForLLM(url="https://example.com/p/c3", caption="new one"),
+            PostForLLM(url="https://example.com/p/c4", caption="new two"),
+        ]
+        results = classifier.classify_group_with_metadata(posts)
+
+        self.assertEqual([tokens for _, _, tokens in results], [0, 10, 10])
+        self.assertEqual(len(json.loads(fake.responses.calls[1]["input"][0]["content"])), 2)
+
+        # Grouped decisions are cached too, so a repost of either is free.
+        again = classifier.classify_with_metadata(PostForLLM(url="https://example.com/p/c5", caption="new two"))
+        self.assertEqual(again[2], 0)
+        self.assertEqual(len(fake.responses.calls), 2)
+
+
+class TestDecisionFromStoredJson(unittest.TestCase):
+    def test_matches_validated_decision(self) -> None:
+        stored = LLMDecision.model_validate_json(_DECISION_JSON).model_dump_json()
+        self.assertEqual(decision_from_stored_json(stored), LLMDecision.model_validate_json(stored))
+
+    def test_malformed_payload_falls_back_to_validation(self) -> None:
+        with self.assertRaises(ValidationError):
+            decision_from_stored_json('{"eligible": true}')
+
+    def test_mistyped_tag_field_falls_back_to_validation(self) -> None:
+        data = json.loads(LLMDecision.model_validate_json(_DECISION_JSON).model_dump_json())
+        data["tags"]["narrative_labels"] = "discipline"
+        with self.assertRaises(ValidationError):
+            decision_from_stored_json(json.dumps(data))
+
+    def test_unknown_key_falls_back_to_validation(self) -> None:
+        data = json.loads(LLMDecision.model_validate_json(_DECISION_JSON).model_dump_json())
+        data["tags"]["schema_v2_field"] = []
+        with self.assertRaises(ValidationError):
+            decision_from_stored_json(json.dumps(data))
+
+    def test_mistyped_scalar_falls_back_to_validation(self) -> None:
+        data = json.loads(LLMDecision.model_validate_json(_DECISION_JSON).model_dump_json())
+        data["overall_confidence"] = 1.5
+        with self.assertRaises(ValidationError):
+            decision_from_stored_json(json.dumps(data))
+
+
 if __name__ == "__main__":
     unittest.main()
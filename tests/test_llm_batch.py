@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from ig_corpus.config_schema import OpenAIConfig
+from ig_corpus.errors import LLMError
+from ig_corpus.llm import OpenAIPostClassifier, PostForLLM
+from ig_corpus.llm_batch import OpenAIBatchClassifier, parse_batch_output
+
+
+def _decision_json(*, eligible: bool, confidence: float) -> str:
+    return json.dumps(
+        {
+            "eligible": eligible,
+            "eligibility_reasons": ["test"],
+            "language": {"is_english": True, "confidence": 0.95},
+            "topic": {
+                "is_bodyweight_calisthenics": True,
+                "confidence": 0.9,
+                "topic_notes": "Pull-ups.",
+            },
+            "commercial": {"is_exclusively_commercial": False, "signals": []},
+            "caption_quality": {"is_analyzable": True, "issues": []},
+            "tags": {
+                "genre": "training_log",
+                "narrative_labels": [],
+                "discourse_moves": [],
+                "neoliberal_signals": [],
+            },
+            "overall_confidence": confidence,
+        }
+    )
+
+
+def _output_line(custom_id: str, text: str, *, total_tokens: int = 10, status_code: int = 200) -> str:
+    body = {
+        "output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}],
+        "usage": {"total_tokens": total_tokens},
+    }
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": body},
+            "error": None,
+        }
+    )
+
+
+class _FakeFiles:
+    def __init__(self, output_text: str) -> None:
+        self._output_text = output_text
+        self.uploaded: list[bytes] = []
+
+    def create(self, *, file: Any, purpose: str) -> Any:
+        assert purpose == "batch"
+        self.uploaded.append(file[1])
+        return SimpleNamespace(id="file-in")
+
+    def content(self, file_id: str) -> Any:
+        assert file_id == "file-out"
+        return SimpleNamespace(text=self._output_text)
+
+
+class _FakeBatches:
+    def __init__(self, statuses: list[str]) -> None:
+        self._statuses = list(statuses)
+        self.created: list[dict[str, Any]] = []
+
+    def create(self, **kwargs: Any) -> Any:
+        self.created.append(kwargs)
+        return SimpleNamespace(id="batch-1")
+
+    def retrieve(self, batch_id: str) -> Any:
+        status = self._statuses.pop(0)
+        return SimpleNamespace(
+            id=batch_id,
+            status=status,
+            output_file_id="file-out" if status == "completed" else None,
+            request_counts=SimpleNamespace(total=2, completed=2, failed=0),
+        )
+
+
+class _FakeBatchClient:
+    def __init__(self, *, output_text: str, statuses: list[str]) -> None:
+        self.files = _FakeFiles(output_text)
+        self.batches = _FakeBatches(statuses)
+
+
+class _FakeLiveResponses:
+    def __init__(self, texts: list[str]) -> None:
+        self._texts = list(texts)
+        self.calls: list[dict[str, Any]] = []
+
+    def create(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        return SimpleNamespace(output_text=self._texts.pop(0), output=[], usage=None)
+
+
+class _FakeLiveClient:
+    def __init__(self, texts: list[str]) -> None:
+        self.responses = _FakeLiveResponses(texts)
+
+
+class TestParseBatchOutput(unittest.TestCase):
+    def test_skips_errored_and_non_200_lines(self) -> None:
+        text = "\n".join(
+            [
+                _output_line("a", "{}", total_tokens=7),
+                _output_line("b", "{}", status_code=500),
+                json.dumps({"custom_id": "c", "response": None, "error": {"code": "x"}}),
+                "",
+            ]
+        )
+
+        self.assertEqual(parse_batch_output(text), {"a": ("{}", 7)})
+
+
+class TestOpenAIBatchClassifier(unittest.TestCase):
+    def test_classify_many_polls_and_escalates_like_live_calls(self) -> None:
+        cfg = OpenAIConfig(max_output_tokens=99, batch_poll_interval_seconds=5)
+        output = "\n".join(
+            [
+                _output_line("k1", _decision_json(eligible=True, confidence=0.9)),
+                _output_line("k2", _decision_json(eligible=True, confidence=0.1)),
+            ]
+        )
+        batch_client = _FakeBatchClient(output_text=output, statuses=["in_progress", "completed"])
+        live_client = _FakeLiveClient(
+            [
+                _decision_json(eligible=False, confidence=0.95),  # k2 escalation
+                _decision_json(eligible=True, confidence=0.95),  # k3 missing from output
+            ]
+        )
+        live = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=live_client)  # type: ignore[arg-type]
+
+        sleeps: list[float] = []
+        statuses: list[str] = []
+        batch = OpenAIBatchClassifier(
+            "sk-test",
+            openai_cfg=cfg,
+            classifier=live,
+            client=batch_client,
+            sleep_fn=sleeps.append,
+            on_status=lambda _id, status, _counts: statuses.append(status),
+        )
+
+        posts = [
+            ("k1", PostForLLM(url="https://example.com/p/1", caption="one")),
+            ("k2", PostForLLM(url="https://example.com/p/2", caption="two")),
+            ("k3", PostForLLM(url="https://example.com/p/3", caption="three")),
+        ]
+        results = batch.classify_many(posts)
+
+        self.assertEqual(statuses, ["in_progress", "completed"])
+        self.assertEqual(sleeps, [5.0])
+        self.assertEqual(batch_client.batches.created[0]["endpoint"], "/v1/responses")
+
+        lines = [json.loads(ln) for ln in batch_client.files.uploaded[0].decode("utf-8").splitlines()]
+        self.assertEqual([ln["custom_id"] for ln in lines], ["k1", "k2", "k3"])
+        self.assertEqual(lines[0]["body"]["model"], cfg.model_primary)
+        self.assertEqual(lines[0]["body"]["max_output_tokens"], 99)
+
+        self.assertEqual(
+            [model for _, model, _ in results],
+            [cfg.model_primary, cfg.model_escalation, cfg.model_primary],
+        )
+        self.assertEqual([d.eligible for d, _, _ in results], [True, False, True])
+        self.assertEqual(results[0][2], 10)
+        self.assertEqual(
+            [c["model"] for c in live_client.responses.calls],
+            [cfg.model_escalation, cfg.model_primary],
+        )
+
+    def test_classify_many_reuses_and_fills_response_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cfg = OpenAIConfig(model_escalation="", response_cache_path=str(Path(td) / "cache.sqlite"))
+            posts = [
+                ("k1", PostForLLM(url="https://example.com/p/1", caption="one")),
+                ("k2", PostForLLM(url="https://example.com/p/2", caption="two")),
+            ]
+
+            first_client = _FakeBatchClient(
+                output_text=_output_line("k1", _decision_json(eligible=True, confidence=0.9)),
+                statuses=["completed"],
+            )
+            first_live = OpenAIPostClassifier(
+                "sk-test",
+                openai_cfg=cfg,
+                client=_FakeLiveClient([_decision_json(eligible=False, confidence=0.9)]),  # type: ignore[arg-type]
+            )
+            first = OpenAIBatchClassifier(
+                "sk-test", openai_cfg=cfg, classifier=first_live, client=first_client, sleep_fn=lambda _s: None
+            )
+            self.assertEqual([d.eligible for d, _, _ in first.classify_many(posts)], [True, False])
+            first_live.close()
+
+            # A rerun replays both outputs (batch and live) and submits no batch.
+            second_client = _FakeBatchClient(output_text="", statuses=[])
+            second_live = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=_FakeLiveClient([]))  # type: ignore[arg-type]
+            second = OpenAIBatchClassifier(
+                "sk-test", openai_cfg=cfg, classifier=second_live, client=second_client, sleep_fn=lambda _s: None
+            )
+            results = second.classify_many(posts)
+            second_live.close()
+
+        self.assertEqual([(d.eligible, t) for d, _, t in results], [(True, 0), (False, 0)])
+        self.assertEqual(second_client.files.uploaded, [])
+        self.assertEqual(second_client.batches.created, [])
+
+    def test_failed_batch_raises(self) -> None:
+        cfg = OpenAIConfig()
+        live = OpenAIPostClassifier("sk-test", openai_cfg=cfg, client=_FakeLiveClient([]))  # type: ignore[arg-type]
+        batch = OpenAIBatchClassifier(
+            "sk-test",
+            openai_cfg=cfg,
+            classifier=live,
+            client=_FakeBatchClient(output_text="", statuses=["failed"]),
+            sleep_fn=lambda _s: None,
+        )
+
+        with self.assertRaises(LLMError):
+            batch.classify_many([("k1", PostForLLM(url="https://example.com/p/1"))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import unittest
 from typing import Any
 
@@ -15,9 +16,14 @@ from ig_corpus.config_schema import (
     QueryingConfig,
     TargetsConfig,
 )
+from ig_corpus.errors import ApifyError
 from ig_corpus.llm import PostForLLM
 from ig_corpus.llm_schema import LLMDecision
-from ig_corpus.loop import run_feedback_loop
+from ig_corpus.loop import (
+    _extract_hashtag_from_url,
+    _extract_hashtag_search_urls,
+    run_feedback_loop,
+)
 from ig_corpus.storage import SQLiteStateStore
 
 
@@ -139,9 +145,11 @@ class TestFeedbackLoop(unittest.TestCase):
 
         with SQLiteStateStore.open(":memory:") as store:
             result = run_feedback_loop(cfg, secrets, store=store, scraper=scraper, classifier=classifier)
+            untimed = store.conn.execute("SELECT COUNT(1) FROM llm_decisions WHERE latency_ms IS NULL").fetchone()[0]
 
         self.assertEqual(result.status, "completed_pool")
         self.assertEqual(scraper.calls, [["t1"], ["newtag"]])
+        self.assertEqual(untimed, 0)
 
     def test_stagnation_invokes_fallback(self) -> None:
         cfg = AppConfig(
@@ -196,6 +204,222 @@ class TestFeedbackLoop(unittest.TestCase):
         self.assertGreaterEqual(len(fallback.scrape_calls), 1)
         self.assertEqual(classifier.calls, ["https://example.com/p/fb1"])
 
+    def test_prefetch_scrapes_next_batch_during_labeling(self) -> None:
+        cfg = AppConfig(
+            targets=TargetsConfig(final_n=1, pool_n=2, sampling_seed=1),
+            apify=ApifyConfig(
+                token_env="APIFY_TOKEN",
+                primary_actor="apify/instagram-hashtag-scraper",
+                fallback_actor="apify/instagram-scraper",
+                results_type="posts",
+                results_limit_per_query=5,
+                keyword_search=True,
+                run_batch_queries=1,
+            ),
+            openai=OpenAIConfig(max_output_tokens=50),
+            filters=FiltersConfig(min_caption_chars=40, max_posts_per_user=0, allow_reels=True, reject_if_sponsored_true=False),
+            loop=LoopConfig(
+                max_iterations=5,
+                stagnation_window=3,
+                stagnation_min_new_eligible=1,
+                max_raw_items=1000,
+                backoff_seconds=0,
+                prefetch_next_batch=True,
+            ),
+            querying=QueryingConfig(
+                seed_terms=["t1", "t2"],
+                expansion=ExpansionConfig(enabled=False, max_new_terms_per_iter=0),
+            ),
+        )
+
+        secrets = RuntimeSecrets(apify_token="apify", openai_api_key="openai")
+
+        primary_items = {
+            "t1": [{"url": "https://example.com/p/1", "caption": _LONG_CAPTION}],
+            "t2": [{"url": "https://example.com/p/2", "caption": _LONG_CAPTION}],
+        }
+
+        second_scrape_started = threading.Event()
+
+        class _SignallingScraper(_FakePrimaryScraper):
+            def run_and_fetch(self, terms: Any, **kwargs: Any) -> Any:
+                out = super().run_and_fetch(terms, **kwargs)
+                if list(terms) == ["t2"]:
+                    second_scrape_started.set()
+                return out
+
+        class _WaitingClassifier(_FakeClassifier):
+            def classify_with_metadata(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
+                # The first label only proceeds once the next scrape is already running.
+                if not self.calls and not second_scrape_started.wait(timeout=5):
+                    raise AssertionError("next batch was not prefetched")
+                return super().classify_with_metadata(post)
+
+        scraper = _SignallingScraper(primary_items)
+        classifier = _WaitingClassifier([True, True])
+
+        with SQLiteStateStore.open(":memory:") as store:
+            result = run_feedback_loop(cfg, secrets, store=store, scraper=scraper, classifier=classifier)
+
+        self.assertEqual(result.status, "completed_pool")
+        self.assertEqual(scraper.calls, [["t1"], ["t2"]])
+        self.assertEqual(classifier.calls, ["https://example.com/p/1", "https://example.com/p/2"])
+
+    def test_batch_jobs_are_sized_to_remaining_pool_need(self) -> None:
+        cfg = AppConfig(
+            targets=TargetsConfig(final_n=1, pool_n=2, sampling_seed=1),
+            apify=ApifyConfig(run_batch_queries=1, results_limit_per_query=50),
+            openai=OpenAIConfig(max_output_tokens=50),
+            filters=FiltersConfig(min_caption_chars=40, max_posts_per_user=0, allow_reels=True, reject_if_sponsored_true=False),
+            loop=LoopConfig(max_iterations=5, max_raw_items=1000, backoff_seconds=0),
+            querying=QueryingConfig(
+                seed_terms=["t1"],
+                expansion=ExpansionConfig(enabled=False, max_new_terms_per_iter=0),
+            ),
+        )
+        secrets = RuntimeSecrets(apify_token="apify", openai_api_key="openai")
+        items = [{"url": f"https://example.com/p/{i}", "caption": _LONG_CAPTION} for i in range(30)]
+
+        class _FakeBatchClassifier:
+            def __init__(self) -> None:
+                self.sizes: list[int] = []
+                self._eligible = [True] + [False] * 7 + [False, False, False, True]
+
+            def classify_many(self, posts: Any) -> list[tuple[LLMDecision, str, int | None]]:
+                self.sizes.append(len(posts))
+                return [(_decision(eligible=self._eligible.pop(0)), "gpt-5-nano", 1) for _ in posts]
+
+        batch = _FakeBatchClassifier()
+        with SQLiteStateStore.open(":memory:") as store:
+            result = run_feedback_loop(
+                cfg,
+                secrets,
+                store=store,
+                scraper=_FakePrimaryScraper({"t1": items}),
+                classifier=_FakeClassifier([]),
+                batch_classifier=batch,  # type: ignore[arg-type]
+            )
+
+        self.assertEqual(result.status, "completed_pool")
+        # 2 posts needed -> 8 candidates; after one eligible, 1 needed -> 4 candidates.
+        self.assertEqual(batch.sizes, [8, 4])
+        self.assertEqual(result.decisions, 12)
+
+    def _prefetch_config(self, *, pool_n: int, max_raw_items: int) -> AppConfig:
+        return AppConfig(
+            targets=TargetsConfig(final_n=1, pool_n=pool_n, sampling_seed=1),
+            apify=ApifyConfig(run_batch_queries=1, results_limit_per_query=5),
+            openai=OpenAIConfig(max_output_tokens=50),
+            filters=FiltersConfig(min_caption_chars=40, max_posts_per_user=0, allow_reels=True, reject_if_sponsored_true=False),
+            loop=LoopConfig(max_iterations=5, max_raw_items=max_raw_items, backoff_seconds=0, prefetch_next_batch=True),
+            querying=QueryingConfig(
+                seed_terms=["t1", "t2"],
+                expansion=ExpansionConfig(enabled=False, max_new_terms_per_iter=0),
+            ),
+        )
+
+    def test_skips_prefetch_when_batch_can_fill_pool(self) -> None:
+        cfg = self._prefetch_config(pool_n=1, max_raw_items=1000)
+        secrets = RuntimeSecrets(apify_token="apify", openai_api_key="openai")
+        scraper = _FakePrimaryScraper({"t1": [{"url": "https://example.com/p/1", "caption": _LONG_CAPTION}]})
+
+        with SQLiteStateStore.open(":memory:") as store:
+            result = run_feedback_loop(cfg, secrets, store=store, scraper=scraper, classifier=_FakeClassifier([True]))
+
+        self.assertEqual(result.status, "completed_pool")
+        self.assertEqual(scraper.calls, [["t1"]])
+
+    def test_stopping_aborts_in_flight_prefetch(self) -> None:
+        # max_raw_items stops the loop after the first batch, while the prefetch is running.
+        cfg = self._prefetch_config(pool_n=5, max_raw_items=1)
+        secrets = RuntimeSecrets(apify_token="apify", openai_api_key="openai")
+        prefetch_started = threading.Event()
+        aborted = threading.Event()
+        woke_by_abort: list[bool] = []
+
+        class _AbortableScraper(_FakePrimaryScraper):
+            def run_and_fetch(self, terms: Any, **kwargs: Any) -> Any:
+                if list(terms) == ["t2"]:
+                    prefetch_started.set()
+                    # Stands in for a long Actor run; only an abort ends it early.
+                    woke_by_abort.append(aborted.wait(timeout=30))
+                    raise ApifyError("aborted")
+                return super().run_and_fetch(terms, **kwargs)
+
+            def abort_active_runs(self) -> list[str]:
+                aborted.set()
+                return ["run_t2"]
+
+        class _WaitingClassifier(_FakeClassifier):
+            def classify_with_metadata(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
+                prefetch_started.wait(timeout=30)
+                return super().classify_with_metadata(post)
+
+        scraper = _AbortableScraper({"t1": [{"url": "https://example.com/p/1", "caption": _LONG_CAPTION}]})
+
+        with SQLiteStateStore.open(":memory:") as store:
+            result = run_feedback_loop(cfg, secrets, store=store, scraper=scraper, classifier=_WaitingClassifier([True]))
+
+        self.assertEqual(result.status, "max_raw_items")
+        self.assertTrue(aborted.is_set())
+        self.assertEqual(woke_by_abort, [True])
+
+    def test_does_not_wait_for_prefetch_that_cannot_be_aborted(self) -> None:
+        cfg = self._prefetch_config(pool_n=5, max_raw_items=1)
+        secrets = RuntimeSecrets(apify_token="apify", openai_api_key="openai")
+        prefetch_started = threading.Event()
+        release = threading.Event()
+
+        class _BlockingScraper(_FakePrimaryScraper):
+            def run_and_fetch(self, terms: Any, **kwargs: Any) -> Any:
+                if list(terms) == ["t2"]:
+                    prefetch_started.set()
+                    release.wait(timeout=30)
+                return super().run_and_fetch(terms, **kwargs)
+
+        class _WaitingClassifier(_FakeClassifier):
+            def classify_with_metadata(self, post: PostForLLM) -> tuple[LLMDecision, str, int | None]:
+                prefetch_started.wait(timeout=30)
+                return super().classify_with_metadata(post)
+
+        scraper = _BlockingScraper({"t1": [{"url": "https://example.com/p/1", "caption": _LONG_CAPTION}]})
+
+        try:
+            with SQLiteStateStore.open(":memory:") as store:
+                result = run_feedback_loop(cfg, secrets, store=store, scraper=scraper, classifier=_WaitingClassifier([True]))
+            # The loop returned while the un-abortable run was still blocked.
+            self.assertFalse(release.is_set())
+        finally:
+            release.set()
+
+        self.assertEqual(result.status, "max_raw_items")
+
+
+class TestHashtagSearchUrls(unittest.TestCase):
+    def test_extracts_tag_from_explore_path_only(self) -> None:
+        self.assertEqual(
+            _extract_hashtag_from_url("https://www.instagram.com/explore/tags/pullups/?hl=en"),
+            "pullups",
+        )
+        self.assertEqual(_extract_hashtag_from_url("instagram.com/explore//tags/dips"), "dips")
+        self.assertIsNone(_extract_hashtag_from_url("https://instagram.com/explore/tags/"))
+        self.assertIsNone(_extract_hashtag_from_url("https://instagram.com/p/x?next=/explore/tags/y"))
+
+    def test_collects_urls_with_casefold_dedupe_keeping_first_spelling(self) -> None:
+        items = [
+            {
+                "url": " https://instagram.com/explore/tags/A/ ",
+                "urls": ["https://instagram.com/explore/tags/b/"],
+            },
+            {"pageUrl": "HTTPS://INSTAGRAM.COM/EXPLORE/TAGS/A/", "urls": "not-a-list"},
+            {"tagUrl": "", "hashtag_url": 5},
+        ]
+
+        self.assertEqual(
+            _extract_hashtag_search_urls(items),
+            ["https://instagram.com/explore/tags/A/", "https://instagram.com/explore/tags/b/"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import unittest
+
+from ig_corpus.rate_limit import RateLimiter
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_requests_per_minute_spaces_out_calls_after_burst(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(requests_per_minute=2, clock=clock, sleep_fn=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+        limiter.acquire()
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 30.0)
+
+    def test_tokens_per_minute_waits_and_refund_restores_budget(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(tokens_per_minute=600, clock=clock, sleep_fn=clock.sleep)
+
+        limiter.acquire(500)
+        limiter.refund(400)
+        limiter.acquire(500)
+        self.assertEqual(clock.sleeps, [])
+
+        limiter.acquire(100)
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 10.0)
+
+    def test_oversized_request_is_clamped_to_budget(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(tokens_per_minute=100, clock=clock, sleep_fn=clock.sleep)
+
+        limiter.acquire(10_000)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_rejects_non_positive_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            RateLimiter(requests_per_minute=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(tokens_per_minute=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
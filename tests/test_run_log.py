@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ig_corpus.run_log import RunLogger
+
+
+def _events(path: Path) -> list[str]:
+    out: list[str] = []
+    for ln in path.read_text(encoding="utf-8").splitlines():
+        if ln.strip():
+            out.append(json.loads(ln)["event"])
+    return out
+
+
+class TestRunLogger(unittest.TestCase):
+    def test_info_is_buffered_until_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "run.log"
+
+            with RunLogger.open(path, flush_interval_s=3600) as log:
+                log.info("first")
+                self.assertEqual(_events(path), [])
+
+                log.flush()
+                self.assertEqual(_events(path), ["first"])
+
+                log.info("second")
+
+            self.assertEqual(_events(path), ["first", "second"])
+
+    def test_buffered_info_is_flushed_without_a_later_write(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "run.log"
+
+            with RunLogger.open(path, flush_interval_s=0.05) as log:
+                log.info("first")
+                log.info("before_blocking_call")
+
+                # Nothing else is logged, as while waiting on an Actor run.
+                for _ in range(100):
+                    if _events(path):
+                        break
+                    time.sleep(0.02)
+                self.assertEqual(_events(path), ["first", "before_blocking_call"])
+
+    def test_warnings_and_errors_flush_immediately(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "run.log"
+
+            with RunLogger.open(path, flush_interval_s=3600) as log:
+                log.info("queued")
+                log.warning("warned")
+                self.assertEqual(_events(path), ["queued", "warned"])
+
+                log.exception("failed", exc=RuntimeError("boom"))
+                self.assertEqual(_events(path), ["queued", "warned", "failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
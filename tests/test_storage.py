@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
 from typing import Any
+from unittest import mock
 
 from ig_corpus.llm_schema import LLMDecision
-from ig_corpus.storage import SQLiteStateStore
+from ig_corpus import storage_schema
+from ig_corpus.errors import StorageError
+from ig_corpus.storage import DecisionWrite, RawPostWrite, SQLiteStateStore
 
 
 def _decision(*, eligible: bool, confidence: float = 0.9) -> LLMDecision:
@@ -127,6 +131,138 @@ class TestSQLiteStateStore(unittest.TestCase):
                         decision=_decision(eligible=True),
                     )
 
+    def test_batch_writes_are_atomic(self) -> None:
+        with SQLiteStateStore.open(":memory:") as store:
+            written = store.upsert_raw_posts(
+                RawPostWrite(post_key=f"id:{i}", url=f"https://example.com/p/{i}", raw_item={"i": i})
+                for i in range(3)
+            )
+            self.assertEqual(written, 3)
+            self.assertEqual(store.raw_post_count(), 3)
+
+            rows = [
+                DecisionWrite(
+                    post_key=f"id:{i}",
+                    url=f"https://example.com/p/{i}",
+                    model="gpt-5-nano",
+                    decision=_decision(eligible=True),
+                )
+                for i in range(3)
+            ]
+            self.assertEqual(store.record_llm_decisions(rows), 3)
+            self.assertEqual(store.decision_count(), 3)
+
+            bad = rows[:1] + [
+                DecisionWrite(
+                    post_key="id:missing",
+                    url="https://example.com/p/missing",
+                    model="gpt-5-nano",
+                    decision=_decision(eligible=True),
+                )
+            ]
+            with self.assertRaises(StorageError):
+                store.record_llm_decisions(bad)
+            self.assertEqual(store.decision_count(), 3)
+            self.assertEqual(store.record_llm_decisions([]), 0)
+
+    def test_records_decision_latency(self) -> None:
+        with SQLiteStateStore.open(":memory:") as store:
+            store.upsert_raw_post(post_key="id:1", url="https://example.com/p/1", raw_item={})
+            store.record_llm_decision(
+                post_key="id:1",
+                url="https://example.com/p/1",
+                model="gpt-5-nano",
+                decision=_decision(eligible=True),
+                latency_ms=1234,
+            )
+            store.record_llm_decision(
+                post_key="id:1",
+                url="https://example.com/p/1",
+                model="gpt-5-nano",
+                decision=_decision(eligible=True),
+            )
+
+            latencies = [r[0] for r in store.conn.execute("SELECT latency_ms FROM llm_decisions ORDER BY id")]
+            self.assertEqual(latencies, [1234, None])
+
+    def test_v3_migration_upgrades_v2_db_and_indexes_pool_order(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "state.sqlite"
+
+            conn = sqlite3.connect(db_path)
+            with mock.patch.object(storage_schema, "SCHEMA_VERSION", 2):
+                storage_schema.initialize_sqlite(conn)
+            conn.close()
+
+            with SQLiteStateStore.open(db_path) as store:
+                version = store.conn.execute("SELECT MAX(version) FROM schema_migrations").fetchone()[0]
+                self.assertEqual(int(version), storage_schema.SCHEMA_VERSION)
+
+                plan = " ".join(
+                    str(r[3])
+                    for r in store.conn.execute(
+                        """
+                        EXPLAIN QUERY PLAN
+                        SELECT p.post_key
+                        FROM raw_posts p
+                        JOIN latest_llm_decisions d ON d.post_key = p.post_key
+                        WHERE d.eligible = 1
+                        ORDER BY d.created_at ASC, d.post_key ASC
+                        LIMIT 10
+                        """
+                    )
+                )
+                self.assertIn("idx_llm_decisions_eligible_created", plan)
+                self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_v4_migration_backfills_hashtags_and_owner_keys(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "state.sqlite"
+
+            conn = sqlite3.connect(db_path)
+            with mock.patch.object(storage_schema, "SCHEMA_VERSION", 3):
+                storage_schema.initialize_sqlite(conn)
+            with conn:
+                conn.execute(
+                    "INSERT INTO raw_posts(post_key, url, actor_source, raw_json, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        "id:1",
+                        "https://example.com/p/1",
+                        None,
+                        '{"hashtags":["#Pullups","pullups","dips"],"ownerUsername":"Alice"}',
+                        "2025-01-01T00:00:00+00:00",
+                    ),
+                )
+            conn.close()
+
+            with SQLiteStateStore.open(db_path) as store:
+                owner = store.conn.execute("SELECT owner_key FROM raw_posts").fetchone()[0]
+                tags = {r[0] for r in store.conn.execute("SELECT hashtag FROM raw_post_hashtags")}
+                self.assertEqual(owner, "user:alice")
+                self.assertEqual(tags, {"Pullups", "dips"})
+
+                # Re-upserting replaces the derived rows along with raw_json.
+                store.upsert_raw_post(
+                    post_key="id:1",
+                    url="https://example.com/p/1",
+                    raw_item={"hashtags": ["muscleup"], "ownerId": 42},
+                )
+                owner = store.conn.execute("SELECT owner_key FROM raw_posts").fetchone()[0]
+                tags = {r[0] for r in store.conn.execute("SELECT hashtag FROM raw_post_hashtags")}
+                self.assertEqual(owner, "user_id:42")
+                self.assertEqual(tags, {"muscleup"})
+
+    def test_read_snapshot_opens_and_releases_transaction(self) -> None:
+        with SQLiteStateStore.open(":memory:") as store:
+            self.assertFalse(store.conn.in_transaction)
+            with store.read_snapshot() as conn:
+                self.assertTrue(conn.in_transaction)
+                with store.read_snapshot():
+                    self.assertTrue(conn.in_transaction)
+                self.assertTrue(conn.in_transaction)
+            self.assertFalse(store.conn.in_transaction)
+
 
 if __name__ == "__main__":
     unittest.main()